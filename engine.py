@@ -81,37 +81,43 @@ class MontageEngine:
             if not file_path.is_file():
                 continue
             
-            # Определяем тип файла
-            if FileUtils.is_image(file_path):
+            # Определяем тип файла (одно вычисление расширения)
+            kind = FileUtils.classify(file_path)
+            if kind == 'image':
                 images += 1
                 number = FileUtils.get_file_number(file_path)
                 if number:
                     media_files[number] = {'type': 'image', 'path': file_path}
-            elif include_videos and FileUtils.is_video(file_path):
+            elif include_videos and kind == 'video':
                 videos += 1
                 number = FileUtils.get_file_number(file_path)
                 if number:
                     media_files[number] = {'type': 'video', 'path': file_path}
-            elif FileUtils.is_audio(file_path):
+            elif kind == 'audio':
                 audio += 1
                 number = FileUtils.get_file_number(file_path)
                 if number:
                     audio_files[number] = file_path
         
         # Создаем пары
+        pairs = [
+            MediaPair(
+                number=number,
+                media_type=media_files[number]['type'],
+                media_file=media_files[number]['path'],
+                audio_file=audio_files[number]
+            )
+            for number in sorted(media_files.keys())
+            if number in audio_files
+        ]
+        
+        # Проверяем все пары разом (один листинг на каталог)
         self.media_pairs = []
-        for number in sorted(media_files.keys()):
-            if number in audio_files:
-                pair = MediaPair(
-                    number=number,
-                    media_type=media_files[number]['type'],
-                    media_file=media_files[number]['path'],
-                    audio_file=audio_files[number]
-                )
-                if pair.validate():
-                    self.media_pairs.append(pair)
-                else:
-                    logger.warning(f"Пара {number} не прошла валидацию")
+        for pair, valid in zip(pairs, MediaPair.validate_many(pairs)):
+            if valid:
+                self.media_pairs.append(pair)
+            else:
+                logger.warning(f"Пара {pair.number} не прошла валидацию")
         
         result = {
             'images': images,
@@ -190,11 +196,15 @@ class MontageEngine:
         # Генерация эффектов для каждого клипа
         effects_manager = EffectsManager(channel.effects)
         
+        # Аудио файлы всех пар; длительности пробуем параллельно одним пакетом
+        audio_files = [self._get_audio_variant(pair, channel.effects) for pair in pairs_to_use]
+        FFmpegUtils.get_media_info_batch([str(path) for path in audio_files if path], minimal=True)
+        
         for i, pair in enumerate(pairs_to_use):
             logger.info(f"Обработка пары {i+1}/{len(pairs_to_use)}: {pair.number}")
             
             # Получаем аудио файл
-            audio_file = self._get_audio_variant(pair, channel.effects)
+            audio_file = audio_files[i]
             if not audio_file:
                 logger.error(f"Не найден аудио файл для пары {pair.number}")
                 continue
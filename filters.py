@@ -69,7 +69,7 @@ class FilterGenerator:
         # Функция плавности
         easing_expr = self.get_easing_expression(easing, "on", str(total_frames))
         
-        if effect == KenBurnsEffect.ZOOM_IN.value:
+        if effect == KenBurnsEffect.ZOOM_IN:
             start_scale = 1.0 + intensity_factor * 0.3
             end_scale = 1.0
             scale_expr = f"{start_scale}-({start_scale}-{end_scale})*{easing_expr}"
@@ -85,7 +85,7 @@ class FilterGenerator:
             
             return ",".join(filter_parts)
         
-        elif effect == KenBurnsEffect.ZOOM_OUT.value:
+        elif effect == KenBurnsEffect.ZOOM_OUT:
             start_scale = 1.0
             end_scale = 1.0 + intensity_factor * 0.3
             scale_expr = f"{start_scale}+({end_scale}-{start_scale})*{easing_expr}"
@@ -100,7 +100,7 @@ class FilterGenerator:
             
             return ",".join(filter_parts)
         
-        elif effect == KenBurnsEffect.PAN_LEFT.value:
+        elif effect == KenBurnsEffect.PAN_LEFT:
             zoom = 1.2 + intensity_factor * 0.2
             pan_distance = intensity_factor * 0.3
             x_expr = f"(iw-ow)*{pan_distance}*(1-{easing_expr})"
@@ -109,7 +109,7 @@ class FilterGenerator:
                    f"zoompan=z='{zoom}':d={total_frames}:x='{x_expr}':y='(ih-oh)/2':"
                    f"s={w}x{h}:fps={fps}")
         
-        elif effect == KenBurnsEffect.PAN_RIGHT.value:
+        elif effect == KenBurnsEffect.PAN_RIGHT:
             zoom = 1.2 + intensity_factor * 0.2
             pan_distance = intensity_factor * 0.3
             x_expr = f"(iw-ow)*{pan_distance}*{easing_expr}"
@@ -118,7 +118,7 @@ class FilterGenerator:
                    f"zoompan=z='{zoom}':d={total_frames}:x='{x_expr}':y='(ih-oh)/2':"
                    f"s={w}x{h}:fps={fps}")
         
-        elif effect == KenBurnsEffect.ROTATE.value:
+        elif effect == KenBurnsEffect.ROTATE:
             angle = intensity_factor * 15  # До 15 градусов
             rotate_expr = f"{angle}*sin(2*PI*{easing_expr})"
             zoom = 1.3  # Увеличиваем для компенсации поворота
@@ -134,7 +134,7 @@ class FilterGenerator:
                        f"zoompan=z='{zoom}':d={total_frames}:x='(iw-ow)/2':y='(ih-oh)/2':"
                        f"s={w}x{h}:fps={fps}")
         
-        elif effect == KenBurnsEffect.DIAGONAL.value:
+        elif effect == KenBurnsEffect.DIAGONAL:
             zoom = 1.3 + intensity_factor * 0.2
             pan_amount = intensity_factor * 0.2
             x_expr = f"(iw-ow)*{pan_amount}*{easing_expr}"
@@ -144,7 +144,7 @@ class FilterGenerator:
                    f"zoompan=z='{zoom}':d={total_frames}:x='{x_expr}':y='{y_expr}':"
                    f"s={w}x{h}:fps={fps}")
         
-        elif effect == KenBurnsEffect.ZOOM_ROTATE.value:
+        elif effect == KenBurnsEffect.ZOOM_ROTATE:
             # Комбинация зума и вращения
             start_scale = 1.0
             end_scale = 1.0 + intensity_factor * 0.3
@@ -162,7 +162,7 @@ class FilterGenerator:
             
             return ",".join(filter_parts)
         
-        elif effect == KenBurnsEffect.PARALLAX.value:
+        elif effect == KenBurnsEffect.PARALLAX:
             # Эффект параллакса через многослойное движение
             zoom = 1.4
             x_expr = f"(iw-ow)/2+sin(2*PI*{easing_expr})*{intensity_factor*50}"
@@ -178,7 +178,7 @@ class FilterGenerator:
                               clip_index: int = 0) -> str:
         """Генерирует CapCut-style эффекты"""
         
-        if effect == CapCutEffect.ZOOM_BURST.value:
+        if effect == CapCutEffect.ZOOM_BURST:
             # Резкий зум с затуханием
             start_scale = settings.zoom_burst_start / 100.0
             decay_time = settings.zoom_burst_decay / 100.0 * duration
@@ -188,7 +188,7 @@ class FilterGenerator:
             
             return f"scale=w='iw*({scale_expr})':h='ih*({scale_expr})':eval=frame:flags=lanczos"
         
-        elif effect == CapCutEffect.PULSE.value:
+        elif effect == CapCutEffect.PULSE:
             # Пульсация
             amplitude = settings.scale_amplitude / 100.0 * 0.1
             frequency = 2.5  # Пульсаций за клип
@@ -197,7 +197,7 @@ class FilterGenerator:
             
             return f"scale=w='iw*({scale_expr})':h='ih*({scale_expr})':eval=frame:flags=lanczos"
         
-        elif effect == CapCutEffect.BOUNCE.value:
+        elif effect == CapCutEffect.BOUNCE:
             # Эффект отскока
             amplitude = settings.scale_amplitude / 100.0 * 0.15
             
@@ -206,7 +206,7 @@ class FilterGenerator:
             
             return f"scale=w='iw*({scale_expr})':h='ih*({scale_expr})':eval=frame:flags=lanczos"
         
-        elif effect == CapCutEffect.SHAKE.value:
+        elif effect == CapCutEffect.SHAKE:
             # Тряска камеры
             intensity = settings.motion_intensity / 100.0 * 10
             
@@ -216,7 +216,7 @@ class FilterGenerator:
             
             return f"crop=w=iw-{intensity*2}:h=ih-{intensity*2}:x='{intensity}+{x_shake}':y='{intensity}+{y_shake}':eval=frame"
         
-        elif effect == CapCutEffect.GLITCH.value:
+        elif effect == CapCutEffect.GLITCH:
             # Цифровой глитч - безопасная версия
             intensity = settings.motion_intensity / 100.0
             
@@ -229,7 +229,7 @@ class FilterGenerator:
                 # Простой fallback
                 return f"eq=brightness={1+intensity*0.1}*sin(t*20):eval=frame"
         
-        elif effect == CapCutEffect.CHROMATIC.value:
+        elif effect == CapCutEffect.CHROMATIC:
             # Хроматическая аберрация через разделение каналов
             intensity = settings.motion_intensity / 100.0 * 5
             
@@ -246,7 +246,7 @@ class FilterGenerator:
                 # Простая альтернатива
                 return f"eq=saturation=1+{intensity*0.1}*sin(t*5):eval=frame"
         
-        elif effect == CapCutEffect.ZOOM_BLUR.value:
+        elif effect == CapCutEffect.ZOOM_BLUR:
             # Радиальное размытие при зуме
             intensity = settings.motion_intensity / 100.0
             
@@ -259,7 +259,7 @@ class FilterGenerator:
             else:
                 return f"scale=w='iw*({zoom_expr})':h='ih*({zoom_expr})':eval=frame"
         
-        elif effect == CapCutEffect.WOBBLE.value:
+        elif effect == CapCutEffect.WOBBLE:
             # Покачивание
             amplitude = settings.motion_intensity / 100.0 * 0.05
             
@@ -267,7 +267,7 @@ class FilterGenerator:
             
             return f"scale=w='iw*({wobble_expr})':h='ih':eval=frame"
         
-        elif effect == CapCutEffect.SPIN.value:
+        elif effect == CapCutEffect.SPIN:
             # Вращение
             if self.available_filters.get('rotate', True):
                 speed = settings.motion_intensity / 100.0 * 360  # градусов за секунду
@@ -280,14 +280,14 @@ class FilterGenerator:
     def generate_transition_filter(self, transition_type: str, duration: float = 1.0) -> Dict[str, str]:
         """Генерирует параметры для переходов между клипами"""
         
-        if transition_type == TransitionType.FADE.value:
+        if transition_type == TransitionType.FADE:
             return {
                 "name": "fade",
                 "duration": duration,
                 "filter": f"fade=t=out:st=0:d={duration}:alpha=1"
             }
         
-        elif transition_type == TransitionType.DISSOLVE.value:
+        elif transition_type == TransitionType.DISSOLVE:
             if self.available_filters.get('xfade', False):
                 return {
                     "name": "xfade",
@@ -298,7 +298,7 @@ class FilterGenerator:
                 # Fallback на fade
                 return self.generate_transition_filter("fade", duration)
         
-        elif transition_type == TransitionType.WIPE.value:
+        elif transition_type == TransitionType.WIPE:
             if self.available_filters.get('xfade', False):
                 return {
                     "name": "xfade",
@@ -308,7 +308,7 @@ class FilterGenerator:
             else:
                 return self.generate_transition_filter("fade", duration)
         
-        elif transition_type == TransitionType.SLIDE.value:
+        elif transition_type == TransitionType.SLIDE:
             if self.available_filters.get('xfade', False):
                 return {
                     "name": "xfade",
@@ -318,7 +318,7 @@ class FilterGenerator:
             else:
                 return self.generate_transition_filter("fade", duration)
         
-        elif transition_type == TransitionType.ZOOM.value:
+        elif transition_type == TransitionType.ZOOM:
             if self.available_filters.get('xfade', False):
                 return {
                     "name": "xfade", 
@@ -328,7 +328,7 @@ class FilterGenerator:
             else:
                 return self.generate_transition_filter("fade", duration)
         
-        elif transition_type == TransitionType.BLUR.value:
+        elif transition_type == TransitionType.BLUR:
             if self.available_filters.get('xfade', False):
                 return {
                     "name": "xfade",
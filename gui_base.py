@@ -5,7 +5,7 @@
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
 
 try:
@@ -119,7 +119,7 @@ class StyleManager:
             background-color: #e53935;
         }
         
-        QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox {
+        QLineEdit, QTextEdit, QLabel#projectInfo, QSpinBox, QDoubleSpinBox {
             background-color: #2d2d2d;
             color: #e0e0e0;
             border: 1px solid #444;
@@ -314,6 +314,16 @@ class StyleManager:
         QMessageBox QPushButton {
             min-width: 80px;
         }
+        
+        #header {
+            background-color: #0d0d0d;
+            border-bottom: 2px solid #00d4aa;
+        }
+        
+        QListView#channelList {
+            background: transparent;
+            border: none;
+        }
         """
     
     @staticmethod
@@ -470,6 +480,8 @@ class FilePathSelector(QWidget):
 class CollapsibleGroupBox(QGroupBox):
     """Сворачиваемый GroupBox"""
     
+    content_built = Signal()
+    
     def __init__(self, title: str = "", parent=None):
         super().__init__(title, parent)
         self.setCheckable(True)
@@ -478,12 +490,37 @@ class CollapsibleGroupBox(QGroupBox):
         # Сохраняем оригинальную высоту
         self.expanded_height = None
         
+        # Отложенное создание содержимого
+        self._content_factory: Optional[Callable] = None
+        
         self.toggled.connect(self._on_toggled)
     
+    def setContentFactory(self, build_fn: Callable):
+        """Откладывает создание содержимого до первого разворачивания"""
+        self._content_factory = build_fn
+        self.setChecked(False)
+    
+    def ensureBuilt(self):
+        """Создает содержимое, если оно еще не создано"""
+        if self._content_factory is None:
+            return
+        
+        build_fn, self._content_factory = self._content_factory, None
+        build_fn(self.layout())
+        self.content_built.emit()
+    
+    def isBuilt(self) -> bool:
+        """Проверяет, создано ли содержимое"""
+        return self._content_factory is None
+    
     def _on_toggled(self, checked: bool):
         if checked:
             # Разворачиваем
-            if self.expanded_height:
+            if not self.isBuilt():
+                self.ensureBuilt()
+                self.expanded_height = None
+                self.setMaximumHeight(16777215)
+            elif self.expanded_height:
                 self.setMaximumHeight(self.expanded_height)
         else:
             # Сворачиваем
@@ -597,6 +634,19 @@ class LogWidget(QTextEdit):
         """Очищает лог"""
         self.clear()
 
+# ==================== ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ====================
+
+def select_combo_data(combo: QComboBox, value: Any, default: Any = None):
+    """Выбирает элемент комбобокса по данным (индекс кэшируется на комбобоксе)"""
+    # Индекс строится один раз: комбобоксы с данными не меняются после заполнения
+    data_index = getattr(combo, '_data_index', None)
+    if data_index is None:
+        data_index = combo._data_index = {combo.itemData(i): i for i in range(combo.count())}
+    
+    index = data_index.get(value, data_index.get(default, -1))
+    if index >= 0:
+        combo.setCurrentIndex(index)
+
 # ==================== ДИАЛОГИ ====================
 
 class AboutDialog(QDialog):
@@ -4,8 +4,14 @@
 Вкладки интерфейса для Auto Montage Builder Pro
 """
 
+import os
 import time
 import logging
+import operator
+import contextlib
+import copy
+from functools import partial
+from dataclasses import replace
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 
@@ -13,13 +19,20 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from models import (
-    Channel, EffectSettings, ExportSettings, OverlaySettings,
-    KenBurnsEffect, CapCutEffect, TransitionType
+    Channel, ChannelsDelta, EffectSettings, ExportSettings, OverlaySettings,
+    KenBurnsEffect, CapCutEffect, TransitionType,
+    DataManager, ChannelFactory
 )
+from utils import FFmpegUtils, json_dumps, json_loads, write_file_atomic
 from gui_base import (
     BaseWidget, EffectCheckBox, SliderWithLabel, 
-    FilePathSelector, CollapsibleGroupBox, LogWidget
+    FilePathSelector, CollapsibleGroupBox, LogWidget, select_combo_data
 )
 from gui_widgets import (
     ProjectInfoPanel, ChannelSelectionPanel, ChannelDialog
@@ -27,6 +40,243 @@ from gui_widgets import (
 
 logger = logging.getLogger(__name__)
 
+# ==================== СЕРИАЛИЗАЦИЯ ====================
+
+# Файлы больше этого размера разбираются потоково (если доступен ijson)
+_STREAM_IMPORT_THRESHOLD = 256 * 1024
+
+def _read_settings_file(file_path: str) -> dict:
+    """Читает JSON настроек; большие файлы разбираются инкрементально"""
+    if ijson is None or os.path.getsize(file_path) <= _STREAM_IMPORT_THRESHOLD:
+        settings = json_loads(Path(file_path).read_bytes())
+        if not isinstance(settings, dict):
+            raise ValueError("Неверный формат файла настроек")
+        return settings
+    
+    with open(file_path, 'rb') as f:
+        # kvitems молча пропускает все, кроме объекта верхнего уровня
+        _, event, _ = next(ijson.parse(f), (None, None, None))
+        if event != 'start_map':
+            raise ValueError("Неверный формат файла настроек")
+        f.seek(0)
+        return dict(ijson.kvitems(f, '', use_float=True))
+
+# ==================== СПРАВОЧНИКИ ====================
+
+# Эталонные настройки эффектов для сброса (не изменять!)
+_DEFAULT_EFFECTS = EffectSettings()
+
+# Списочные поля EffectSettings (порядок элементов не важен)
+_EFFECT_LIST_FIELDS = ("ken_burns", "transitions", "capcut_effects", "motion_effects")
+
+def _default_effects() -> EffectSettings:
+    """Возвращает новые настройки эффектов по умолчанию"""
+    fresh = copy.copy(_DEFAULT_EFFECTS)
+    fresh.ken_burns = list(_DEFAULT_EFFECTS.ken_burns)
+    fresh.transitions = list(_DEFAULT_EFFECTS.transitions)
+    fresh.capcut_effects = list(_DEFAULT_EFFECTS.capcut_effects)
+    fresh.motion_effects = list(_DEFAULT_EFFECTS.motion_effects)
+    return fresh
+
+def _effects_equal(a: EffectSettings, b: EffectSettings) -> bool:
+    """Сравнивает настройки эффектов без учета порядка в списках"""
+    if a == b:
+        return True
+    for name in _EFFECT_LIST_FIELDS:
+        if set(getattr(a, name)) != set(getattr(b, name)):
+            return False
+    # Списки совпадают как множества - сравниваем остальные поля
+    empty = dict.fromkeys(_EFFECT_LIST_FIELDS, ())
+    return replace(a, **empty) == replace(b, **empty)
+
+_AUDIO_PITCHES = (
+    "-3", "-2.5", "-2", "-1.5", "-1", "-0.5", "0",
+    "+0.5", "+1", "+1.5", "+2", "+2.5", "+3"
+)
+
+_AUDIO_EFFECTS = (
+    "none", "bass", "reverb", "echo", "chorus", "telephone",
+    "underwater", "radio", "vintage", "distortion", "robot"
+)
+
+_COLOR_FILTERS = (
+    "none", "warm", "cold", "vintage", "blackwhite", "sepia",
+    "cinematic", "vibrant", "faded", "instagram", "film"
+)
+
+_BLEND_MODES = (
+    ("normal", "Обычный"),
+    ("screen", "Экран"),
+    ("overlay", "Перекрытие"),
+    ("multiply", "Умножение"),
+    ("add", "Сложение"),
+    ("lighten", "Осветление"),
+    ("darken", "Затемнение")
+)
+
+_POSITIONS = (
+    ("center", "По центру"),
+    ("top-left", "Сверху слева"),
+    ("top-right", "Сверху справа"),
+    ("bottom-left", "Снизу слева"),
+    ("bottom-right", "Снизу справа")
+)
+
+_ANIMATION_TYPES = (
+    ("fade", "Затухание"),
+    ("slide", "Сдвиг"),
+    ("zoom", "Масштабирование"),
+    ("rotate", "Вращение")
+)
+
+_EFFECT_FREQUENCIES = (
+    ("all", "Ко всем клипам"),
+    ("percent", "К проценту клипов"),
+    ("every", "К каждому N-му клипу"),
+    ("random", "Случайно")
+)
+
+_CAPCUT_TIMINGS = (
+    ("start", "В начале клипа"),
+    ("middle", "В середине клипа"),
+    ("end", "В конце клипа"),
+    ("random", "Случайно")
+)
+
+# Расширения оверлеев (как в FileUtils.SUPPORTED_OVERLAY_FORMATS)
+_OVERLAY_EXTS = frozenset({"png", "mp4", "mov", "gif", "webm"})
+
+# Иконки оверлеев по расширению файла
+_ICON_BY_EXT = {
+    ".png": "🖼️",
+    ".mp4": "🎬",
+    ".mov": "🎬",
+    ".gif": "🎞️"
+}
+
+# Пресеты CapCut эффектов (наборы эффектов заранее в frozenset)
+_PRESETS: dict = {
+    "dynamic": {
+        "scale": frozenset({"zoomBurst", "bounce"}),
+        "motion": frozenset({"shake", "wobble"}),
+        "digital": frozenset({"glitch"}),
+        "scale_amplitude": 25,
+        "motion_intensity": 40,
+        "frequency": "percent",
+        "percent": 60,
+        "timing": "random"
+    },
+    "smooth": {
+        "scale": frozenset({"pulse", "wave", "breathe"}),
+        "motion": frozenset({"pendulum"}),
+        "digital": frozenset(),
+        "scale_amplitude": 10,
+        "motion_intensity": 20,
+        "frequency": "every",
+        "every": 3,
+        "timing": "middle"
+    },
+    "epic": {
+        "scale": frozenset({"zoomBurst", "elastic"}),
+        "motion": frozenset({"shake", "spin"}),
+        "digital": frozenset({"glitch", "chromatic"}),
+        "scale_amplitude": 30,
+        "zoom_burst_start": 180,
+        "zoom_burst_decay": 90,
+        "motion_intensity": 50,
+        "frequency": "all",
+        "timing": "start"
+    },
+    "minimal": {
+        "scale": frozenset({"pulse"}),
+        "motion": frozenset(),
+        "digital": frozenset(),
+        "scale_amplitude": 5,
+        "motion_intensity": 10,
+        "frequency": "percent",
+        "percent": 30,
+        "timing": "end"
+    }
+}
+
+# ==================== ПРИВЯЗКИ ВИДЖЕТОВ ====================
+
+# Привязка: (атрибут виджета, тип, поле модели)
+_BINDING_SETTERS = {
+    "check": lambda widget, value: widget.setChecked(value),
+    "value": lambda widget, value: widget.setValue(value),
+    "percent": lambda widget, value: widget.setValue(int(value * 100)),
+    "text": lambda widget, value: widget.setCurrentText(value),
+    "data": lambda widget, value: select_combo_data(widget, value)
+}
+
+_BINDING_GETTERS = {
+    "check": lambda widget: widget.isChecked(),
+    "value": lambda widget: widget.value(),
+    "percent": lambda widget: widget.value() / 100.0,
+    "text": lambda widget: widget.currentText(),
+    "data": lambda widget: widget.currentData()
+}
+
+def _sync_combo_items(combo: QComboBox, names: List[str]):
+    """Синхронизирует модель строк комбобокса без сигналов и лишней пересборки"""
+    model = combo.model()
+    old_names = model.stringList()
+    if names == old_names:
+        return
+    
+    with QSignalBlocker(combo):
+        if names[:len(old_names)] == old_names:
+            # Добавлены только новые элементы в конец
+            first = len(old_names)
+            model.insertRows(first, len(names) - first)
+            for row in range(first, len(names)):
+                model.setData(model.index(row), names[row])
+        else:
+            current = combo.currentText()
+            model.setStringList(names)
+            index = combo.findText(current)
+            combo.setCurrentIndex(index if index >= 0 else (0 if names else -1))
+
+def _load_bindings(owner: QWidget, bindings: tuple, source: Any):
+    """Загружает значения полей в виджеты без генерации сигналов"""
+    for widget_attr, kind, field in bindings:
+        widget = getattr(owner, widget_attr)
+        value = getattr(source, field)
+        
+        # Набор флажков: словарь id -> EffectCheckBox
+        if kind == "checks":
+            for item_id, item in widget.items():
+                with QSignalBlocker(item):
+                    item.setChecked(item_id in value)
+            continue
+        
+        with QSignalBlocker(widget):
+            _BINDING_SETTERS[kind](widget, value)
+
+def _save_bindings(owner: QWidget, bindings: tuple, target: Any):
+    """Сохраняет значения виджетов в поля модели"""
+    for widget_attr, kind, field in bindings:
+        widget = getattr(owner, widget_attr)
+        if kind == "checks":
+            value = [item_id for item_id, item in widget.items() if item.isChecked()]
+        else:
+            value = _BINDING_GETTERS[kind](widget)
+        setattr(target, field, value)
+
+def _bindings_changed(owner: QWidget, bindings: tuple, model: Any) -> bool:
+    """Проверяет, отличаются ли значения виджетов от полей модели"""
+    for widget_attr, kind, field in bindings:
+        widget = getattr(owner, widget_attr)
+        stored = getattr(model, field)
+        if kind == "checks":
+            current = {item_id for item_id, item in widget.items() if item.isChecked()}
+            if current != set(stored):
+                return True
+        elif _BINDING_GETTERS[kind](widget) != stored:
+            return True
+    return False
+
 # ==================== ВКЛАДКА ГЕНЕРАЦИИ ====================
 
 class GenerationTab(BaseWidget):
@@ -38,6 +288,15 @@ class GenerationTab(BaseWidget):
         super().__init__(parent)
         self.channels: List[Channel] = []
         self.selected_channel_ids = set()
+        
+        # Состояние ETA
+        self._start_time: Optional[float] = None
+        self._last_eta_int = -1
+        self._last_eta_str = ""
+        
+        # Отложенное обновление каналов
+        self._pending_channels: Optional[List[Channel]] = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -86,44 +345,37 @@ class GenerationTab(BaseWidget):
         generation_group.setLayout(generation_layout)
         scroll_layout.addWidget(generation_group)
         
-        # Кнопки действий
-
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(10)
+        # Кнопки действий и прогресс в одной сетке
+        progress_group = QGroupBox("📊 Прогресс")
+        progress_layout = QGridLayout()
+        progress_layout.setHorizontalSpacing(10)
+        progress_layout.setColumnStretch(1, 1)
         
         self.test_btn = QPushButton("🧪 Тест (1 пара)")
         self.test_btn.setToolTip("Создать тестовое видео из первой пары файлов")
         self.test_btn.clicked.connect(self._on_test_clicked)
-        actions_layout.addWidget(self.test_btn)
-        
-        actions_layout.addStretch()
+        progress_layout.addWidget(self.test_btn, 0, 0)
         
         self.generate_btn = QPushButton("🎬 СОЗДАТЬ МОНТАЖ")
         self.generate_btn.setObjectName("primaryButton")
         self.generate_btn.clicked.connect(self._on_generate_clicked)
         self.generate_btn.setEnabled(False)
-        actions_layout.addWidget(self.generate_btn)
-        
-        scroll_layout.addLayout(actions_layout)
-        
-        # Прогресс
-        progress_group = QGroupBox("📊 Прогресс")
-        progress_layout = QVBoxLayout()
+        progress_layout.addWidget(self.generate_btn, 0, 2)
         
         self.progress_label = QLabel("Готов к работе")
-        progress_layout.addWidget(self.progress_label)
+        progress_layout.addWidget(self.progress_label, 1, 0, 1, 3)
         
         self.progress_bar = QProgressBar()
-        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.progress_bar, 2, 0, 1, 3)
         
         self.eta_label = QLabel("")
         self.eta_label.setObjectName("infoLabel")
-        progress_layout.addWidget(self.eta_label)
+        progress_layout.addWidget(self.eta_label, 3, 0, 1, 3)
         
         self.cancel_btn = QPushButton("❌ Отменить")
         self.cancel_btn.setObjectName("dangerButton")
         self.cancel_btn.setVisible(False)
-        progress_layout.addWidget(self.cancel_btn)
+        progress_layout.addWidget(self.cancel_btn, 4, 0)
         
         progress_group.setLayout(progress_layout)
         scroll_layout.addWidget(progress_group)
@@ -153,10 +405,28 @@ class GenerationTab(BaseWidget):
         self.setLayout(layout)
     
     def set_channels(self, channels: List[Channel]):
-        """Устанавливает список каналов"""
+        """Устанавливает список каналов (с объединением частых вызовов)"""
+        if self._pending_channels is None:
+            QTimer.singleShot(0, self._apply_pending_channels)
+        self._pending_channels = channels
+    
+    def _apply_pending_channels(self):
+        """Применяет последний отложенный список каналов"""
+        channels, self._pending_channels = self._pending_channels, None
+        if channels is None:
+            return
         self.channels = channels
         self.channel_selection.set_channels(channels)
     
+    def apply_channels_delta(self, delta: ChannelsDelta, channels: List[Channel]):
+        """Применяет точечное изменение списка каналов"""
+        # Отложенный полный список уже содержит изменение
+        if self._pending_channels is not None:
+            self._pending_channels = channels
+            return
+        self.channels = channels
+        self.channel_selection.apply_channels_delta(delta, channels)
+    
     def get_project_info_panel(self) -> ProjectInfoPanel:
         """Возвращает панель информации о проекте"""
         return self.project_panel
@@ -168,14 +438,17 @@ class GenerationTab(BaseWidget):
             self.progress_label.setText(text)
         
         # Обновляем ETA если возможно
-        if hasattr(self, '_start_time') and value > 0:
+        if self._start_time is not None and value > 0:
             elapsed = time.time() - self._start_time
             if value < 100:
-                eta = elapsed * (100 - value) / value
-                eta_text = f"Осталось примерно: {self._format_time(eta)}"
-                self.eta_label.setText(eta_text)
+                eta_int = int(elapsed * (100 - value) / value)
+                # Текст меняется только при смене целого числа секунд
+                if eta_int != self._last_eta_int:
+                    self._last_eta_int = eta_int
+                    self._last_eta_str = f"Осталось примерно: {self._format_time(eta_int)}"
+                    self.eta_label.setText(self._last_eta_str)
             else:
-                self.eta_label.setText("")
+                self._reset_eta()
     
     def _format_time(self, seconds: float) -> str:
         """Форматирует время в читаемый вид"""
@@ -191,6 +464,7 @@ class GenerationTab(BaseWidget):
     def start_generation(self):
         """Начинает генерацию"""
         self._start_time = time.time()
+        self._reset_eta()
         self.generate_btn.setEnabled(False)
         self.test_btn.setEnabled(False)
         self.cancel_btn.setVisible(True)
@@ -202,13 +476,19 @@ class GenerationTab(BaseWidget):
         self.generate_btn.setEnabled(True)
         self.test_btn.setEnabled(True)
         self.cancel_btn.setVisible(False)
+        self._reset_eta()
+    
+    def _reset_eta(self):
+        """Сбрасывает кэш ETA"""
+        self._last_eta_int = -1
+        self._last_eta_str = ""
         self.eta_label.setText("")
     
     def add_log_message(self, message: str, level: str = "info"):
         """Добавляет сообщение в лог"""
         self.log_widget.add_message(message, level)
     
-    def _on_selection_changed(self, selected_ids: set):
+    def _on_selection_changed(self, selected_ids: frozenset):
         """Обработчик изменения выбора каналов"""
         self.selected_channel_ids = selected_ids
         self.generate_btn.setEnabled(len(selected_ids) > 0)
@@ -257,11 +537,15 @@ class GenerationTab(BaseWidget):
 class ChannelsTab(BaseWidget):
     """Вкладка управления каналами"""
     
-    channels_changed = Signal()
+    channels_changed = Signal(object)  # ChannelsDelta
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.channels: List[Channel] = []
+        self._filter_re = QRegularExpression()
+        # Элементы таблицы по id канала (переиспользуются между обновлениями)
+        self._items: Dict[str, tuple] = {}
+        self._channels_by_id: Dict[str, Channel] = {}
         self.setup_ui()
     
     def setup_ui(self):
@@ -328,83 +612,127 @@ class ChannelsTab(BaseWidget):
         self.channels = channels
         self._update_table()
     
-    def _update_table(self, filter_text: str = ""):
+    def _update_table(self):
         """Обновляет таблицу каналов"""
-        self.channels_table.setRowCount(0)
+        table = self.channels_table
         
-        for channel in self.channels:
-            # Фильтрация
-            if filter_text and filter_text.lower() not in channel.name.lower():
-                continue
-            
-            row = self.channels_table.rowCount()
-            self.channels_table.insertRow(row)
-            
-            # Название
-            name_item = QTableWidgetItem(channel.name)
-            name_item.setData(Qt.UserRole, channel.id)
-            self.channels_table.setItem(row, 0, name_item)
-            
-            # Описание
-            desc_item = QTableWidgetItem(channel.description)
-            self.channels_table.setItem(row, 1, desc_item)
-            
-            # Разрешение
-            res_item = QTableWidgetItem(channel.export.resolution)
-            res_item.setTextAlignment(Qt.AlignCenter)
-            self.channels_table.setItem(row, 2, res_item)
+        # Забираем элементы из таблицы, чтобы она не удалила их при смене строк
+        for row in range(table.rowCount()):
+            for column in range(4):
+                table.takeItem(row, column)
+        
+        table.setRowCount(len(self.channels))
+        self._channels_by_id = {ch.id: ch for ch in self.channels}
+        
+        items: Dict[str, tuple] = {}
+        for row, channel in enumerate(self.channels):
+            row_items = self._items.get(channel.id)
+            if row_items is None:
+                row_items = self._create_row_items(channel)
+            else:
+                self._refresh_row_items(row_items, channel)
+            items[channel.id] = row_items
             
-            # FPS
-            fps_item = QTableWidgetItem(f"{channel.export.fps} fps")
-            fps_item.setTextAlignment(Qt.AlignCenter)
-            self.channels_table.setItem(row, 3, fps_item)
+            for column, item in enumerate(row_items):
+                table.setItem(row, column, item)
             
-            # Действия
-            actions_widget = self._create_actions_widget(channel)
-            self.channels_table.setCellWidget(row, 4, actions_widget)
+            # Действия (виджет зависит только от id канала)
+            actions_widget = table.cellWidget(row, 4)
+            if actions_widget is None or actions_widget.property("channel_id") != channel.id:
+                table.setCellWidget(row, 4, self._create_actions_widget(channel))
+        
+        self._items = items
+        self._apply_filter()
         
         # Обновляем статистику
         self._update_stats()
     
+    def _create_row_items(self, channel: Channel) -> tuple:
+        """Создает элементы строки таблицы для канала"""
+        # Название
+        name_item = QTableWidgetItem(channel.name)
+        name_item.setData(Qt.UserRole, channel.id)
+        
+        # Описание
+        desc_item = QTableWidgetItem(channel.description)
+        
+        # Разрешение
+        res_item = QTableWidgetItem(channel.export.resolution)
+        res_item.setTextAlignment(Qt.AlignCenter)
+        
+        # FPS
+        fps_item = QTableWidgetItem(f"{channel.export.fps} fps")
+        fps_item.setTextAlignment(Qt.AlignCenter)
+        
+        return (name_item, desc_item, res_item, fps_item)
+    
+    def _refresh_row_items(self, row_items: tuple, channel: Channel):
+        """Обновляет текст элементов строки, если данные канала изменились"""
+        texts = (
+            channel.name, channel.description,
+            channel.export.resolution, f"{channel.export.fps} fps"
+        )
+        for item, text in zip(row_items, texts):
+            if item.text() != text:
+                item.setText(text)
+    
+    def _apply_filter(self):
+        """Скрывает строки, не подходящие под фильтр"""
+        filter_text = self.search_edit.text()
+        for row, channel in enumerate(self.channels):
+            hidden = bool(filter_text) and not self._filter_re.match(channel.name).hasMatch()
+            self.channels_table.setRowHidden(row, hidden)
+    
     def _create_actions_widget(self, channel: Channel) -> QWidget:
         """Создает виджет с кнопками действий"""
         widget = QWidget()
+        widget.setProperty("channel_id", channel.id)
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(2)
         
-        # Кнопка редактирования
-        edit_btn = QPushButton("✏️")
-        edit_btn.setToolTip("Редактировать")
-        edit_btn.setFixedSize(24, 24)
-        edit_btn.clicked.connect(lambda: self._edit_channel(channel))
-        layout.addWidget(edit_btn)
-        
-        # Кнопка дублирования
-        duplicate_btn = QPushButton("📋")
-        duplicate_btn.setToolTip("Дублировать")
-        duplicate_btn.setFixedSize(24, 24)
-        duplicate_btn.clicked.connect(lambda: self._duplicate_channel(channel))
-        layout.addWidget(duplicate_btn)
-        
-        # Кнопка экспорта
-        export_btn = QPushButton("📤")
-        export_btn.setToolTip("Экспортировать")
-        export_btn.setFixedSize(24, 24)
-        export_btn.clicked.connect(lambda: self._export_channel(channel))
-        layout.addWidget(export_btn)
-        
-        # Кнопка удаления
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Удалить")
-        delete_btn.setFixedSize(24, 24)
-        delete_btn.clicked.connect(lambda: self._delete_channel(channel))
-        layout.addWidget(delete_btn)
+        # Кнопки хранят id канала и действие, обработчик один на все строки
+        actions = [
+            ("✏️", "Редактировать", "edit"),
+            ("📋", "Дублировать", "duplicate"),
+            ("📤", "Экспортировать", "export"),
+            ("🗑️", "Удалить", "delete")
+        ]
+        
+        for icon, tooltip, action in actions:
+            btn = QPushButton(icon)
+            btn.setToolTip(tooltip)
+            btn.setFixedSize(24, 24)
+            btn.setProperty("channel_id", channel.id)
+            btn.setProperty("action", action)
+            btn.clicked.connect(self._on_action_clicked)
+            layout.addWidget(btn)
         
         layout.addStretch()
         widget.setLayout(layout)
         return widget
     
+    def _on_action_clicked(self):
+        """Обработчик кнопок действий в таблице"""
+        button = self.sender()
+        if button is None:
+            return
+        
+        channel = self._channels_by_id.get(button.property("channel_id"))
+        if not channel:
+            return
+        
+        handlers = {
+            "edit": self._edit_channel,
+            "duplicate": self._duplicate_channel,
+            "export": self._export_channel,
+            "delete": self._delete_channel
+        }
+        
+        handler = handlers.get(button.property("action"))
+        if handler:
+            handler(channel)
+    
     def _update_stats(self):
         """Обновляет статистику"""
         total = len(self.channels)
@@ -417,7 +745,13 @@ class ChannelsTab(BaseWidget):
     
     def _filter_channels(self, text: str):
         """Фильтрует каналы по тексту"""
-        self._update_table(text)
+        # Регулярное выражение компилируется один раз на изменение текста
+        self._filter_re = QRegularExpression(
+            QRegularExpression.escape(text),
+            QRegularExpression.CaseInsensitiveOption
+        )
+        self._filter_re.optimize()
+        self._apply_filter()
     
     def _create_channel(self):
         """Создает новый канал"""
@@ -426,7 +760,7 @@ class ChannelsTab(BaseWidget):
             channel = dialog.get_channel()
             self.channels.append(channel)
             self._update_table()
-            self.channels_changed.emit()
+            self.channels_changed.emit(ChannelsDelta("add", len(self.channels) - 1, channel))
             self.show_info(f"Канал '{channel.name}' создан")
     
     def _edit_channel(self, channel: Channel):
@@ -435,42 +769,46 @@ class ChannelsTab(BaseWidget):
         if dialog.exec():
             updated_channel = dialog.get_channel()
             # Обновляем канал в списке
+            index = None
             for i, ch in enumerate(self.channels):
                 if ch.id == channel.id:
                     self.channels[i] = updated_channel
+                    index = i
                     break
             self._update_table()
-            self.channels_changed.emit()
+            if index is None:
+                self.channels_changed.emit(ChannelsDelta("reset"))
+            else:
+                self.channels_changed.emit(ChannelsDelta("update", index, updated_channel))
             self.show_info(f"Канал '{updated_channel.name}' обновлен")
     
     def _duplicate_channel(self, channel: Channel):
         """Дублирует канал"""
-        from models import Channel
-        from dataclasses import asdict
-        
         # Создаем копию
-        channel_dict = asdict(channel)
+        channel_dict = channel.to_dict()
         channel_dict['id'] = f"channel_{int(time.time())}"
         channel_dict['name'] = f"{channel.name} (копия)"
         
         new_channel = Channel.from_dict(channel_dict)
         self.channels.append(new_channel)
         self._update_table()
-        self.channels_changed.emit()
+        self.channels_changed.emit(ChannelsDelta("add", len(self.channels) - 1, new_channel))
         self.show_info(f"Создана копия канала '{channel.name}'")
     
     def _delete_channel(self, channel: Channel):
         """Удаляет канал"""
         if self.confirm_action(f"Удалить канал '{channel.name}'?"):
+            index = next((i for i, ch in enumerate(self.channels) if ch.id == channel.id), None)
             self.channels = [ch for ch in self.channels if ch.id != channel.id]
             self._update_table()
-            self.channels_changed.emit()
+            if index is None:
+                self.channels_changed.emit(ChannelsDelta("reset"))
+            else:
+                self.channels_changed.emit(ChannelsDelta("remove", index, channel))
             self.show_info(f"Канал '{channel.name}' удален")
     
     def _export_channel(self, channel: Channel):
         """Экспортирует канал"""
-        from models import DataManager
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Экспорт канала",
             f"{channel.name}.json",
@@ -486,8 +824,6 @@ class ChannelsTab(BaseWidget):
     
     def _export_channels(self):
         """Экспортирует все каналы"""
-        from models import DataManager
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Экспорт каналов",
             f"channels_{time.strftime('%Y%m%d_%H%M%S')}.json",
@@ -503,8 +839,6 @@ class ChannelsTab(BaseWidget):
     
     def _import_channels(self):
         """Импортирует каналы"""
-        from models import DataManager
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Импорт каналов",
             "", "JSON files (*.json)"
@@ -517,15 +851,13 @@ class ChannelsTab(BaseWidget):
             if imported:
                 self.channels.extend(imported)
                 self._update_table()
-                self.channels_changed.emit()
+                self.channels_changed.emit(ChannelsDelta("reset"))
                 self.show_info(f"Импортировано каналов: {len(imported)}")
             else:
                 self.show_error("Ошибка импорта каналов")
     
     def _create_from_template(self):
         """Создает канал из шаблона"""
-        from models import ChannelFactory
-        
         templates = {
             "YouTube (16:9)": "youtube",
             "Shorts/Reels (9:16)": "shorts",
@@ -550,7 +882,7 @@ class ChannelsTab(BaseWidget):
                 channel = dialog.get_channel()
                 self.channels.append(channel)
                 self._update_table()
-                self.channels_changed.emit()
+                self.channels_changed.emit(ChannelsDelta("add", len(self.channels) - 1, channel))
                 self.show_info(f"Канал создан из шаблона '{template_name}'")
 
 # ==================== ВКЛАДКА ЭФФЕКТОВ ====================
@@ -558,14 +890,87 @@ class ChannelsTab(BaseWidget):
 class EffectsTab(BaseWidget):
     """Вкладка настройки эффектов"""
     
+    channel_edited = Signal(object)  # Channel
+    
+    # Привязки виджетов секций к полям EffectSettings
+    _BINDINGS = {
+        "ken_burns": (
+            ("kb_effects", "checks", "ken_burns"),
+            ("kb_intensity", "value", "ken_burns_intensity"),
+            ("kb_rotation", "value", "rotation_angle"),
+            ("kb_smooth", "percent", "kb_smooth_factor"),
+            ("kb_randomize", "check", "kb_randomize"),
+            ("kb_smart_crop", "check", "smart_crop"),
+            ("kb_easing", "text", "easing_type")
+        ),
+        "transitions": (
+            ("transitions", "checks", "transitions"),
+            ("trans_duration", "value", "transition_duration"),
+            ("trans_overlap", "value", "trans_overlap"),
+            ("trans_randomize", "check", "trans_randomize")
+        ),
+        "fade": (
+            ("fade_in_check", "check", "fade_in_from_black"),
+            ("fade_in_duration", "value", "fade_in_duration"),
+            ("fade_in_type", "text", "fade_in_type"),
+            ("fade_out_check", "check", "fade_out_to_black"),
+            ("fade_out_duration", "value", "fade_out_duration"),
+            ("fade_out_type", "text", "fade_out_type"),
+            ("add_black_frame", "check", "add_black_frame")
+        ),
+        "color": (
+            ("color_correction", "check", "color_correction"),
+            ("color_filter", "text", "color_filter"),
+            ("vignette_check", "check", "vignette"),
+            ("vignette_intensity", "value", "vignette_intensity"),
+            ("grain_check", "check", "grain"),
+            ("grain_intensity", "value", "grain_intensity"),
+            ("blur_edges_check", "check", "blur_edges"),
+            ("blur_intensity", "value", "blur_intensity")
+        ),
+        "audio": (
+            ("audio_pitch", "text", "audio_pitch"),
+            ("audio_effect", "text", "audio_effect"),
+            ("audio_stereo", "check", "audio_stereo_enhance"),
+            ("audio_normalize", "check", "audio_normalize"),
+            ("audio_compressor", "check", "audio_compressor"),
+            ("audio_limiter", "check", "audio_limiter")
+        ),
+        "animation": (
+            ("motion_blur", "check", "motion_blur"),
+            ("motion_blur_amount", "value", "motion_blur_amount"),
+            ("parallax_enabled", "check", "enable_3d_parallax"),
+            ("parallax_layers", "value", "parallax_depth_layers"),
+            ("parallax_speed", "value", "parallax_speed"),
+            ("parallax_direction", "text", "parallax_direction")
+        )
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.channels: List[Channel] = []
         self.current_channel: Optional[Channel] = None
+        self._channels_by_name: Dict[str, Channel] = {}
+        self._channels_by_id: Dict[str, Channel] = {}
+        self._in_programmatic_update = False
+        self._loaded_effects: Optional[EffectSettings] = None
+        self._dirty = False
         self.effect_widgets = {}
+        self._pending_channels: Optional[List[Channel]] = None
+        # Секции с отложенным созданием содержимого
+        self._sections: Dict[str, CollapsibleGroupBox] = {}
         self.setup_ui()
     
     def setup_ui(self):
+        # Строим интерфейс без промежуточных перерисовок
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+    
+    def _build_ui(self):
         layout = QVBoxLayout()
         
         # Выбор канала
@@ -573,6 +978,7 @@ class EffectsTab(BaseWidget):
         channel_layout.addWidget(QLabel("📺 Канал:"))
         
         self.channel_combo = QComboBox()
+        self.channel_combo.setModel(QStringListModel(self.channel_combo))
         self.channel_combo.currentTextChanged.connect(self._load_channel_effects)
         channel_layout.addWidget(self.channel_combo)
         
@@ -630,23 +1036,47 @@ class EffectsTab(BaseWidget):
         self.setLayout(layout)
     
     def set_channels(self, channels: List[Channel]):
-        """Устанавливает список каналов"""
+        """Устанавливает список каналов (с объединением частых вызовов)"""
+        if self._pending_channels is None:
+            QTimer.singleShot(0, self._apply_pending_channels)
+        self._pending_channels = channels
+    
+    def _apply_pending_channels(self):
+        """Применяет последний отложенный список каналов"""
+        channels, self._pending_channels = self._pending_channels, None
+        if channels is None:
+            return
         self.channels = channels
+        self._channels_by_name = {ch.name: ch for ch in channels}
+        self._channels_by_id = {ch.id: ch for ch in channels}
         self._update_channel_combo()
     
     def _update_channel_combo(self):
         """Обновляет список каналов"""
-        current = self.channel_combo.currentText()
-        self.channel_combo.clear()
-        self.channel_combo.addItems([ch.name for ch in self.channels])
-        
-        if current in [ch.name for ch in self.channels]:
-            self.channel_combo.setCurrentText(current)
+        self._in_programmatic_update = True
+        try:
+            _sync_combo_items(self.channel_combo, [ch.name for ch in self.channels])
+        finally:
+            self._in_programmatic_update = False
+        
+        # Один сигнал вместо сигналов от clear/addItems
+        self.channel_combo.currentTextChanged.emit(self.channel_combo.currentText())
+    
+    def reload_channel(self, channel: Channel):
+        """Перечитывает настройки канала, измененного в другой вкладке"""
+        if channel is self.current_channel:
+            self._loaded_effects = None
+            self._load_channel_effects()
     
     def _create_ken_burns_section(self, layout: QVBoxLayout):
         """Создает секцию Ken Burns эффектов"""
         group = CollapsibleGroupBox("🎬 Ken Burns эффекты")
-        group_layout = QVBoxLayout()
+        group.setLayout(QVBoxLayout())
+        self._register_section("ken_burns", group, self._build_ken_burns_body)
+        layout.addWidget(group)
+    
+    def _build_ken_burns_body(self, group_layout: QVBoxLayout):
+        """Заполняет секцию Ken Burns эффектов"""
         
         # Список эффектов
         effects_grid = QGridLayout()
@@ -703,14 +1133,16 @@ class EffectsTab(BaseWidget):
         settings_layout.addRow("Тип анимации:", self.kb_easing)
         
         group_layout.addLayout(settings_layout)
-        
-        group.setLayout(group_layout)
-        layout.addWidget(group)
     
     def _create_transitions_section(self, layout: QVBoxLayout):
         """Создает секцию переходов"""
         group = CollapsibleGroupBox("🔄 Переходы между клипами")
-        group_layout = QVBoxLayout()
+        group.setLayout(QVBoxLayout())
+        self._register_section("transitions", group, self._build_transitions_body)
+        layout.addWidget(group)
+    
+    def _build_transitions_body(self, group_layout: QVBoxLayout):
+        """Заполняет секцию переходов"""
         
         # Список переходов
         trans_grid = QGridLayout()
@@ -758,14 +1190,16 @@ class EffectsTab(BaseWidget):
         settings_layout.addRow(self.trans_randomize)
         
         group_layout.addLayout(settings_layout)
-        
-        group.setLayout(group_layout)
-        layout.addWidget(group)
     
     def _create_fade_section(self, layout: QVBoxLayout):
         """Создает секцию Fade эффектов"""
         group = CollapsibleGroupBox("🌑 Fade In/Out эффекты")
-        group_layout = QVBoxLayout()
+        group.setLayout(QVBoxLayout())
+        self._register_section("fade", group, self._build_fade_body)
+        layout.addWidget(group)
+    
+    def _build_fade_body(self, group_layout: QVBoxLayout):
+        """Заполняет секцию Fade эффектов"""
         
         # Fade In
         fade_in_layout = QHBoxLayout()
@@ -815,14 +1249,16 @@ class EffectsTab(BaseWidget):
         self.add_black_frame = QCheckBox("Добавить черный кадр в конец")
         self.add_black_frame.setChecked(True)
         group_layout.addWidget(self.add_black_frame)
-        
-        group.setLayout(group_layout)
-        layout.addWidget(group)
     
     def _create_color_section(self, layout: QVBoxLayout):
         """Создает секцию цветокоррекции"""
         group = CollapsibleGroupBox("🎨 Цветокоррекция")
-        group_layout = QVBoxLayout()
+        group.setLayout(QVBoxLayout())
+        self._register_section("color", group, self._build_color_body)
+        layout.addWidget(group)
+    
+    def _build_color_body(self, group_layout: QVBoxLayout):
+        """Заполняет секцию цветокоррекции"""
         
         self.color_correction = QCheckBox("Включить цветокоррекцию")
         self.color_correction.toggled.connect(self._on_color_correction_toggled)
@@ -833,10 +1269,7 @@ class EffectsTab(BaseWidget):
         color_layout = QFormLayout()
         
         self.color_filter = QComboBox()
-        self.color_filter.addItems([
-            "none", "warm", "cold", "vintage", "blackwhite", "sepia",
-            "cinematic", "vibrant", "faded", "instagram", "film"
-        ])
+        self.color_filter.addItems(_COLOR_FILTERS)
         color_layout.addRow("Фильтр:", self.color_filter)
         
         # Виньетка
@@ -866,31 +1299,26 @@ class EffectsTab(BaseWidget):
         self.color_widget.setLayout(color_layout)
         self.color_widget.setVisible(False)
         group_layout.addWidget(self.color_widget)
-        
-        group.setLayout(group_layout)
-        layout.addWidget(group)
     
     def _create_audio_section(self, layout: QVBoxLayout):
         """Создает секцию аудио эффектов"""
         group = CollapsibleGroupBox("🎵 Аудио эффекты")
-        group_layout = QFormLayout()
+        group.setLayout(QFormLayout())
+        self._register_section("audio", group, self._build_audio_body)
+        layout.addWidget(group)
+    
+    def _build_audio_body(self, group_layout: QFormLayout):
+        """Заполняет секцию аудио эффектов"""
         
         # Тональность
         self.audio_pitch = QComboBox()
-        pitches = [
-            "-3", "-2.5", "-2", "-1.5", "-1", "-0.5", "0",
-            "+0.5", "+1", "+1.5", "+2", "+2.5", "+3"
-        ]
-        self.audio_pitch.addItems(pitches)
+        self.audio_pitch.addItems(_AUDIO_PITCHES)
         self.audio_pitch.setCurrentText("0")
         group_layout.addRow("Тональность:", self.audio_pitch)
         
         # Эффект
         self.audio_effect = QComboBox()
-        self.audio_effect.addItems([
-            "none", "bass", "reverb", "echo", "chorus", "telephone",
-            "underwater", "radio", "vintage", "distortion", "robot"
-        ])
+        self.audio_effect.addItems(_AUDIO_EFFECTS)
         group_layout.addRow("Эффект:", self.audio_effect)
         
         # Дополнительные настройки
@@ -906,14 +1334,16 @@ class EffectsTab(BaseWidget):
         
         self.audio_limiter = QCheckBox("Лимитер")
         group_layout.addRow(self.audio_limiter)
-        
-        group.setLayout(group_layout)
-        layout.addWidget(group)
     
     def _create_animation_section(self, layout: QVBoxLayout):
         """Создает секцию настроек анимации"""
         group = CollapsibleGroupBox("⚡ Плавность анимации")
-        group_layout = QFormLayout()
+        group.setLayout(QFormLayout())
+        self._register_section("animation", group, self._build_animation_body)
+        layout.addWidget(group)
+    
+    def _build_animation_body(self, group_layout: QFormLayout):
+        """Заполняет секцию настроек анимации"""
         
         # Motion blur
         motion_layout = QHBoxLayout()
@@ -950,92 +1380,78 @@ class EffectsTab(BaseWidget):
         self.parallax_widget.setLayout(parallax_layout)
         self.parallax_widget.setVisible(False)
         group_layout.addRow(self.parallax_widget)
+    
+    def _register_section(self, name: str, group: CollapsibleGroupBox, build_fn):
+        """Регистрирует секцию с отложенным созданием содержимого"""
+        self._sections[name] = group
+        group.setContentFactory(build_fn)
+        group.content_built.connect(lambda n=name: self._on_section_built(n))
+    
+    def _on_section_built(self, name: str):
+        """Загружает настройки канала в только что созданную секцию"""
+        if self.current_channel:
+            self._load_section(name, self.current_channel.effects)
+    
+    def _load_section(self, name: str, effects: EffectSettings):
+        """Загружает настройки в виджеты секции"""
+        _load_bindings(self, self._BINDINGS[name], effects)
         
-        group.setLayout(group_layout)
-        layout.addWidget(group)
+        # Сигналы заблокированы, поэтому зависимые виджеты обновляем вручную
+        if name == "color":
+            self.color_widget.setVisible(self.color_correction.isChecked())
+        elif name == "animation":
+            self.parallax_widget.setVisible(self.parallax_enabled.isChecked())
     
+    @Slot(bool)
     def _on_color_correction_toggled(self, checked: bool):
         """Обработчик переключения цветокоррекции"""
         self.color_widget.setVisible(checked)
     
+    @Slot(bool)
     def _on_parallax_toggled(self, checked: bool):
         """Обработчик переключения parallax"""
         self.parallax_widget.setVisible(checked)
     
+    def showEvent(self, event):
+        """Загружает отложенные настройки при показе вкладки"""
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self._load_channel_effects()
+    
+    @Slot()
     def _load_channel_effects(self):
         """Загружает настройки эффектов канала"""
+        # Изменения списка каналов загружаются одним вызовом после обновления
+        if self._in_programmatic_update:
+            return
+        
+        # Скрытая вкладка загрузится при показе
+        if not self.isVisible():
+            self._dirty = True
+            return
+        
         channel_name = self.channel_combo.currentText()
         if not channel_name:
             return
         
-        self.current_channel = next((ch for ch in self.channels if ch.name == channel_name), None)
+        self.current_channel = self._channels_by_name.get(channel_name)
         if not self.current_channel:
             return
         
         effects = self.current_channel.effects
         
-        # Ken Burns
-        for effect_id, widget in self.kb_effects.items():
-            widget.setChecked(effect_id in effects.ken_burns)
-        
-        self.kb_intensity.setValue(effects.ken_burns_intensity)
-        self.kb_rotation.setValue(effects.rotation_angle)
-        self.kb_smooth.setValue(int(effects.kb_smooth_factor * 100))
-        self.kb_randomize.setChecked(effects.kb_randomize)
-        self.kb_smart_crop.setChecked(effects.smart_crop)
-        self.kb_easing.setCurrentText(effects.easing_type)
-        
-        # Переходы
-        for trans_id, widget in self.transitions.items():
-            widget.setChecked(trans_id in effects.transitions)
-        
-        self.trans_duration.setValue(effects.transition_duration)
-        self.trans_overlap.setValue(effects.trans_overlap)
-        self.trans_randomize.setChecked(effects.trans_randomize)
-        
-        # Fade
-        self.fade_in_check.setChecked(effects.fade_in_from_black)
-        self.fade_in_duration.setValue(effects.fade_in_duration)
-        self.fade_in_type.setCurrentText(effects.fade_in_type)
-        self.fade_out_check.setChecked(effects.fade_out_to_black)
-        self.fade_out_duration.setValue(effects.fade_out_duration)
-        self.fade_out_type.setCurrentText(effects.fade_out_type)
-        self.add_black_frame.setChecked(effects.add_black_frame)
-        
-        # Цветокоррекция
-        self.color_correction.setChecked(effects.color_correction)
-        self.color_filter.setCurrentText(effects.color_filter)
-        self.vignette_check.setChecked(effects.vignette)
-        self.vignette_intensity.setValue(effects.vignette_intensity)
-        self.grain_check.setChecked(effects.grain)
-        self.grain_intensity.setValue(effects.grain_intensity)
-        self.blur_edges_check.setChecked(effects.blur_edges)
-        self.blur_intensity.setValue(effects.blur_intensity)
-        
-        # Аудио
-        self.audio_pitch.setCurrentText(effects.audio_pitch)
-        self.audio_effect.setCurrentText(effects.audio_effect)
-        self.audio_stereo.setChecked(effects.audio_stereo_enhance)
-        self.audio_normalize.setChecked(effects.audio_normalize)
-        self.audio_compressor.setChecked(effects.audio_compressor)
-        self.audio_limiter.setChecked(effects.audio_limiter)
+        # Настройки уже загружены в виджеты
+        if effects is self._loaded_effects:
+            return
+        self._loaded_effects = effects
         
-        # Анимация
-        self.motion_blur.setChecked(effects.motion_blur)
-        self.motion_blur_amount.setValue(effects.motion_blur_amount)
-        self.parallax_enabled.setChecked(effects.enable_3d_parallax)
-        self.parallax_layers.setValue(effects.parallax_depth_layers)
-        self.parallax_speed.setValue(effects.parallax_speed)
-        self.parallax_direction.setCurrentText(effects.parallax_direction)
+        # Несозданные секции загрузятся при первом разворачивании
+        for name, group in self._sections.items():
+            if group.isBuilt():
+                self._load_section(name, effects)
     
-    def _copy_effects(self):
-        # Заглушка для копирования эффектов
-        print("Копирование эффектов не реализовано")
-
-    def _reset_effects(self):
-        # Заглушка для сброса эффектов
-        print("Сброс эффектов не реализован")
-
+    @Slot()
     def _save_effects(self):
         """Сохраняет настройки эффектов"""
         if not self.current_channel:
@@ -1044,123 +1460,148 @@ class EffectsTab(BaseWidget):
         
         effects = self.current_channel.effects
         
-        # Ken Burns
-        if hasattr(self, "motion_intensity"):
-            effects.motion_intensity = self.motion_intensity.value()
-        else:
-            effects.motion_intensity = 30
-        effects.effect_frequency = self.effect_frequency.currentData()
-        effects.effect_percent = self.effect_percent.value()
-        effects.effect_every = self.effect_every.value()
-        effects.capcut_timing = self.capcut_timing.currentData()
-        effects.avoid_repetition = self.avoid_repetition.isChecked()
+        # Несозданные секции не менялись пользователем
+        built = [name for name, group in self._sections.items() if group.isBuilt()]
+        if not any(_bindings_changed(self, self._BINDINGS[name], effects) for name in built):
+            self.show_info("Нет изменений для сохранения")
+            return
+        
+        for name in built:
+            _save_bindings(self, self._BINDINGS[name], effects)
         
         # Валидация
         effects.validate()
+        self.channel_edited.emit(self.current_channel)
         
-        self.show_info(f"CapCut эффекты для канала '{self.current_channel.name}' сохранены")
-    
-    def _apply_preset(self, preset_id: str):
-        """Применяет пресет эффектов"""
-        presets = {
-            "dynamic": {
-                "scale": ["zoomBurst", "bounce"],
-                "motion": ["shake", "wobble"],
-                "digital": ["glitch"],
-                "scale_amplitude": 25,
-                "motion_intensity": 40,
-                "frequency": "percent",
-                "percent": 60,
-                "timing": "random"
-            },
-            "smooth": {
-                "scale": ["pulse", "wave", "breathe"],
-                "motion": ["pendulum"],
-                "digital": [],
-                "scale_amplitude": 10,
-                "motion_intensity": 20,
-                "frequency": "every",
-                "every": 3,
-                "timing": "middle"
-            },
-            "epic": {
-                "scale": ["zoomBurst", "elastic"],
-                "motion": ["shake", "spin"],
-                "digital": ["glitch", "chromatic"],
-                "scale_amplitude": 30,
-                "zoom_burst_start": 180,
-                "zoom_burst_decay": 90,
-                "motion_intensity": 50,
-                "frequency": "all",
-                "timing": "start"
-            },
-            "minimal": {
-                "scale": ["pulse"],
-                "motion": [],
-                "digital": [],
-                "scale_amplitude": 5,
-                "motion_intensity": 10,
-                "frequency": "percent",
-                "percent": 30,
-                "timing": "end"
-            }
-        }
-        
-        preset = presets.get(preset_id)
-        if not preset:
+        self.show_info(f"Настройки эффектов для канала '{self.current_channel.name}' сохранены")
+    
+    def _reset_effects(self):
+        """Сбрасывает настройки эффектов"""
+        if not self.current_channel:
             return
         
-        # Применяем пресет
-        for effect_id, widget in self.scale_effects.items():
-            widget.setChecked(effect_id in preset.get("scale", []))
-        
-        for effect_id, widget in self.motion_effects.items():
-            widget.setChecked(effect_id in preset.get("motion", []))
-        
-        for effect_id, widget in self.digital_effects.items():
-            widget.setChecked(effect_id in preset.get("digital", []))
-        
-        self.scale_amplitude.setValue(preset.get("scale_amplitude", 15))
-        
-        if "zoom_burst_start" in preset:
-            self.zoom_burst_start.setValue(preset["zoom_burst_start"])
-        if "zoom_burst_decay" in preset:
-            self.zoom_burst_decay.setValue(preset["zoom_burst_decay"])
-        
-        self.motion_intensity.setValue(preset.get("motion_intensity", 30))
-        
-        # Частота
-        for i in range(self.effect_frequency.count()):
-            if self.effect_frequency.itemData(i) == preset.get("frequency", "all"):
-                self.effect_frequency.setCurrentIndex(i)
-                break
+        if self.confirm_action("Сбросить все настройки эффектов к значениям по умолчанию?"):
+            self.current_channel.effects = _default_effects()
+            self._load_channel_effects()
+            self.channel_edited.emit(self.current_channel)
+            self.show_info("Настройки эффектов сброшены")
+    
+    def _copy_effects(self):
+        """Копирует эффекты в другой канал"""
+        if not self.current_channel:
+            return
         
-        if "percent" in preset:
-            self.effect_percent.setValue(preset["percent"])
-        if "every" in preset:
-            self.effect_every.setValue(preset["every"])
+        channel_names = [
+            ch.name for channel_id, ch in self._channels_by_id.items()
+            if channel_id != self.current_channel.id
+        ]
+        if not channel_names:
+            self.show_info("Нет других каналов для копирования")
+            return
         
-        # Тайминг
-        for i in range(self.capcut_timing.count()):
-            if self.capcut_timing.itemData(i) == preset.get("timing", "start"):
-                self.capcut_timing.setCurrentIndex(i)
-                break
+        target_name, ok = QInputDialog.getItem(
+            self, "Копирование настроек",
+            "Выберите канал для копирования настроек:",
+            channel_names, 0, False
+        )
         
-        self.show_info(f"Применен пресет '{preset_id}'")
+        if ok and target_name:
+            target_channel = self._channels_by_name.get(target_name)
+            if target_channel and target_channel is not self.current_channel:
+                if _effects_equal(target_channel.effects, self.current_channel.effects):
+                    self.show_info(f"Канал '{target_name}' уже имеет эти настройки")
+                    return
+                
+                # Поля - примитивы и списки строк: достаточно скопировать списки
+                source = self.current_channel.effects
+                target_channel.effects = replace(
+                    source,
+                    ken_burns=list(source.ken_burns),
+                    transitions=list(source.transitions),
+                    capcut_effects=list(source.capcut_effects),
+                    motion_effects=list(source.motion_effects)
+                )
+                self.channel_edited.emit(target_channel)
+                self.show_info(f"Настройки скопированы в канал '{target_name}'")
 
 # ==================== ВКЛАДКА ОВЕРЛЕЕВ ====================
 
+class OverlayScanSignals(QObject):
+    """Сигналы задачи сканирования оверлеев"""
+    
+    finished = Signal(str, list)  # folder, files
+
+class OverlayScanTask(QRunnable):
+    """Сканирование папки с оверлеями вне GUI потока"""
+    
+    def __init__(self, folder: str):
+        super().__init__()
+        self.folder = folder
+        self.signals = OverlayScanSignals()
+    
+    def run(self):
+        overlay_files = []
+        try:
+            # DirEntry кэширует результат stat, Path объекты не создаются
+            with os.scandir(self.folder) as entries:
+                overlay_files = sorted(
+                    entry.name for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                    and entry.name.rpartition('.')[2].lower() in _OVERLAY_EXTS
+                )
+        except Exception as e:
+            logger.error(f"Ошибка сканирования папки оверлеев: {str(e)}")
+        
+        self.signals.finished.emit(self.folder, overlay_files)
+
 class OverlaysTab(BaseWidget):
     """Вкладка настройки оверлеев"""
     
+    channel_edited = Signal(object)  # Channel
+    
+    # Привязки виджетов к полям OverlaySettings
+    _BINDINGS = (
+        ("blend_mode", "data", "blend_mode"),
+        ("opacity_slider", "value", "opacity"),
+        ("position_combo", "data", "position"),
+        ("scale_slider", "value", "scale"),
+        ("rotation_slider", "value", "rotation"),
+        ("randomize_check", "check", "randomize"),
+        ("stretch_check", "check", "stretch"),
+        ("animate_check", "check", "animate"),
+        ("animation_type", "data", "animation_type")
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.channels: List[Channel] = []
         self.current_channel: Optional[Channel] = None
+        self._channels_by_name: Dict[str, Channel] = {}
+        self._in_programmatic_update = False
         self.overlay_files: List[str] = []
+        self._dirty = False
+        self._files_dirty = False
+        
+        # Отложенное сканирование папки оверлеев
+        self._pending_folder = ""
+        self._scan_task: Optional[OverlayScanTask] = None
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setSingleShot(True)
+        self._scan_timer.setInterval(300)
+        self._scan_timer.timeout.connect(self._do_scan)
+        
         self.setup_ui()
     
     def setup_ui(self):
+        # Строим интерфейс без промежуточных перерисовок
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+    
+    def _build_ui(self):
         layout = QVBoxLayout()
         
         # Управление оверлеями
@@ -1200,6 +1641,7 @@ class OverlaysTab(BaseWidget):
         channel_layout.addWidget(QLabel("Канал:"))
         
         self.channel_combo = QComboBox()
+        self.channel_combo.setModel(QStringListModel(self.channel_combo))
         self.channel_combo.currentTextChanged.connect(self._load_channel_overlays)
         channel_layout.addWidget(self.channel_combo)
         channel_layout.addStretch()
@@ -1213,9 +1655,12 @@ class OverlaysTab(BaseWidget):
         files_group = QGroupBox("Доступные оверлеи")
         files_layout = QVBoxLayout()
         
-        self.files_list = QListWidget()
-        self.files_list.setSelectionMode(QListWidget.MultiSelection)
-        files_layout.addWidget(self.files_list)
+        self._files_model = QStandardItemModel(self)
+        self.files_view = QListView()
+        self.files_view.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.files_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.files_view.setModel(self._files_model)
+        files_layout.addWidget(self.files_view)
         
         files_group.setLayout(files_layout)
         overlay_layout.addWidget(files_group)
@@ -1226,15 +1671,8 @@ class OverlaysTab(BaseWidget):
         
         # Режим наложения
         self.blend_mode = QComboBox()
-        self.blend_mode.addItems([
-            ("normal", "Обычный"),
-            ("screen", "Экран"),
-            ("overlay", "Перекрытие"),
-            ("multiply", "Умножение"),
-            ("add", "Сложение"),
-            ("lighten", "Осветление"),
-            ("darken", "Затемнение")
-        ])
+        for key, label in _BLEND_MODES:
+            self.blend_mode.addItem(label, key)
         self.blend_mode.setCurrentIndex(1)  # screen
         settings_layout.addRow("Режим наложения:", self.blend_mode)
         
@@ -1244,13 +1682,8 @@ class OverlaysTab(BaseWidget):
         
         # Позиция
         self.position_combo = QComboBox()
-        self.position_combo.addItems([
-            ("center", "По центру"),
-            ("top-left", "Сверху слева"),
-            ("top-right", "Сверху справа"),
-            ("bottom-left", "Снизу слева"),
-            ("bottom-right", "Снизу справа")
-        ])
+        for key, label in _POSITIONS:
+            self.position_combo.addItem(label, key)
         settings_layout.addRow("Позиция:", self.position_combo)
         
         # Масштаб
@@ -1280,12 +1713,8 @@ class OverlaysTab(BaseWidget):
         
         animation_layout.addWidget(QLabel("Тип анимации:"))
         self.animation_type = QComboBox()
-        self.animation_type.addItems([
-            ("fade", "Затухание"),
-            ("slide", "Сдвиг"),
-            ("zoom", "Масштабирование"),
-            ("rotate", "Вращение")
-        ])
+        for key, label in _ANIMATION_TYPES:
+            self.animation_type.addItem(label, key)
         animation_layout.addWidget(self.animation_type)
         animation_layout.addStretch()
         
@@ -1315,70 +1744,123 @@ class OverlaysTab(BaseWidget):
     def set_channels(self, channels: List[Channel]):
         """Устанавливает список каналов"""
         self.channels = channels
+        self._channels_by_name = {ch.name: ch for ch in channels}
         self._update_channel_combo()
     
     def _update_channel_combo(self):
         """Обновляет список каналов"""
-        current = self.channel_combo.currentText()
-        self.channel_combo.clear()
-        self.channel_combo.addItems([ch.name for ch in self.channels])
-        
-        if current in [ch.name for ch in self.channels]:
-            self.channel_combo.setCurrentText(current)
-    
+        self._in_programmatic_update = True
+        try:
+            _sync_combo_items(self.channel_combo, [ch.name for ch in self.channels])
+        finally:
+            self._in_programmatic_update = False
+        
+        # Один сигнал вместо сигналов от clear/addItems
+        self.channel_combo.currentTextChanged.emit(self.channel_combo.currentText())
+    
+    def reload_channel(self, channel: Channel):
+        """Перечитывает настройки канала, измененного в другой вкладке"""
+        if channel is self.current_channel:
+            self.current_channel = None
+            self._load_channel_overlays()
+    
+    @Slot(str)
     def _scan_overlay_folder(self, folder: str):
-        """Сканирует папку с оверлеями"""
-        if not folder:
+        """Запускает отложенное сканирование папки с оверлеями"""
+        self._pending_folder = folder
+        self._scan_timer.start()
+    
+    @Slot()
+    def _do_scan(self):
+        """Сканирует папку с оверлеями в пуле потоков"""
+        if not self._pending_folder:
             return
         
-        from utils import FileUtils
-        
-        overlay_files = []
-        folder_path = Path(folder)
-        
-        for file_path in folder_path.iterdir():
-            if file_path.is_file() and FileUtils.is_overlay(file_path):
-                overlay_files.append(file_path.name)
+        self._scan_task = OverlayScanTask(self._pending_folder)
+        self._scan_task.signals.finished.connect(self._on_scan_finished)
+        QThreadPool.globalInstance().start(self._scan_task)
+    
+    @Slot(str, list)
+    def _on_scan_finished(self, folder: str, overlay_files: list):
+        """Обработчик завершения сканирования"""
+        # Результат устарел, если папка уже сменилась
+        if folder != self._pending_folder:
+            return
         
-        self.overlay_files = sorted(overlay_files)
+        self.overlay_files = overlay_files
         self.files_info.setText(f"Файлов найдено: {len(self.overlay_files)}")
         
-        # Обновляем список
+        # Обновляем список (скрытая вкладка выделит файлы при показе)
         self._update_files_list()
+        if self.current_channel and not self._files_dirty:
+            self._select_channel_files()
+    
+    def showEvent(self, event):
+        """Применяет отложенные обновления при показе вкладки"""
+        super().showEvent(event)
+        if self._files_dirty:
+            self._files_dirty = False
+            self._update_files_list()
+            # Пересобранная модель теряет выделение файлов канала
+            if self.current_channel:
+                self._select_channel_files()
+        if self._dirty:
+            self._dirty = False
+            self._load_channel_overlays()
     
     def _update_files_list(self):
         """Обновляет список файлов"""
-        self.files_list.clear()
+        # Скрытая вкладка обновится при показе
+        if not self.isVisible():
+            self._files_dirty = True
+            return
         
+        # Модель пересобирается одним сбросом и одной вставкой строк
+        items = []
         for file_name in self.overlay_files:
-            # Добавляем иконку по типу файла
-            ext = Path(file_name).suffix.lower()
-            if ext == '.png':
-                icon = "🖼️"
-            elif ext in ['.mp4', '.mov']:
-                icon = "🎬"
-            elif ext == '.gif':
-                icon = "🎞️"
-            else:
-                icon = "📄"
-            
-            self.files_list.addItem(f"{icon} {file_name}")
-    
+            # Иконка по типу файла, имя файла хранится в UserRole
+            dot = file_name.rfind('.')
+            ext = file_name[dot:].lower() if dot >= 0 else ""
+            icon = _ICON_BY_EXT.get(ext, "📄")
+            item = QStandardItem(f"{icon} {file_name}")
+            item.setData(file_name, Qt.UserRole)
+            items.append(item)
+        
+        self._files_model.clear()
+        self._files_model.invisibleRootItem().appendRows(items)
+    
+    @Slot(bool)
     def _on_animate_toggled(self, checked: bool):
         """Обработчик переключения анимации"""
         self.animation_widget.setVisible(checked)
     
+    @Slot()
     def _load_channel_overlays(self):
         """Загружает настройки оверлеев канала"""
+        # Изменения списка каналов загружаются одним вызовом после обновления
+        if self._in_programmatic_update:
+            return
+        
+        # Скрытая вкладка загрузится при показе
+        if not self.isVisible():
+            self._dirty = True
+            return
+        
         channel_name = self.channel_combo.currentText()
         if not channel_name:
+            self.current_channel = None
             self.overlay_widget.setVisible(False)
             return
         
-        self.current_channel = next((ch for ch in self.channels if ch.name == channel_name), None)
-        if not self.current_channel:
+        channel = self._channels_by_name.get(channel_name)
+        if not channel:
             return
         
+        # Тот же канал уже загружен
+        if channel is self.current_channel:
+            return
+        self.current_channel = channel
+        
         self.overlay_widget.setVisible(True)
         overlays = self.current_channel.overlays
         
@@ -1386,41 +1868,23 @@ class OverlaysTab(BaseWidget):
         if overlays.folder:
             self.folder_selector.set_path(overlays.folder)
         
-        # Режим наложения
-        for i in range(self.blend_mode.count()):
-            if self.blend_mode.itemData(i) == overlays.blend_mode:
-                self.blend_mode.setCurrentIndex(i)
-                break
+        _load_bindings(self, self._BINDINGS, overlays)
+        self.animation_widget.setVisible(self.animate_check.isChecked())
         
-        self.opacity_slider.setValue(overlays.opacity)
+        self._select_channel_files()
+    
+    def _select_channel_files(self):
+        """Выделяет файлы оверлеев текущего канала"""
+        wanted = set(self.current_channel.overlays.files)
+        selection = QItemSelection()
+        for row in range(self._files_model.rowCount()):
+            index = self._files_model.index(row, 0)
+            if index.data(Qt.UserRole) in wanted:
+                selection.select(index, index)
         
-        # Позиция
-        for i in range(self.position_combo.count()):
-            if self.position_combo.itemData(i) == overlays.position:
-                self.position_combo.setCurrentIndex(i)
-                break
-        
-        self.scale_slider.setValue(overlays.scale)
-        self.rotation_slider.setValue(overlays.rotation)
-        self.randomize_check.setChecked(overlays.randomize)
-        self.stretch_check.setChecked(overlays.stretch)
-        self.animate_check.setChecked(overlays.animate)
-        
-        # Тип анимации
-        for i in range(self.animation_type.count()):
-            if self.animation_type.itemData(i) == overlays.animation_type:
-                self.animation_type.setCurrentIndex(i)
-                break
-        
-        # Выделяем выбранные файлы
-        self.files_list.clearSelection()
-        for i in range(self.files_list.count()):
-            item_text = self.files_list.item(i).text()
-            # Убираем иконку для сравнения
-            file_name = item_text.split(' ', 1)[1] if ' ' in item_text else item_text
-            if file_name in overlays.files:
-                self.files_list.item(i).setSelected(True)
+        self.files_view.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
     
+    @Slot()
     def _save_overlays(self):
         """Сохраняет настройки оверлеев"""
         if not self.current_channel:
@@ -1428,30 +1892,28 @@ class OverlaysTab(BaseWidget):
             return
         
         # Собираем выбранные файлы
-        selected_files = []
-        for item in self.files_list.selectedItems():
-            # Убираем иконку
-            text = item.text()
-            file_name = text.split(' ', 1)[1] if ' ' in text else text
-            selected_files.append(file_name)
+        selected = sorted(self.files_view.selectionModel().selectedIndexes(), key=lambda idx: idx.row())
+        selected_files = [index.data(Qt.UserRole) for index in selected]
         
         overlays = self.current_channel.overlays
         
+        # Пропускаем сохранение и валидацию, если ничего не изменилось
+        folder = self.folder_selector.get_path()
+        if (set(selected_files) == set(overlays.files)
+                and overlays.enabled == bool(selected_files)
+                and folder == overlays.folder
+                and not _bindings_changed(self, self._BINDINGS, overlays)):
+            self.show_info("Нет изменений для сохранения")
+            return
+        
         overlays.enabled = len(selected_files) > 0
-        overlays.folder = self.folder_selector.get_path()
+        overlays.folder = folder
         overlays.files = selected_files
-        overlays.blend_mode = self.blend_mode.currentData()
-        overlays.opacity = self.opacity_slider.value()
-        overlays.position = self.position_combo.currentData()
-        overlays.scale = self.scale_slider.value()
-        overlays.rotation = self.rotation_slider.value()
-        overlays.randomize = self.randomize_check.isChecked()
-        overlays.stretch = self.stretch_check.isChecked()
-        overlays.animate = self.animate_check.isChecked()
-        overlays.animation_type = self.animation_type.currentData()
+        _save_bindings(self, self._BINDINGS, overlays)
         
         # Валидация
         overlays.validate()
+        self.channel_edited.emit(self.current_channel)
         
         self.show_info(f"Настройки оверлеев для канала '{self.current_channel.name}' сохранены")
 
@@ -1462,8 +1924,48 @@ class SettingsTab(BaseWidget):
     
     settings_changed = Signal()
     
+    # Текст о GPU общий для всех экземпляров вкладки
+    _gpu_text: Optional[str] = None
+    
+    # Подписи GPU кодеков: (ключ FFmpegUtils.check_gpu_support, текст)
+    _GPU_LABELS = (
+        ("nvidia", "✅ NVIDIA"),
+        ("amd", "✅ AMD"),
+        ("intel", "✅ Intel"),
+        ("videotoolbox", "✅ VideoToolbox"),
+        ("vaapi", "✅ VAAPI"),
+        ("vulkan", "✅ Vulkan")
+    )
+    
+    # Поле настроек: (ключ, атрибут виджета, геттер, сеттер, значение по умолчанию)
+    _FIELDS = (
+        ("use_gpu", "use_gpu_check", "isChecked", "setChecked", True),
+        ("two_pass", "two_pass_check", "isChecked", "setChecked", False),
+        ("preview_resolution", "preview_res", "currentText", "setCurrentText", "480p"),
+        ("safe_filenames", "safe_filenames", "isChecked", "setChecked", True),
+        ("keep_temp_files", "keep_temp_files", "isChecked", "setChecked", False),
+        ("auto_cleanup", "auto_cleanup", "isChecked", "setChecked", False),
+        ("show_tooltips", "show_tooltips", "isChecked", "setChecked", True),
+        ("dark_theme", "dark_theme", "isChecked", "setChecked", True)
+    )
+    _GETTERS = tuple(
+        (key, operator.attrgetter(widget_attr), operator.methodcaller(getter))
+        for key, widget_attr, getter, _, _ in _FIELDS
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        
+        # Серия изменений за 200 мс сливается в одно сохранение
+        self._last_settings_hash: Optional[int] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(200)
+        self._emit_timer.timeout.connect(self._emit_settings_changed)
+        
+        # Диалог выбора файла создается при первом экспорте/импорте
+        self._file_dialog: Optional[QFileDialog] = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -1621,42 +2123,36 @@ Enhanced Python Edition v5.0.0<br><br>
     
     def load_settings(self, settings: dict):
         """Загружает настройки"""
-        from utils import FFmpegUtils
-        
-        self.ffmpeg_selector.set_path(
-            settings.get("ffmpeg_path", FFmpegUtils.get_ffmpeg_path())
-        )
-        self.use_gpu_check.setChecked(settings.get("use_gpu", True))
-        self.two_pass_check.setChecked(settings.get("two_pass", False))
-        self.preview_res.setCurrentText(settings.get("preview_resolution", "480p"))
-        self.safe_filenames.setChecked(settings.get("safe_filenames", True))
-        self.keep_temp_files.setChecked(settings.get("keep_temp_files", False))
-        self.auto_cleanup.setChecked(settings.get("auto_cleanup", False))
-        self.show_tooltips.setChecked(settings.get("show_tooltips", True))
-        self.dark_theme.setChecked(settings.get("dark_theme", True))
+        # Сигналы виджетов блокируются на время загрузки: об изменении
+        # сообщают вызывающие методы одним settings_changed
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(QSignalBlocker(self.ffmpeg_selector))
+            self.ffmpeg_selector.set_path(
+                settings.get("ffmpeg_path", FFmpegUtils.get_ffmpeg_path())
+            )
+            for key, widget_attr, _, setter, default in self._FIELDS:
+                widget = getattr(self, widget_attr)
+                stack.enter_context(QSignalBlocker(widget))
+                getattr(widget, setter)(settings.get(key, default))
     
     def get_settings(self) -> dict:
         """Возвращает текущие настройки"""
-        return {
-            "ffmpeg_path": self.ffmpeg_selector.get_path(),
-            "use_gpu": self.use_gpu_check.isChecked(),
-            "two_pass": self.two_pass_check.isChecked(),
-            "preview_resolution": self.preview_res.currentText(),
-            "safe_filenames": self.safe_filenames.isChecked(),
-            "keep_temp_files": self.keep_temp_files.isChecked(),
-            "auto_cleanup": self.auto_cleanup.isChecked(),
-            "show_tooltips": self.show_tooltips.isChecked(),
-            "dark_theme": self.dark_theme.isChecked()
-        }
+        settings = {"ffmpeg_path": self.ffmpeg_selector.get_path()}
+        for key, widget, getter in self._GETTERS:
+            settings[key] = getter(widget(self))
+        return settings
     
     def _check_ffmpeg(self):
         """Проверяет FFmpeg"""
-        from utils import FFmpegUtils
-        
         ffmpeg_path = self.ffmpeg_selector.get_path()
         if not ffmpeg_path:
             ffmpeg_path = FFmpegUtils.get_ffmpeg_path()
         
+        # Бинарник мог быть заменён - повторяем пробы
+        FFmpegUtils.clear_probe_cache()
+        SettingsTab._gpu_text = None
+        self._check_gpu_support()
+        
         version = FFmpegUtils.get_ffmpeg_version()
         if version:
             self.show_info(f"FFmpeg найден!\n{version}")
@@ -1665,179 +2161,119 @@ Enhanced Python Edition v5.0.0<br><br>
     
     def _check_gpu_support(self):
         """Проверяет поддержку GPU"""
-        from utils import FFmpegUtils
-        
-        gpu_support = FFmpegUtils.check_gpu_support()
-        
-        gpu_text = []
-        if gpu_support.get('nvidia'):
-            gpu_text.append("✅ NVIDIA")
-        if gpu_support.get('amd'):
-            gpu_text.append("✅ AMD")
-        if gpu_support.get('intel'):
-            gpu_text.append("✅ Intel")
-        if gpu_support.get('videotoolbox'):
-            gpu_text.append("✅ VideoToolbox")
-        
-        if not gpu_text:
-            gpu_text.append("❌ GPU ускорение недоступно")
+        if SettingsTab._gpu_text is None:
+            gpu_support = FFmpegUtils.check_gpu_support()
+            parts = [
+                label for key, label in self._GPU_LABELS if gpu_support.get(key)
+            ] or ["❌ GPU ускорение недоступно"]
+            SettingsTab._gpu_text = " • ".join(parts)
+        
+        self.gpu_info.setText(SettingsTab._gpu_text)
+    
+    def _settings_hash(self) -> int:
+        """Хэш текущих настроек (все значения - bool/str)"""
+        return hash(tuple(sorted(self.get_settings().items())))
+    
+    def mark_saved(self):
+        """Запоминает текущие настройки как уже сохраненные"""
+        self._last_settings_hash = self._settings_hash()
+    
+    def _emit_settings_changed(self):
+        """Отправляет settings_changed, только если настройки действительно изменились"""
+        settings_hash = self._settings_hash()
+        if settings_hash == self._last_settings_hash:
+            return
         
-        self.gpu_info.setText(" • ".join(gpu_text))
+        self._last_settings_hash = settings_hash
+        self.settings_changed.emit()
     
     def _save_settings(self):
         """Сохраняет настройки"""
-        self.settings_changed.emit()
+        if self._settings_hash() == self._last_settings_hash:
+            self.show_info("Нет изменений для сохранения")
+            return
+        
+        self._emit_timer.start()
         self.show_info("Настройки сохранены")
     
     def _reset_settings(self):
         """Сбрасывает настройки"""
         if self.confirm_action("Сбросить все настройки к значениям по умолчанию?"):
-            from models import DataManager
             data_manager = DataManager()
             default_settings = data_manager.get_default_settings()
             self.load_settings(default_settings)
-            self.settings_changed.emit()
+            self._emit_timer.start()
             self.show_info("Настройки сброшены")
     
+    def _choose_json_file(self, title: str, accept_mode: QFileDialog.AcceptMode,
+                          file_name: str = "") -> str:
+        """Показывает переиспользуемый диалог выбора JSON файла"""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setNameFilter("JSON files (*.json)")
+            self._file_dialog.setDefaultSuffix("json")
+        
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setAcceptMode(accept_mode)
+        dialog.setFileMode(
+            QFileDialog.FileMode.AnyFile
+            if accept_mode == QFileDialog.AcceptMode.AcceptSave
+            else QFileDialog.FileMode.ExistingFile
+        )
+        dialog.selectFile(file_name)
+        
+        if dialog.exec():
+            return dialog.selectedFiles()[0]
+        return ""
+    
     def _export_settings(self):
         """Экспортирует настройки"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Экспорт настроек",
-            f"settings_{time.strftime('%Y%m%d_%H%M%S')}.json",
-            "JSON files (*.json)"
+        file_path = self._choose_json_file(
+            "Экспорт настроек", QFileDialog.AcceptMode.AcceptSave,
+            f"settings_{time.strftime('%Y%m%d_%H%M%S')}.json"
         )
         
         if file_path:
-            import json
             settings = self.get_settings()
             
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(settings, f, indent=2, ensure_ascii=False)
+                write_file_atomic(file_path, json_dumps(settings))
                 self.show_info(f"Настройки экспортированы: {file_path}")
             except Exception as e:
                 self.show_error(f"Ошибка экспорта: {str(e)}")
     
     def _import_settings(self):
         """Импортирует настройки"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Импорт настроек",
-            "", "JSON files (*.json)"
+        file_path = self._choose_json_file(
+            "Импорт настроек", QFileDialog.AcceptMode.AcceptOpen
         )
         
         if file_path:
-            import json
-            
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                settings = _read_settings_file(file_path)
                 
                 self.load_settings(settings)
-                self.settings_changed.emit()
+                self._emit_timer.start()
                 self.show_info("Настройки импортированы")
             except Exception as e:
                 self.show_error(f"Ошибка импорта: {str(e)}")
-                ken_burns = [eid for eid, w in self.kb_effects.items() if w.isChecked()]
-        effects.ken_burns_intensity = self.kb_intensity.value()
-        effects.rotation_angle = self.kb_rotation.value()
-        effects.kb_smooth_factor = self.kb_smooth.value() / 100.0
-        effects.kb_randomize = self.kb_randomize.isChecked()
-        effects.smart_crop = self.kb_smart_crop.isChecked()
-        effects.easing_type = self.kb_easing.currentText()
-        
-        # Переходы
-        effects.transitions = [tid for tid, w in self.transitions.items() if w.isChecked()]
-        effects.transition_duration = self.trans_duration.value()
-        effects.trans_overlap = self.trans_overlap.value()
-        effects.trans_randomize = self.trans_randomize.isChecked()
-        
-        # Fade
-        effects.fade_in_from_black = self.fade_in_check.isChecked()
-        effects.fade_in_duration = self.fade_in_duration.value()
-        effects.fade_in_type = self.fade_in_type.currentText()
-        effects.fade_out_to_black = self.fade_out_check.isChecked()
-        effects.fade_out_duration = self.fade_out_duration.value()
-        effects.fade_out_type = self.fade_out_type.currentText()
-        effects.add_black_frame = self.add_black_frame.isChecked()
-        
-        # Цветокоррекция
-        effects.color_correction = self.color_correction.isChecked()
-        effects.color_filter = self.color_filter.currentText()
-        effects.vignette = self.vignette_check.isChecked()
-        effects.vignette_intensity = self.vignette_intensity.value()
-        effects.grain = self.grain_check.isChecked()
-        effects.grain_intensity = self.grain_intensity.value()
-        effects.blur_edges = self.blur_edges_check.isChecked()
-        effects.blur_intensity = self.blur_intensity.value()
-        
-        # Аудио
-        effects.audio_pitch = self.audio_pitch.currentText()
-        effects.audio_effect = self.audio_effect.currentText()
-        effects.audio_stereo_enhance = self.audio_stereo.isChecked()
-        effects.audio_normalize = self.audio_normalize.isChecked()
-        effects.audio_compressor = self.audio_compressor.isChecked()
-        effects.audio_limiter = self.audio_limiter.isChecked()
-        
-        # Анимация
-        effects.motion_blur = self.motion_blur.isChecked()
-        effects.motion_blur_amount = self.motion_blur_amount.value()
-        effects.enable_3d_parallax = self.parallax_enabled.isChecked()
-        effects.parallax_depth_layers = self.parallax_layers.value()
-        effects.parallax_speed = self.parallax_speed.value()
-        effects.parallax_direction = self.parallax_direction.currentText()
-        
-        # Валидация
-        effects.validate()
-        
-        self.show_info(f"Настройки эффектов для канала '{self.current_channel.name}' сохранены")
-    
-    def _copy_effects(self):
-        # Заглушка для копирования эффектов
-        print("Копирование эффектов не реализовано")
-
-    def _reset_effects(self):
-        """Сбрасывает настройки эффектов"""
-        if not self.current_channel:
-            return
-        
-        if self.confirm_action("Сбросить все настройки эффектов к значениям по умолчанию?"):
-            self.current_channel.effects = EffectSettings()
-            self._load_channel_effects()
-            self.show_info("Настройки эффектов сброшены")
-    
-    def _copy_effects(self):
-        """Копирует эффекты в другой канал"""
-        if not self.current_channel:
-            return
-        
-        other_channels = [ch for ch in self.channels if ch.id != self.current_channel.id]
-        if not other_channels:
-            self.show_info("Нет других каналов для копирования")
-            return
-        
-        channel_names = [ch.name for ch in other_channels]
-        target_name, ok = QInputDialog.getItem(
-            self, "Копирование настроек",
-            "Выберите канал для копирования настроек:",
-            channel_names, 0, False
-        )
-        
-        if ok and target_name:
-            target_channel = next((ch for ch in other_channels if ch.name == target_name), None)
-            if target_channel:
-                from dataclasses import asdict
-                target_channel.effects = EffectSettings(**asdict(self.current_channel.effects))
-                self.show_info(f"Настройки скопированы в канал '{target_name}'")
 
 # ==================== ВКЛАДКА CAPCUT ЭФФЕКТОВ ====================
 
 class CapCutTab(BaseWidget):
     """Вкладка CapCut эффектов"""
     
+    preset_applied = Signal(str)
+    channel_edited = Signal(object)  # Channel
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.channels: List[Channel] = []
         self.current_channel: Optional[Channel] = None
+        self._channels_by_name: Dict[str, Channel] = {}
+        self._in_programmatic_update = False
+        self._loaded_effects: Optional[EffectSettings] = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -1848,6 +2284,7 @@ class CapCutTab(BaseWidget):
         channel_layout.addWidget(QLabel("📺 Канал:"))
         
         self.channel_combo = QComboBox()
+        self.channel_combo.setModel(QStringListModel(self.channel_combo))
         self.channel_combo.currentTextChanged.connect(self._load_channel_effects)
         channel_layout.addWidget(self.channel_combo)
         channel_layout.addStretch()
@@ -1879,6 +2316,7 @@ class CapCutTab(BaseWidget):
             widget = EffectCheckBox(effect_id, label, desc)
             self.scale_effects[effect_id] = widget
             scale_grid.addWidget(widget, i // 2, i % 2)
+        self._scale_items = tuple(self.scale_effects.items())
         
         scale_layout.addLayout(scale_grid)
         
@@ -1918,6 +2356,7 @@ class CapCutTab(BaseWidget):
             widget = EffectCheckBox(effect_id, label, desc)
             self.motion_effects[effect_id] = widget
             motion_grid.addWidget(widget, i // 2, i % 2)
+        self._motion_items = tuple(self.motion_effects.items())
         
         motion_layout.addLayout(motion_grid)
         
@@ -1951,6 +2390,7 @@ class CapCutTab(BaseWidget):
             widget = EffectCheckBox(effect_id, label, desc)
             self.digital_effects[effect_id] = widget
             digital_grid.addWidget(widget, i // 2, i % 2)
+        self._digital_items = tuple(self.digital_effects.items())
         
         digital_layout.addLayout(digital_grid)
         digital_group.setLayout(digital_layout)
@@ -1961,12 +2401,8 @@ class CapCutTab(BaseWidget):
         frequency_layout = QFormLayout()
         
         self.effect_frequency = QComboBox()
-        self.effect_frequency.addItems([
-            ("all", "Ко всем клипам"),
-            ("percent", "К проценту клипов"),
-            ("every", "К каждому N-му клипу"),
-            ("random", "Случайно")
-        ])
+        for key, label in _EFFECT_FREQUENCIES:
+            self.effect_frequency.addItem(label, key)
         self.effect_frequency.currentIndexChanged.connect(self._on_frequency_changed)
         frequency_layout.addRow("Применять:", self.effect_frequency)
         
@@ -1998,12 +2434,8 @@ class CapCutTab(BaseWidget):
         
         # Тайминг
         self.capcut_timing = QComboBox()
-        self.capcut_timing.addItems([
-            ("start", "В начале клипа"),
-            ("middle", "В середине клипа"),
-            ("end", "В конце клипа"),
-            ("random", "Случайно")
-        ])
+        for key, label in _CAPCUT_TIMINGS:
+            self.capcut_timing.addItem(label, key)
         frequency_layout.addRow("Момент применения:", self.capcut_timing)
         
         self.avoid_repetition = QCheckBox("Избегать повторения эффектов подряд")
@@ -2026,7 +2458,7 @@ class CapCutTab(BaseWidget):
         
         for preset_id, label in presets:
             btn = QPushButton(label)
-            btn.clicked.connect(lambda checked, p=preset_id: self._apply_preset(p))
+            btn.clicked.connect(partial(self._apply_preset, preset_id))
             presets_layout.addWidget(btn)
         
         presets_layout.addStretch()
@@ -2044,74 +2476,160 @@ class CapCutTab(BaseWidget):
         
         layout.addWidget(scroll)
         self.setLayout(layout)
+        
+        # Виджеты, сигналы которых блокируются при массовой установке значений
+        self._bulk_widgets = (
+            *self.scale_effects.values(),
+            *self.motion_effects.values(),
+            *self.digital_effects.values(),
+            self.scale_amplitude, self.zoom_burst_start, self.zoom_burst_decay,
+            self.motion_intensity, self.effect_frequency, self.effect_percent,
+            self.effect_every, self.capcut_timing, self.avoid_repetition
+        )
     
     def set_channels(self, channels: List[Channel]):
         """Устанавливает список каналов"""
         self.channels = channels
+        self._channels_by_name = {ch.name: ch for ch in channels}
         self._update_channel_combo()
     
     def _update_channel_combo(self):
         """Обновляет список каналов"""
-        current = self.channel_combo.currentText()
-        self.channel_combo.clear()
-        self.channel_combo.addItems([ch.name for ch in self.channels])
-        
-        if current in [ch.name for ch in self.channels]:
-            self.channel_combo.setCurrentText(current)
+        self._in_programmatic_update = True
+        try:
+            _sync_combo_items(self.channel_combo, [ch.name for ch in self.channels])
+        finally:
+            self._in_programmatic_update = False
+        
+        # Один сигнал вместо сигналов от clear/addItems
+        self.channel_combo.currentTextChanged.emit(self.channel_combo.currentText())
+    
+    def reload_channel(self, channel: Channel):
+        """Перечитывает настройки канала, измененного в другой вкладке"""
+        if channel is self.current_channel:
+            self._loaded_effects = None
+            self._load_channel_effects()
     
+    @Slot(int)
     def _on_frequency_changed(self, index: int):
         """Обработчик изменения частоты"""
         frequency = self.effect_frequency.currentData()
         self.percent_widget.setVisible(frequency == "percent")
         self.every_widget.setVisible(frequency == "every")
     
+    def _set_bulk_signals_blocked(self, blocked: bool):
+        """Блокирует или разблокирует сигналы виджетов эффектов"""
+        for widget in self._bulk_widgets:
+            widget.blockSignals(blocked)
+    
+    @Slot(str)
+    def _apply_preset(self, preset_id: str, checked: bool = False):
+        """Применяет пресет эффектов (checked - аргумент сигнала clicked)"""
+        preset = _PRESETS.get(preset_id)
+        if not preset:
+            return
+        
+        self._set_bulk_signals_blocked(True)
+        try:
+            # Наборы эффектов пресета (frozenset возвращается без копирования)
+            scale_set = frozenset(preset.get("scale", ()))
+            motion_set = frozenset(preset.get("motion", ()))
+            digital_set = frozenset(preset.get("digital", ()))
+            
+            for effect_id, widget in self._scale_items:
+                widget.setChecked(effect_id in scale_set)
+            
+            for effect_id, widget in self._motion_items:
+                widget.setChecked(effect_id in motion_set)
+            
+            for effect_id, widget in self._digital_items:
+                widget.setChecked(effect_id in digital_set)
+            
+            self.scale_amplitude.setValue(preset.get("scale_amplitude", 15))
+            
+            if "zoom_burst_start" in preset:
+                self.zoom_burst_start.setValue(preset["zoom_burst_start"])
+            if "zoom_burst_decay" in preset:
+                self.zoom_burst_decay.setValue(preset["zoom_burst_decay"])
+            
+            self.motion_intensity.setValue(preset.get("motion_intensity", 30))
+            
+            # Частота
+            select_combo_data(self.effect_frequency, preset.get("frequency"), "all")
+            
+            if "percent" in preset:
+                self.effect_percent.setValue(preset["percent"])
+            if "every" in preset:
+                self.effect_every.setValue(preset["every"])
+            
+            # Тайминг
+            select_combo_data(self.capcut_timing, preset.get("timing"), "start")
+        finally:
+            self._set_bulk_signals_blocked(False)
+        
+        # Сигналы были заблокированы: обновляем зависимые виджеты один раз
+        self._on_frequency_changed(self.effect_frequency.currentIndex())
+        self.preset_applied.emit(preset_id)
+        
+        self.show_info(f"Применен пресет '{preset_id}'")
+    
+    @Slot()
     def _load_channel_effects(self):
         """Загружает эффекты канала"""
+        # Изменения списка каналов загружаются одним вызовом после обновления
+        if self._in_programmatic_update:
+            return
+        
         channel_name = self.channel_combo.currentText()
         if not channel_name:
             return
         
-        self.current_channel = next((ch for ch in self.channels if ch.name == channel_name), None)
-        if not self.current_channel:
+        channel = self._channels_by_name.get(channel_name)
+        if not channel:
             return
+        self.current_channel = channel
         
         effects = self.current_channel.effects
         
-        # Загружаем эффекты
-        for effect_id, widget in self.scale_effects.items():
-            widget.setChecked(effect_id in effects.capcut_effects)
-        
-        for effect_id, widget in self.motion_effects.items():
-            widget.setChecked(effect_id in effects.motion_effects)
-        
-        for effect_id, widget in self.digital_effects.items():
-            widget.setChecked(
-                effect_id in effects.capcut_effects or 
-                effect_id in effects.motion_effects
-            )
+        # Настройки уже загружены в виджеты (другие вкладки заменяют effects целиком)
+        if effects is self._loaded_effects:
+            return
+        self._loaded_effects = effects
         
-        # Настройки
-        self.scale_amplitude.setValue(effects.scale_amplitude)
-        self.zoom_burst_start.setValue(effects.zoom_burst_start)
-        self.zoom_burst_decay.setValue(effects.zoom_burst_decay)
-        if hasattr(self, "motion_intensity"):
+        self._set_bulk_signals_blocked(True)
+        try:
+            # Загружаем эффекты
+            capcut_set = set(effects.capcut_effects)
+            motion_set = set(effects.motion_effects)
+            
+            for effect_id, widget in self._scale_items:
+                widget.setChecked(effect_id in capcut_set)
+            
+            for effect_id, widget in self._motion_items:
+                widget.setChecked(effect_id in motion_set)
+            
+            for effect_id, widget in self._digital_items:
+                widget.setChecked(effect_id in capcut_set or effect_id in motion_set)
+            
+            # Настройки
+            self.scale_amplitude.setValue(effects.scale_amplitude)
+            self.zoom_burst_start.setValue(effects.zoom_burst_start)
+            self.zoom_burst_decay.setValue(effects.zoom_burst_decay)
             self.motion_intensity.setValue(effects.motion_intensity)
+            
+            # Частота
+            select_combo_data(self.effect_frequency, effects.effect_frequency, "all")
+            
+            self.effect_percent.setValue(effects.effect_percent)
+            self.effect_every.setValue(effects.effect_every)
+            
+            select_combo_data(self.capcut_timing, effects.capcut_timing, "start")
+            
+            self.avoid_repetition.setChecked(effects.avoid_repetition)
+        finally:
+            self._set_bulk_signals_blocked(False)
         
-        # Частота
-        for i in range(self.effect_frequency.count()):
-            if self.effect_frequency.itemData(i) == effects.effect_frequency:
-                self.effect_frequency.setCurrentIndex(i)
-                break
-        
-        self.effect_percent.setValue(effects.effect_percent)
-        self.effect_every.setValue(effects.effect_every)
-        
-        for i in range(self.capcut_timing.count()):
-            if self.capcut_timing.itemData(i) == effects.capcut_timing:
-                self.capcut_timing.setCurrentIndex(i)
-                break
-        
-        self.avoid_repetition.setChecked(effects.avoid_repetition)
+        self._on_frequency_changed(self.effect_frequency.currentIndex())
     
     def _copy_effects(self):
         # Заглушка для копирования эффектов
@@ -2121,47 +2639,44 @@ class CapCutTab(BaseWidget):
         # Заглушка для сброса эффектов
         print("Сброс эффектов не реализован")
 
+    @Slot()
     def _save_effects(self):
         """Сохраняет эффекты"""
         if not self.current_channel:
             self.show_warning("Выберите канал")
             return
         
-        effects = self.current_channel.effects
-        
         # Собираем выбранные эффекты
-        capcut_effects = []
-        motion_effects = []
-        
-        for effect_id, widget in self.scale_effects.items():
-            if widget.isChecked():
-                capcut_effects.append(effect_id)
-        
-        for effect_id, widget in self.motion_effects.items():
-            if widget.isChecked():
-                motion_effects.append(effect_id)
-        
-        for effect_id, widget in self.digital_effects.items():
-            if widget.isChecked() and effect_id not in capcut_effects:
-                capcut_effects.append(effect_id)
-        
-        # Обновляем настройки
-        effects.capcut_effects = capcut_effects
-        effects.motion_effects = motion_effects
-        effects.scale_amplitude = self.scale_amplitude.value()
-        effects.zoom_burst_start = self.zoom_burst_start.value()
-        effects.zoom_burst_decay = self.zoom_burst_decay.value()
-        if hasattr(self, "motion_intensity"):
-            effects.motion_intensity = self.motion_intensity.value()
-        else:
-            effects.motion_intensity = 30
-        effects.effect_frequency = self.effect_frequency.currentData()
-        effects.effect_percent = self.effect_percent.value()
-        effects.effect_every = self.effect_every.value()
-        effects.capcut_timing = self.capcut_timing.currentData()
-        effects.avoid_repetition = self.avoid_repetition.isChecked()
+        capcut_effects = [eid for eid, w in self._scale_items if w.isChecked()]
+        motion_effects = [eid for eid, w in self._motion_items if w.isChecked()]
+        capcut_effects += [
+            eid for eid, w in self._digital_items
+            if w.isChecked() and eid not in capcut_effects
+        ]
         
-        # Валидация
-        effects.validate()
+        pending = {
+            "capcut_effects": capcut_effects,
+            "motion_effects": motion_effects,
+            "scale_amplitude": self.scale_amplitude.value(),
+            "zoom_burst_start": self.zoom_burst_start.value(),
+            "zoom_burst_decay": self.zoom_burst_decay.value(),
+            "motion_intensity": self.motion_intensity.value(),
+            "effect_frequency": self.effect_frequency.currentData(),
+            "effect_percent": self.effect_percent.value(),
+            "effect_every": self.effect_every.value(),
+            "capcut_timing": self.capcut_timing.currentData(),
+            "avoid_repetition": self.avoid_repetition.isChecked()
+        }
+        
+        # Применяем к копии: при ошибке валидации канал остается прежним
+        try:
+            effects = replace(self.current_channel.effects)
+            effects.apply(pending)
+            effects.validate()
+        except Exception as e:
+            self.show_error(f"Ошибка сохранения эффектов: {str(e)}")
+            return
         
+        self.current_channel.effects = self._loaded_effects = effects
+        self.channel_edited.emit(self.current_channel)
         self.show_info(f"CapCut эффекты для канала '{self.current_channel.name}' сохранены")
\ No newline at end of file
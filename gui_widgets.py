@@ -6,6 +6,8 @@
 
 import time
 import logging
+import contextlib
+from types import MappingProxyType
 from typing import List, Dict, Optional, Set
 from pathlib import Path
 
@@ -13,217 +15,345 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 
-from models import Channel, EffectSettings, ExportSettings, OverlaySettings
-from gui_base import BaseWidget
+from models import Channel, ChannelTag, ChannelsDelta, EffectSettings, ExportSettings, OverlaySettings
+from gui_base import BaseWidget, select_combo_data
 
 logger = logging.getLogger(__name__)
 
+# ==================== СПРАВОЧНИКИ ====================
+
+_TEMPLATE_CHOICES = (
+    ("youtube", "YouTube (16:9)"),
+    ("shorts", "Shorts/Reels (9:16)"),
+    ("instagram", "Instagram (1:1)"),
+    ("cinematic", "Cinematic (21:9)"),
+    ("custom", "Пользовательский")
+)
+
+# Параметры экспорта по шаблону канала
+_TEMPLATE_SETTINGS = MappingProxyType({
+    "youtube": {"resolution": "1920x1080", "fps": 30, "bitrate": 8},
+    "shorts": {"resolution": "1080x1920", "fps": 30, "bitrate": 10},
+    "instagram": {"resolution": "1080x1080", "fps": 30, "bitrate": 6},
+    "cinematic": {"resolution": "3840x2160", "fps": 24, "bitrate": 20}
+})
+
+_QUALITY_PRESETS = (
+    ("veryfast", "Очень быстро"),
+    ("faster", "Быстро"),
+    ("fast", "Быстро+"),
+    ("medium", "Баланс"),
+    ("slow", "Качество"),
+    ("slower", "Качество+"),
+    ("veryslow", "Максимум")
+)
+
 # ==================== КАРТОЧКИ КАНАЛОВ ====================
 
-class ChannelCard(QFrame):
-    """Карточка канала для отображения в списке"""
+# Иконки шаблонов каналов
+_TEMPLATE_ICONS = MappingProxyType({
+    "youtube": "📺",
+    "shorts": "📱",
+    "instagram": "📷",
+    "cinematic": "🎬"
+})
+_DEFAULT_ICON = "📹"
+
+# Отрисованные эмодзи: (символ, размер, devicePixelRatio) -> QPixmap
+_EMOJI_PIXMAP_CACHE: Dict[tuple, QPixmap] = {}
+
+def _emoji_pixmap(emoji: str, size: int, ratio: Optional[float] = None) -> QPixmap:
+    """Возвращает эмодзи, отрисованный в QPixmap (один раз на символ и размер)"""
+    if ratio is None:
+        screen = QGuiApplication.primaryScreen()
+        ratio = screen.devicePixelRatio() if screen else 1.0
+    
+    key = (emoji, size, ratio)
+    pixmap = _EMOJI_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(int(size * ratio), int(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        font = QFont()
+        font.setPixelSize(int(size * 0.8))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, emoji)
+        painter.end()
+        
+        _EMOJI_PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+def _tag_pixmap(text: str, color: str, width: int, height: int, font: QFont,
+                ratio: float) -> QPixmap:
+    """Возвращает отрисованный тег эффекта из общего QPixmapCache"""
+    key = f"tag:{text}:{color}:{width}x{height}@{ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        background = QColor(color)
+        background.setAlpha(0x22)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(0, 0, width, height), height / 2, height / 2)
+        painter.setPen(QColor(color))
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignCenter, text)
+        painter.end()
+        
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+# Теги карточки по битам Channel.tag_bits: (бит, текст, цвет)
+_TAG_STYLES = (
+    (ChannelTag.KEN_BURNS, "Ken Burns", "#00d4aa"),
+    (ChannelTag.CAPCUT, "CapCut FX", "#ff4fe6"),
+    (ChannelTag.OVERLAY, "Оверлеи", "#4fc3f7"),
+    (ChannelTag.PARALLAX, "3D", "#ffd54f")
+)
+
+def _channel_tags(channel: Channel) -> List[tuple]:
+    """Возвращает теги эффектов канала: (текст, цвет)"""
+    bits = channel.tag_bits
+    tags = [(text, color) for flag, text, color in _TAG_STYLES if bits & flag]
+    if bits & ChannelTag.COLOR:
+        tags.append((channel.effects.color_filter.title(), "#ab47bc"))
+    return tags
+
+class ChannelListModel(QAbstractListModel):
+    """Модель списка каналов для QListView"""
     
-    clicked = Signal()
-    edit_requested = Signal(str)
-    delete_requested = Signal(str)
-    duplicate_requested = Signal(str)
-    export_requested = Signal(str)
+    ChannelRole = Qt.UserRole + 1
     
-    def __init__(self, channel: Channel, selected: bool = False, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.channel = channel
-        self.selected = selected
-        self.setup_ui()
-        self.update_style()
+        self._channels: List[Channel] = []
+        self._rows: Dict[str, int] = {}
+    
+    def set_channels(self, channels: List[Channel]) -> bool:
+        """Устанавливает каналы; возвращает True, если модель была сброшена"""
+        if [ch.id for ch in channels] == [ch.id for ch in self._channels]:
+            # Тот же состав - только перерисовка, выбор в представлении сохраняется
+            self._channels = list(channels)
+            if channels:
+                self.dataChanged.emit(self.index(0), self.index(len(channels) - 1))
+            return False
+        
+        self.beginResetModel()
+        self._channels = list(channels)
+        self._rows = {ch.id: row for row, ch in enumerate(self._channels)}
+        self.endResetModel()
+        return True
+    
+    def apply_delta(self, delta: ChannelsDelta, channels: List[Channel]) -> bool:
+        """Применяет точечное изменение; возвращает True, если модель была сброшена"""
+        row = delta.index
+        if delta.kind == "add" and row == len(self._channels) == len(channels) - 1:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._channels = list(channels)
+            self._rows[delta.channel.id] = row
+            self.endInsertRows()
+            return False
+        
+        if delta.kind == "remove" and row is not None and row < len(self._channels) \
+                and len(channels) == len(self._channels) - 1:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._channels = list(channels)
+            self._rows = {ch.id: i for i, ch in enumerate(self._channels)}
+            self.endRemoveRows()
+            return False
+        
+        if delta.kind == "update" and row is not None and len(channels) == len(self._channels) \
+                and self._channels[row].id == channels[row].id:
+            self._channels = list(channels)
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return False
+        
+        # Несогласованное изменение - полное обновление
+        return self.set_channels(channels)
+    
+    def channel_index(self, channel_id: str) -> QModelIndex:
+        """Возвращает индекс канала по ID"""
+        row = self._rows.get(channel_id)
+        return self.index(row) if row is not None else QModelIndex()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._channels)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        channel = self._channels[index.row()]
+        if role == self.ChannelRole:
+            return channel
+        if role == Qt.DisplayRole:
+            return channel.name
+        if role == Qt.ToolTipRole:
+            return channel.description or None
+        return None
+
+class ChannelCardDelegate(QStyledItemDelegate):
+    """Отрисовка карточки канала без отдельных виджетов на каждую карточку"""
+    
+    action_triggered = Signal(str, str)  # действие, ID канала
+    
+    WIDTH = 340
+    PADDING = 12
+    SPACING = 6
+    ICON_SIZE = 24
+    TITLE_HEIGHT = 28
+    INFO_HEIGHT = 16
+    TAG_HEIGHT = 20
+    BUTTON_SIZE = 24
+    HEIGHT = PADDING * 2 + TITLE_HEIGHT + INFO_HEIGHT * 2 + TAG_HEIGHT + SPACING * 3
+    
+    # Действия карточки: (действие, глиф, подсказка)
+    ACTIONS = (
+        ("edit", "✏️", "Редактировать канал"),
+        ("duplicate", "📋", "Дублировать канал"),
+        ("export", "📤", "Экспортировать канал"),
+        ("delete", "🗑️", "Удалить канал")
+    )
     
-    def setup_ui(self):
-        self.setFrameStyle(QFrame.Box)
-        layout = QVBoxLayout()
-        layout.setSpacing(8)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        base_font = parent.font() if parent else QFont()
+        self._title_font = QFont(base_font)
+        self._title_font.setPixelSize(14)
+        self._title_font.setBold(True)
+        self._info_font = QFont(base_font)
+        self._info_font.setPixelSize(11)
+        self._title_metrics = QFontMetrics(self._title_font)
+        self._info_metrics = QFontMetrics(self._info_font)
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(self.WIDTH, self.HEIGHT)
+    
+    def _button_rects(self, rect: QRect) -> List[tuple]:
+        """Прямоугольники кнопок действий: (действие, глиф, подсказка, QRect)"""
+        x = rect.right() - self.PADDING - len(self.ACTIONS) * self.BUTTON_SIZE
+        y = rect.top() + self.PADDING + (self.TITLE_HEIGHT - self.BUTTON_SIZE) // 2
+        return [
+            (action, glyph, tooltip,
+             QRect(x + i * self.BUTTON_SIZE, y, self.BUTTON_SIZE, self.BUTTON_SIZE))
+            for i, (action, glyph, tooltip) in enumerate(self.ACTIONS)
+        ]
+    
+    def _action_at(self, rect: QRect, pos: QPoint) -> Optional[tuple]:
+        """Возвращает (действие, подсказка) под точкой"""
+        for action, _glyph, tooltip, button_rect in self._button_rects(rect):
+            if button_rect.contains(pos):
+                return action, tooltip
+        return None
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        channel = index.data(ChannelListModel.ChannelRole)
+        if channel is None:
+            return
         
-        # Заголовок с кнопками действий
-        header_layout = QHBoxLayout()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        ratio = painter.device().devicePixelRatioF()
+        
+        # Фон карточки
+        rect = QRectF(option.rect).adjusted(1, 1, -1, -1)
+        if option.state & QStyle.State_Selected:
+            painter.setPen(QPen(QColor("#00d4aa"), 2))
+            painter.setBrush(QColor(0x00, 0xd4, 0xaa, 0x22))
+        elif option.state & QStyle.State_MouseOver:
+            painter.setPen(QPen(QColor("#555"), 1))
+            painter.setBrush(QColor("#3d3d3d"))
+        else:
+            painter.setPen(QPen(QColor("#444"), 1))
+            painter.setBrush(QColor("#2d2d2d"))
+        painter.drawRoundedRect(rect, 8, 8)
         
-        # Иконка и название
-        icon_label = QLabel()
-        icon_map = {
-            "youtube": "📺",
-            "shorts": "📱", 
-            "instagram": "📷",
-            "cinematic": "🎬"
-        }
-        icon = icon_map.get(self.channel.template, "📹")
-        icon_label.setText(icon)
-        icon_label.setStyleSheet("font-size: 20px;")
-        header_layout.addWidget(icon_label)
+        content = option.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        x, y, width = content.left(), content.top(), content.width()
         
-        name_label = QLabel(self.channel.name)
-        name_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-        header_layout.addWidget(name_label)
+        # Иконка и название
+        icon = _TEMPLATE_ICONS.get(channel.template, _DEFAULT_ICON)
+        painter.drawPixmap(
+            x, y + (self.TITLE_HEIGHT - self.ICON_SIZE) // 2,
+            _emoji_pixmap(icon, self.ICON_SIZE, ratio)
+        )
         
-        header_layout.addStretch()
+        buttons = self._button_rects(option.rect)
+        title_rect = QRect(x + 34, y, buttons[0][3].left() - x - 34 - self.SPACING,
+                           self.TITLE_HEIGHT)
+        painter.setPen(QColor("#e0e0e0"))
+        painter.setFont(self._title_font)
+        painter.drawText(
+            title_rect, Qt.AlignVCenter,
+            self._title_metrics.elidedText(channel.name, Qt.ElideRight, title_rect.width())
+        )
         
         # Кнопки действий
-        self._create_action_buttons(header_layout)
-        
-        layout.addLayout(header_layout)
+        for _action, glyph, _tooltip, button_rect in buttons:
+            painter.drawPixmap(button_rect.adjusted(4, 4, -4, -4), _emoji_pixmap(glyph, 16, ratio))
+        y += self.TITLE_HEIGHT + self.SPACING
+        
+        # Описание и информация о настройках
+        painter.setFont(self._info_font)
+        painter.setPen(QColor("#888"))
+        if channel.description:
+            painter.drawText(
+                QRect(x, y, width, self.INFO_HEIGHT), Qt.AlignVCenter,
+                self._info_metrics.elidedText(channel.description, Qt.ElideRight, width)
+            )
+        y += self.INFO_HEIGHT
         
-        # Описание
-        if self.channel.description:
-            desc_label = QLabel(self.channel.description)
-            desc_label.setObjectName("infoLabel")
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
-        
-        # Информация о настройках
-        info_label = QLabel(
-            f"{self.channel.export.resolution} • "
-            f"{self.channel.export.fps}fps • "
-            f"{self.channel.export.bitrate}Mbps"
+        export = channel.export
+        painter.drawText(
+            QRect(x, y, width, self.INFO_HEIGHT), Qt.AlignVCenter,
+            f"{export.resolution} • {export.fps}fps • {export.bitrate}Mbps"
         )
-        info_label.setObjectName("infoLabel")
-        layout.addWidget(info_label)
-        
-        # Теги эффектов
-        tags_widget = self._create_tags_widget()
-        layout.addWidget(tags_widget)
+        y += self.INFO_HEIGHT + self.SPACING
         
-        self.setLayout(layout)
-    
-    def _create_action_buttons(self, layout: QHBoxLayout):
-        """Создает кнопки действий"""
-        button_style = """
-            QPushButton {
-                background: transparent;
-                border: none;
-                font-size: 16px;
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-            }
-        """
-        
-        # Кнопка редактирования
-        edit_btn = QPushButton("✏️")
-        edit_btn.setToolTip("Редактировать канал")
-        edit_btn.setStyleSheet(button_style)
-        edit_btn.setFixedSize(28, 28)
-        edit_btn.clicked.connect(lambda: self.edit_requested.emit(self.channel.id))
-        layout.addWidget(edit_btn)
-        
-        # Кнопка дублирования
-        duplicate_btn = QPushButton("📋")
-        duplicate_btn.setToolTip("Дублировать канал")
-        duplicate_btn.setStyleSheet(button_style)
-        duplicate_btn.setFixedSize(28, 28)
-        duplicate_btn.clicked.connect(lambda: self.duplicate_requested.emit(self.channel.id))
-        layout.addWidget(duplicate_btn)
-        
-        # Кнопка экспорта
-        export_btn = QPushButton("📤")
-        export_btn.setToolTip("Экспортировать канал")
-        export_btn.setStyleSheet(button_style)
-        export_btn.setFixedSize(28, 28)
-        export_btn.clicked.connect(lambda: self.export_requested.emit(self.channel.id))
-        layout.addWidget(export_btn)
-        
-        # Кнопка удаления
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Удалить канал")
-        delete_btn.setStyleSheet(button_style + """
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
-        delete_btn.setFixedSize(28, 28)
-        delete_btn.clicked.connect(lambda: self.delete_requested.emit(self.channel.id))
-        layout.addWidget(delete_btn)
-    
-    def _create_tags_widget(self) -> QWidget:
-        """Создает виджет с тегами эффектов"""
-        widget = QWidget()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(4)
-        
-        tag_style = """
-            QLabel {
-                padding: 2px 8px;
-                border-radius: 10px;
-                font-size: 11px;
-            }
-        """
-        
-        # Ken Burns
-        if self.channel.effects.ken_burns:
-            tag = QLabel("Ken Burns")
-            tag.setStyleSheet(tag_style + "background: #00d4aa22; color: #00d4aa;")
-            layout.addWidget(tag)
-        
-        # CapCut FX
-        if self.channel.effects.capcut_effects:
-            tag = QLabel("CapCut FX")
-            tag.setStyleSheet(tag_style + "background: #ff4fe622; color: #ff4fe6;")
-            layout.addWidget(tag)
-        
-        # Оверлеи
-        if self.channel.overlays.enabled:
-            tag = QLabel("Оверлеи")
-            tag.setStyleSheet(tag_style + "background: #4fc3f722; color: #4fc3f7;")
-            layout.addWidget(tag)
-        
-        # 3D
-        if self.channel.effects.enable_3d_parallax:
-            tag = QLabel("3D")
-            tag.setStyleSheet(tag_style + "background: #ffd54f22; color: #ffd54f;")
-            layout.addWidget(tag)
-        
-        # Цветокоррекция
-        if self.channel.effects.color_correction:
-            tag = QLabel(self.channel.effects.color_filter.title())
-            tag.setStyleSheet(tag_style + "background: #ab47bc22; color: #ab47bc;")
-            layout.addWidget(tag)
-        
-        layout.addStretch()
-        widget.setLayout(layout)
-        return widget
-    
-    def update_style(self):
-        """Обновляет стиль карточки"""
-        if self.selected:
-            self.setStyleSheet("""
-                ChannelCard {
-                    background-color: #00d4aa22;
-                    border: 2px solid #00d4aa;
-                    border-radius: 8px;
-                    padding: 12px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                ChannelCard {
-                    background-color: #2d2d2d;
-                    border: 1px solid #444;
-                    border-radius: 8px;
-                    padding: 12px;
-                }
-                ChannelCard:hover {
-                    background-color: #3d3d3d;
-                    border-color: #555;
-                }
-            """)
-    
-    def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-    
-    def set_selected(self, selected: bool):
-        """Устанавливает состояние выбора"""
-        self.selected = selected
-        self.update_style()
+        # Теги эффектов (не поместившиеся в строку не рисуются)
+        tag_x = x
+        for text, color in _channel_tags(channel):
+            tag_width = self._info_metrics.horizontalAdvance(text) + 16
+            if tag_x + tag_width > content.right():
+                break
+            painter.drawPixmap(
+                tag_x, y,
+                _tag_pixmap(text, color, tag_width, self.TAG_HEIGHT, self._info_font, ratio)
+            )
+            tag_x += tag_width + 4
+        
+        painter.restore()
+    
+    def editorEvent(self, event: QEvent, model: QAbstractItemModel,
+                    option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease,
+                            QEvent.MouseButtonDblClick) and event.button() == Qt.LeftButton:
+            hit = self._action_at(option.rect, event.position().toPoint())
+            if hit:
+                # Нажатие на кнопку действия не меняет выбор
+                if event.type() == QEvent.MouseButtonRelease:
+                    channel = index.data(ChannelListModel.ChannelRole)
+                    self.action_triggered.emit(hit[0], channel.id)
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(self, event: QHelpEvent, view: QAbstractItemView,
+                  option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        hit = self._action_at(option.rect, event.pos())
+        if hit:
+            QToolTip.showText(event.globalPos(), hit[1], view)
+            return True
+        return super().helpEvent(event, view, option, index)
 
 # ==================== ДИАЛОГ КАНАЛА ====================
 
@@ -260,13 +390,8 @@ class ChannelDialog(QDialog):
         info_layout.addRow("Описание:", self.description_edit)
         
         self.template_combo = QComboBox()
-        self.template_combo.addItems([
-            ("youtube", "YouTube (16:9)"),
-            ("shorts", "Shorts/Reels (9:16)"),
-            ("instagram", "Instagram (1:1)"),
-            ("cinematic", "Cinematic (21:9)"),
-            ("custom", "Пользовательский")
-        ])
+        for key, label in _TEMPLATE_CHOICES:
+            self.template_combo.addItem(label, key)
         self.template_combo.currentIndexChanged.connect(self._on_template_changed)
         info_layout.addRow("Шаблон:", self.template_combo)
         
@@ -325,16 +450,9 @@ class ChannelDialog(QDialog):
         
         # Качество
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems([
-            ("veryfast", "Очень быстро"),
-            ("faster", "Быстро"),
-            ("fast", "Быстро+"),
-            ("medium", "Баланс"),
-            ("slow", "Качество"),
-            ("slower", "Качество+"),
-            ("veryslow", "Максимум")
-        ])
-        self.quality_combo.setCurrentIndex(3)  # medium
+        for key, label in _QUALITY_PRESETS:
+            self.quality_combo.addItem(label, key)
+        select_combo_data(self.quality_combo, "medium")
         export_layout.addRow("Пресет качества:", self.quality_combo)
         
         export_group.setLayout(export_layout)
@@ -379,18 +497,13 @@ class ChannelDialog(QDialog):
     
     def _on_template_changed(self, index: int):
         """Обработчик изменения шаблона"""
-        template = self.template_combo.currentData()
-        
-        template_settings = {
-            "youtube": {"resolution": "1920x1080", "fps": 30, "bitrate": 8},
-            "shorts": {"resolution": "1080x1920", "fps": 30, "bitrate": 10},
-            "instagram": {"resolution": "1080x1080", "fps": 30, "bitrate": 6},
-            "cinematic": {"resolution": "3840x2160", "fps": 24, "bitrate": 20}
-        }
+        settings = _TEMPLATE_SETTINGS.get(self.template_combo.currentData())
+        if settings is None:
+            return
         
-        if template in template_settings:
-            settings = template_settings[template]
-            self.resolution_combo.setCurrentText(settings["resolution"])
+        # Сигналы resolution_combo не блокируются: он скрывает поля custom-разрешения
+        self.resolution_combo.setCurrentText(settings["resolution"])
+        with QSignalBlocker(self.fps_spin), QSignalBlocker(self.bitrate_spin):
             self.fps_spin.setValue(settings["fps"])
             self.bitrate_spin.setValue(settings["bitrate"])
     
@@ -415,10 +528,7 @@ class ChannelDialog(QDialog):
         self.description_edit.setText(self.channel.description)
         
         # Находим соответствующий шаблон
-        for i in range(self.template_combo.count()):
-            if self.template_combo.itemData(i) == self.channel.template:
-                self.template_combo.setCurrentIndex(i)
-                break
+        select_combo_data(self.template_combo, self.channel.template)
         
         # Экспорт настройки
         self.resolution_combo.setCurrentText(self.channel.export.resolution)
@@ -430,10 +540,7 @@ class ChannelDialog(QDialog):
         self.bitrate_spin.setValue(self.channel.export.bitrate)
         
         # Находим качество
-        for i in range(self.quality_combo.count()):
-            if self.quality_combo.itemData(i) == self.channel.export.quality.preset:
-                self.quality_combo.setCurrentIndex(i)
-                break
+        select_combo_data(self.quality_combo, self.channel.export.quality.preset)
         
         # Эффекты
         self.enable_ken_burns.setChecked(bool(self.channel.effects.ken_burns))
@@ -499,6 +606,20 @@ class ChannelDialog(QDialog):
 
 # ==================== ПАНЕЛЬ ПРОЕКТА ====================
 
+# Шаблон результатов сканирования
+_INFO_TMPL = """📊 Результаты сканирования:
+
+✅ Изображений: {images}
+🎥 Видео: {videos}
+🎵 Аудио файлов: {audio}
+📎 Готовых пар: {pairs}
+
+Формат файлов:
+• Изображения: 0001_image.jpg + 0001_audio.mp3
+• Видео: 0002_video.mp4 + 0002_audio.mp3
+
+Статус: {status}"""
+
 class ProjectInfoPanel(BaseWidget):
     """Панель информации о проекте"""
     
@@ -508,6 +629,7 @@ class ProjectInfoPanel(BaseWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.project_folder = None
+        self._last_info_text = ""
         self.setup_ui()
     
     def setup_ui(self):
@@ -546,11 +668,20 @@ class ProjectInfoPanel(BaseWidget):
         info_group = QGroupBox("📊 Информация о проекте")
         info_layout = QVBoxLayout()
         
-        self.info_text = QTextEdit()
-        self.info_text.setReadOnly(True)
-        self.info_text.setMaximumHeight(150)
-        self.info_text.setPlainText("Выберите папку проекта и нажмите 'Сканировать'")
-        info_layout.addWidget(self.info_text)
+        # Текст только для чтения - QLabel без QTextDocument
+        self.info_text = QLabel("Выберите папку проекта и нажмите 'Сканировать'")
+        self.info_text.setObjectName("projectInfo")
+        self.info_text.setTextFormat(Qt.PlainText)
+        self.info_text.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.info_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        
+        # Высота ограничена областью прокрутки, чтобы последние строки не обрезались
+        info_scroll = QScrollArea()
+        info_scroll.setWidgetResizable(True)
+        info_scroll.setFrameShape(QFrame.NoFrame)
+        info_scroll.setMaximumHeight(150)
+        info_scroll.setWidget(self.info_text)
+        info_layout.addWidget(info_scroll)
         
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
@@ -576,20 +707,20 @@ class ProjectInfoPanel(BaseWidget):
     
     def update_info(self, scan_result: Dict[str, int]):
         """Обновляет информацию о проекте"""
-        info_text = f"""📊 Результаты сканирования:
-
-✅ Изображений: {scan_result.get('images', 0)}
-🎥 Видео: {scan_result.get('videos', 0)}
-🎵 Аудио файлов: {scan_result.get('audio', 0)}
-📎 Готовых пар: {scan_result.get('pairs', 0)}
-
-Формат файлов:
-• Изображения: 0001_image.jpg + 0001_audio.mp3
-• Видео: 0002_video.mp4 + 0002_audio.mp3
-
-Статус: {'✅ Готово к генерации' if scan_result.get('pairs', 0) > 0 else '⚠️ Не найдено пар файлов'}"""
+        pairs = scan_result.get('pairs', 0)
+        text = _INFO_TMPL.format(
+            images=scan_result.get('images', 0),
+            videos=scan_result.get('videos', 0),
+            audio=scan_result.get('audio', 0),
+            pairs=pairs,
+            status='✅ Готово к генерации' if pairs > 0 else '⚠️ Не найдено пар файлов'
+        )
         
-        self.info_text.setPlainText(info_text)
+        # Повторное сканирование с тем же результатом не перерисовывает панель
+        if text == self._last_info_text:
+            return
+        self._last_info_text = text
+        self.info_text.setText(text)
     
     def get_include_videos(self) -> bool:
         """Возвращает флаг включения видео"""
@@ -600,13 +731,20 @@ class ProjectInfoPanel(BaseWidget):
 class ChannelSelectionPanel(BaseWidget):
     """Панель для выбора каналов для генерации"""
     
-    selection_changed = Signal(set)  # Set[str] - IDs выбранных каналов
+    selection_changed = Signal(frozenset)  # FrozenSet[str] - IDs выбранных каналов
+    edit_requested = Signal(str)
+    delete_requested = Signal(str)
+    duplicate_requested = Signal(str)
+    export_requested = Signal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.channels: List[Channel] = []
         self.selected_ids: Set[str] = set()
-        self.channel_cards: Dict[str, ChannelCard] = {}
+        # Пакетное изменение выбора: один сигнал в конце _batch_updates
+        self._batching = False
+        # Последний отправленный выбор (неизменяемый, передается без копирования)
+        self._last_emitted: frozenset = frozenset()
         self.setup_ui()
     
     def setup_ui(self):
@@ -631,17 +769,34 @@ class ChannelSelectionPanel(BaseWidget):
         
         layout.addLayout(header_layout)
         
-        # Прокручиваемая область для карточек
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        
-        self.cards_widget = QWidget()
-        self.cards_layout = QGridLayout()
-        self.cards_layout.setSpacing(10)
-        self.cards_widget.setLayout(self.cards_layout)
+        # Карточки рисуются делегатом; клик переключает выбор канала
+        self.model = ChannelListModel(self)
+        self.list_view = QListView()
+        self.list_view.setObjectName("channelList")
+        self.list_view.setModel(self.model)
+        self.list_view.setViewMode(QListView.IconMode)
+        self.list_view.setMovement(QListView.Static)
+        self.list_view.setResizeMode(QListView.Adjust)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(5)
+        self.list_view.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.list_view.customContextMenuRequested.connect(self._show_context_menu)
+        
+        # Один общий слот для действий всех карточек
+        self._action_signals = {
+            "edit": self.edit_requested,
+            "duplicate": self.duplicate_requested,
+            "export": self.export_requested,
+            "delete": self.delete_requested
+        }
+        self.delegate = ChannelCardDelegate(self.list_view)
+        self.delegate.action_triggered.connect(self._on_card_action)
+        self.list_view.setItemDelegate(self.delegate)
         
-        scroll.setWidget(self.cards_widget)
-        layout.addWidget(scroll)
+        self.list_view.selectionModel().selectionChanged.connect(self._on_view_selection_changed)
+        layout.addWidget(self.list_view)
         
         # Информация о выборе
         self.selection_info = QLabel("Выбрано каналов: 0")
@@ -653,62 +808,95 @@ class ChannelSelectionPanel(BaseWidget):
     def set_channels(self, channels: List[Channel]):
         """Устанавливает список каналов"""
         self.channels = channels
-        self._rebuild_cards()
-    
-    def _rebuild_cards(self):
-        """Перестраивает карточки каналов"""
-        # Очищаем старые карточки
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        self.channel_cards.clear()
-        
-        # Создаем новые карточки
-        columns = 2
-        for i, channel in enumerate(self.channels):
-            card = ChannelCard(channel, channel.id in self.selected_ids)
-            card.clicked.connect(lambda ch_id=channel.id: self._toggle_selection(ch_id))
-            
-            self.channel_cards[channel.id] = card
-            self.cards_layout.addWidget(card, i // columns, i % columns)
-        
-        # Добавляем растяжку в конец
-        self.cards_layout.setRowStretch(len(self.channels) // columns + 1, 1)
+        with self._batch_updates():
+            if self.model.set_channels(channels):
+                self._restore_selection()
+    
+    def apply_channels_delta(self, delta: ChannelsDelta, channels: List[Channel]):
+        """Применяет точечное изменение списка каналов без сброса модели"""
+        self.channels = channels
+        with self._batch_updates():
+            if delta.kind == "remove" and delta.channel is not None:
+                self.selected_ids.discard(delta.channel.id)
+            if self.model.apply_delta(delta, channels):
+                self._restore_selection()
+    
+    def _restore_selection(self):
+        """Восстанавливает выбор в представлении после сброса модели"""
+        if not self.selected_ids:
+            return
+        
+        selection = QItemSelection()
+        for channel_id in list(self.selected_ids):
+            index = self.model.channel_index(channel_id)
+            if index.isValid():
+                selection.select(index, index)
+            else:
+                # Канал удален
+                self.selected_ids.discard(channel_id)
+        
+        self.list_view.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+    
+    @contextlib.contextmanager
+    def _batch_updates(self):
+        """Объединяет изменения выбора: одна перерисовка и один сигнал в конце"""
+        self._batching = True
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.list_view.setUpdatesEnabled(True)
         
         self._update_selection_info()
+        self._emit_selection()
     
-    def _toggle_selection(self, channel_id: str):
-        """Переключает выбор канала"""
-        if channel_id in self.selected_ids:
-            self.selected_ids.remove(channel_id)
-        else:
-            self.selected_ids.add(channel_id)
+    def _on_view_selection_changed(self, selected: QItemSelection, deselected: QItemSelection):
+        """Применяет изменения выбора представления к selected_ids"""
+        for index in selected.indexes():
+            self.selected_ids.add(index.data(ChannelListModel.ChannelRole).id)
+        for index in deselected.indexes():
+            self.selected_ids.discard(index.data(ChannelListModel.ChannelRole).id)
         
-        # Обновляем визуальное состояние
-        if channel_id in self.channel_cards:
-            card = self.channel_cards[channel_id]
-            card.set_selected(channel_id in self.selected_ids)
+        if self._batching:
+            return
         
         self._update_selection_info()
-        self.selection_changed.emit(self.selected_ids.copy())
+        self._emit_selection()
+    
+    def _emit_selection(self):
+        """Отправляет selection_changed, если выбор отличается от отправленного"""
+        if self.selected_ids == self._last_emitted:
+            return
+        self._last_emitted = frozenset(self.selected_ids)
+        self.selection_changed.emit(self._last_emitted)
+    
+    def _on_card_action(self, action: str, channel_id: str):
+        """Передает действие карточки в сигнал панели"""
+        self._action_signals[action].emit(channel_id)
+    
+    def _show_context_menu(self, pos: QPoint):
+        """Показывает меню действий канала"""
+        index = self.list_view.indexAt(pos)
+        if not index.isValid():
+            return
+        
+        menu = QMenu(self)
+        for action, glyph, tooltip in ChannelCardDelegate.ACTIONS:
+            menu.addAction(f"{glyph} {tooltip}").setData(action)
+        
+        # Действие определяется по data() выбранного пункта - без замыканий на пункт
+        chosen = menu.exec(self.list_view.viewport().mapToGlobal(pos))
+        if chosen:
+            self._on_card_action(chosen.data(), index.data(ChannelListModel.ChannelRole).id)
     
     def select_all(self):
         """Выбирает все каналы"""
-        self.selected_ids = {ch.id for ch in self.channels}
-        for channel_id, card in self.channel_cards.items():
-            card.set_selected(True)
-        self._update_selection_info()
-        self.selection_changed.emit(self.selected_ids.copy())
+        self.list_view.selectAll()
     
     def deselect_all(self):
         """Снимает выделение со всех каналов"""
-        self.selected_ids.clear()
-        for card in self.channel_cards.values():
-            card.set_selected(False)
-        self._update_selection_info()
-        self.selection_changed.emit(self.selected_ids.copy())
+        self.list_view.clearSelection()
     
     def _update_selection_info(self):
         """Обновляет информацию о выборе"""
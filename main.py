@@ -10,6 +10,7 @@ Auto Montage Builder Pro - Enhanced Python Edition
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 # Добавляем текущую директорию в путь поиска модулей
@@ -20,16 +21,12 @@ def check_dependencies():
     """Проверяет наличие необходимых зависимостей"""
     missing_deps = []
     
-    # Проверяем PySide6
-    try:
-        import PySide6
-    except ImportError:
+    # Проверяем PySide6 (без загрузки модуля - его импортирует main_window)
+    if importlib.util.find_spec("PySide6") is None:
         missing_deps.append("PySide6")
     
     # Проверяем numpy (опционально)
-    try:
-        import numpy
-    except ImportError:
+    if importlib.util.find_spec("numpy") is None:
         print("Предупреждение: numpy не установлен. Некоторые функции могут быть недоступны.")
     
     if missing_deps:
@@ -39,28 +36,16 @@ def check_dependencies():
         sys.exit(1)
 
 # Проверяем FFmpeg
-def check_ffmpeg():
-    """Проверяет наличие FFmpeg"""
+def check_ffmpeg() -> bool:
+    """Проверяет наличие FFmpeg (диалог показывает главное окно)"""
     from utils import FFmpegUtils
     
     if not FFmpegUtils.check_ffmpeg_installed():
         print("Предупреждение: FFmpeg не найден в системе!")
         print("Скачайте FFmpeg с https://ffmpeg.org/download.html")
         print("и добавьте его в PATH или поместите в папку с программой.")
-        
-        # Показываем диалог
-        try:
-            from PySide6.QtWidgets import QApplication, QMessageBox
-            app = QApplication(sys.argv)
-            QMessageBox.warning(
-                None, 
-                "FFmpeg не найден",
-                "FFmpeg не найден в системе!\n\n"
-                "Скачайте FFmpeg с https://ffmpeg.org/download.html\n"
-                "и добавьте его в PATH или поместите в папку с программой."
-            )
-        except:
-            pass
+        return False
+    return True
 
 # Главная функция
 def main():
@@ -69,11 +54,11 @@ def main():
     check_dependencies()
     
     # Проверяем FFmpeg
-    check_ffmpeg()
+    ffmpeg_found = check_ffmpeg()
     
     # Импортируем и запускаем главное окно
     from main_window import main as run_app
-    run_app()
+    run_app(ffmpeg_missing=not ffmpeg_found)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
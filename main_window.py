@@ -7,6 +7,7 @@
 import sys
 import time
 import logging
+from collections import OrderedDict
 from typing import List, Optional
 from pathlib import Path
 
@@ -14,22 +15,70 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 
-from models import Channel, DataManager
+from models import Channel, ChannelsDelta, DataManager
 from engine import MontageEngine
-from gui_base import StyleManager, SignalEmitter, AboutDialog, ProgressDialog
+from gui_base import StyleManager, AboutDialog, ProgressDialog
 from gui_tabs import (
     GenerationTab, ChannelsTab, EffectsTab, 
     CapCutTab, OverlaysTab, SettingsTab
 )
-from utils import setup_logging
+from utils import setup_logging, SystemUtils, Converters
 
 logger = logging.getLogger(__name__)
 
+# Сколько движков (по папкам проекта) держать в кэше
+_ENGINE_CACHE_SIZE = 4
+
+# ==================== ТЕКСТЫ ====================
+
+_WELCOME_HTML = """
+<h2>Добро пожаловать в Auto Montage Builder Pro!</h2>
+<p>Для начала работы:</p>
+<ol>
+<li>Выберите папку проекта с медиа файлами</li>
+<li>Создайте или выберите каналы для генерации</li>
+<li>Настройте эффекты и параметры</li>
+<li>Нажмите "Создать монтаж"</li>
+</ol>
+<p><b>Совет:</b> Используйте тестовый режим для быстрой проверки настроек!</p>
+"""
+
+_HELP_HTML = """
+<h2>Справка по Auto Montage Builder Pro</h2>
+
+<h3>Подготовка файлов:</h3>
+<p>Файлы должны быть пронумерованы в формате:<br>
+<code>0001_image.jpg + 0001_audio.mp3</code><br>
+<code>0002_video.mp4 + 0002_audio.mp3</code></p>
+
+<h3>Горячие клавиши:</h3>
+<ul>
+<li><b>Ctrl+N</b> - Новый канал</li>
+<li><b>Ctrl+S</b> - Сохранить настройки</li>
+<li><b>Ctrl+G</b> - Начать генерацию</li>
+<li><b>F1</b> - Справка</li>
+</ul>
+
+<h3>Советы:</h3>
+<ul>
+<li>Используйте GPU ускорение для быстрой генерации</li>
+<li>Экспериментируйте с Ken Burns эффектами</li>
+<li>CapCut эффекты добавят динамики</li>
+<li>Сохраняйте пресеты для быстрого доступа</li>
+</ul>
+"""
+
 # ==================== ПОТОК ГЕНЕРАЦИИ ====================
 
 class GenerationThread(QThread):
     """Поток для генерации монтажа"""
     
+    # Сигналы объявлены на самом потоке - без промежуточного QObject
+    progress_updated = Signal(float, str)
+    log_message = Signal(str, str)
+    generation_finished = Signal(bool, str)
+    error_occurred = Signal(str)
+    
     def __init__(self, engine: MontageEngine, channels: List[Channel], 
                  test_mode: bool = False, process_audio: bool = True,
                  parent=None):
@@ -38,58 +87,80 @@ class GenerationThread(QThread):
         self.channels = channels
         self.test_mode = test_mode
         self.process_audio = process_audio
-        self.signals = SignalEmitter()
         self.is_cancelled = False
+        # Последняя отправка прогресса (для прореживания сигналов)
+        self._last_emit_ts = 0.0
+        self._last_emit_pct = -1
+        self._last_emit_msg = ""
+        # Масштаб прогресса текущего канала (для _on_engine_progress)
+        self._ch_base = 0.0
+        self._ch_denom = 1.0
+    
+    def _emit_progress(self, progress: float, message: str):
+        """Отправляет повторы того же сообщения не чаще 20 раз в секунду при том же целом проценте"""
+        now = time.monotonic()
+        percent = int(progress)
+        # Новое сообщение (заголовок канала, начало операции) отправляется всегда
+        if (message == self._last_emit_msg and percent == self._last_emit_pct
+                and now - self._last_emit_ts < 0.05):
+            return
+        
+        self._last_emit_ts = now
+        self._last_emit_pct = percent
+        self._last_emit_msg = message
+        self.progress_updated.emit(progress, message)
+        
+    def _on_engine_progress(self, progress: float, message: str):
+        """Пересчитывает прогресс канала в общий прогресс генерации"""
+        self._emit_progress(self._ch_base + progress / self._ch_denom, message)
         
     def run(self):
         try:
             # Подготовка аудио
             if self.process_audio and not self.test_mode:
-                self.signals.progress_updated.emit(0, "Подготовка аудио вариантов...")
+                self._emit_progress(0, "Подготовка аудио вариантов...")
                 success = self.engine.prepare_audio_variants(self.channels)
                 if not success or self.is_cancelled:
-                    self.signals.generation_finished.emit(
+                    self.generation_finished.emit(
                         False, "Ошибка подготовки аудио"
                     )
                     return
             
             # Генерация для каждого канала
             total_channels = len(self.channels)
+            self._ch_denom = max(total_channels, 1)
+            self.engine.set_progress_callback(self._on_engine_progress)
+            
             for i, channel in enumerate(self.channels):
                 if self.is_cancelled:
                     break
                 
                 channel_progress = (i / total_channels) * 100
-                self.signals.progress_updated.emit(
+                self._emit_progress(
                     channel_progress,
                     f"Генерация канала {i+1}/{total_channels}: {channel.name}"
                 )
                 
-                # Устанавливаем callback для прогресса внутри канала
-                def channel_progress_callback(progress, message):
-                    # Масштабируем прогресс канала
-                    total_progress = channel_progress + (progress / total_channels)
-                    self.signals.progress_updated.emit(total_progress, message)
-                
-                self.engine.set_progress_callback(channel_progress_callback)
+                # Прогресс внутри канала масштабируется в _on_engine_progress
+                self._ch_base = channel_progress
                 
                 # Генерируем монтаж
                 output_path = self.engine.generate_channel_montage(channel, self.test_mode)
                 
                 if not output_path:
-                    self.signals.generation_finished.emit(
+                    self.generation_finished.emit(
                         False, f"Ошибка генерации канала {channel.name}"
                     )
                     return
                 
-                self.signals.log_message.emit(
+                self.log_message.emit(
                     f"Канал '{channel.name}' готов: {output_path}", "info"
                 )
             
             if self.is_cancelled:
-                self.signals.generation_finished.emit(False, "Генерация отменена")
+                self.generation_finished.emit(False, "Генерация отменена")
             else:
-                self.signals.generation_finished.emit(
+                self.generation_finished.emit(
                     True, "Генерация завершена успешно!"
                 )
                 
@@ -97,13 +168,49 @@ class GenerationThread(QThread):
             import traceback
             error_details = traceback.format_exc()
             logger.error(f"Ошибка в потоке генерации: {error_details}")
-            self.signals.error_occurred.emit(str(e))
-            self.signals.generation_finished.emit(False, f"Ошибка: {str(e)}")
+            self.error_occurred.emit(str(e))
+            self.generation_finished.emit(False, f"Ошибка: {str(e)}")
     
     def cancel(self):
         """Отменяет генерацию"""
         self.is_cancelled = True
 
+# ==================== ФОНОВЫЕ ЗАДАЧИ ====================
+
+class ResourceSamplerSignals(QObject):
+    """Сигналы задачи опроса ресурсов"""
+    
+    sampled = Signal(str)  # текст для статус бара
+
+class ResourceSampler(QRunnable):
+    """Опрос памяти вне GUI потока (psutil может блокировать на десятки мс)"""
+    
+    def __init__(self, cpu_count: int):
+        super().__init__()
+        self.cpu_count = cpu_count
+        # Объем памяти не меняется: строка форматируется при первом опросе
+        self._mem_total_str: Optional[str] = None
+        self.signals = ResourceSamplerSignals()
+        # Одна задача переиспользуется таймером
+        self.setAutoDelete(False)
+    
+    def run(self):
+        text = ""
+        try:
+            mem_info = SystemUtils.get_memory_info()
+            if mem_info['total'] > 0:
+                if self._mem_total_str is None:
+                    self._mem_total_str = Converters.bytes_to_human(mem_info['total'])
+                mem_used = Converters.bytes_to_human(mem_info['used'])
+                text = (
+                    f"CPU: {self.cpu_count} | "
+                    f"RAM: {mem_used}/{self._mem_total_str} ({mem_info['percent']:.0f}%)"
+                )
+        except Exception as e:
+            logger.error(f"Ошибка опроса ресурсов: {str(e)}")
+        
+        self.signals.sampled.emit(text)
+
 # ==================== ГЛАВНОЕ ОКНО ====================
 
 class AutoMontageMainWindow(QMainWindow):
@@ -120,8 +227,17 @@ class AutoMontageMainWindow(QMainWindow):
         self.settings = {}
         self.project_folder = None
         self.engine = None
+        self._engine_cache: "OrderedDict[str, MontageEngine]" = OrderedDict()
         self.generation_thread = None
         
+        # Отложенное сохранение: пишутся только измененные данные
+        self._channels_dirty = False
+        self._settings_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
+        
         # Применяем тему
         self.setStyleSheet(StyleManager.get_dark_theme())
         
@@ -131,8 +247,9 @@ class AutoMontageMainWindow(QMainWindow):
         # Создаем интерфейс
         self.setup_ui()
         
-        # Центрируем окно
-        self.center_window()
+        # Центрируем окно (сохраненную геометрию восстановит showEvent)
+        if self._geom_cache is None:
+            self.center_window()
         
         # Показываем приветствие
         self.show_welcome_message()
@@ -162,18 +279,17 @@ class AutoMontageMainWindow(QMainWindow):
         self.channels_tab.channels_changed.connect(self.on_channels_changed)
         self.tabs.addTab(self.channels_tab, "📺 Каналы")
         
-        self.effects_tab = EffectsTab()
-        self.tabs.addTab(self.effects_tab, "🎨 Эффекты")
-        
-        self.capcut_tab = CapCutTab()
-        self.tabs.addTab(self.capcut_tab, "✨ CapCut FX")
-        
-        self.overlays_tab = OverlaysTab()
-        self.tabs.addTab(self.overlays_tab, "🎭 Оверлеи")
-        
-        self.settings_tab = SettingsTab()
-        self.settings_tab.settings_changed.connect(self.save_settings)
-        self.tabs.addTab(self.settings_tab, "⚙️ Настройки")
+        # Остальные вкладки создаются при первом открытии
+        self.effects_tab: Optional[EffectsTab] = None
+        self.capcut_tab: Optional[CapCutTab] = None
+        self.overlays_tab: Optional[OverlaysTab] = None
+        self.settings_tab: Optional[SettingsTab] = None
+        self._tab_factories = {}
+        self._add_lazy_tab("effects_tab", EffectsTab, "🎨 Эффекты")
+        self._add_lazy_tab("capcut_tab", CapCutTab, "✨ CapCut FX")
+        self._add_lazy_tab("overlays_tab", OverlaysTab, "🎭 Оверлеи")
+        self._add_lazy_tab("settings_tab", SettingsTab, "⚙️ Настройки")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         main_layout.addWidget(self.tabs)
         
@@ -188,16 +304,48 @@ class AutoMontageMainWindow(QMainWindow):
         # Подключаем сигналы
         self.connect_signals()
     
+    def _add_lazy_tab(self, attr: str, factory, title: str):
+        """Добавляет заглушку вкладки, создаваемой при первом открытии"""
+        index = self.tabs.addTab(QWidget(), title)
+        self._tab_factories[index] = (attr, factory)
+    
+    def _on_tab_changed(self, index: int):
+        """Создает вкладку при первом переходе на нее"""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        
+        attr, factory = entry
+        tab = factory()
+        setattr(self, attr, tab)
+        if tab is self.settings_tab:
+            tab.settings_changed.connect(self.save_settings)
+        else:
+            tab.channel_edited.connect(self.on_channel_edited)
+        self._load_tab_data(tab)
+        
+        # Заменяем заглушку без повторного currentChanged
+        with QSignalBlocker(self.tabs):
+            placeholder = self.tabs.widget(index)
+            title = self.tabs.tabText(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, title)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
+    def _load_tab_data(self, tab: QWidget):
+        """Передает текущие данные созданной вкладке"""
+        if tab is self.settings_tab:
+            tab.load_settings(self.settings)
+            tab.mark_saved()
+        else:
+            tab.set_channels(self.channels)
+    
     def create_header(self, layout: QVBoxLayout):
         """Создает заголовок приложения"""
         header = QWidget()
+        # Стиль #header - в общей теме
         header.setObjectName("header")
-        header.setStyleSheet("""
-            #header {
-                background-color: #0d0d0d;
-                border-bottom: 2px solid #00d4aa;
-            }
-        """)
         
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(20, 10, 20, 10)
@@ -259,7 +407,10 @@ class AutoMontageMainWindow(QMainWindow):
         self.resource_info = QLabel("")
         self.status_bar.addPermanentWidget(self.resource_info)
         
-        # Обновляем информацию о ресурсах
+        # Опрос ресурсов в пуле потоков; количество ядер не меняется
+        self._resource_sampler = ResourceSampler(SystemUtils.get_cpu_count())
+        self._resource_sampler.signals.sampled.connect(self._on_resources_sampled)
+        self._resource_sampling = False
         self.update_resource_info()
         
         # Таймер для обновления ресурсов
@@ -273,6 +424,9 @@ class AutoMontageMainWindow(QMainWindow):
         project_panel = self.generation_tab.get_project_info_panel()
         project_panel.folder_changed.connect(self.on_project_folder_changed)
         project_panel.scan_requested.connect(self.scan_project)
+        
+        # Отмена генерации (подключается один раз; без активного потока - no-op)
+        self.generation_tab.cancel_btn.clicked.connect(self.cancel_generation)
     
     def center_window(self):
         """Центрирует окно на экране"""
@@ -290,43 +444,99 @@ class AutoMontageMainWindow(QMainWindow):
         
         # Загружаем настройки
         self.settings = self.data_manager.load_settings()
+        
+        # Геометрия окна декодируется один раз, а не при каждом показе
+        self._geom_cache = self._decode_setting_bytes('window_geometry')
+        self._state_cache = self._decode_setting_bytes('window_state')
     
-    def save_data(self):
-        """Сохраняет данные приложения"""
+    def _decode_setting_bytes(self, key: str) -> Optional[QByteArray]:
+        """Декодирует base64-значение настроек в QByteArray"""
+        value = self.settings.get(key)
+        if not value:
+            return None
+        try:
+            return QByteArray.fromBase64(value.encode())
+        except Exception:
+            return None
+    
+    def _flush_save(self):
+        """Сохраняет измененные данные приложения"""
         # Сохраняем каналы
-        self.data_manager.save_channels(self.channels)
+        if self._channels_dirty:
+            self._channels_dirty = False
+            self.data_manager.save_channels(self.channels)
         
         # Сохраняем настройки
-        self.data_manager.save_settings(self.settings)
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self.data_manager.save_settings(self.settings)
     
     def update_tabs_data(self):
         """Обновляет данные во всех вкладках"""
         self.generation_tab.set_channels(self.channels)
         self.channels_tab.set_channels(self.channels)
-        self.effects_tab.set_channels(self.channels)
-        self.capcut_tab.set_channels(self.channels)
-        self.overlays_tab.set_channels(self.channels)
-        self.settings_tab.load_settings(self.settings)
+        for tab in (self.effects_tab, self.capcut_tab, self.overlays_tab, self.settings_tab):
+            if tab is not None:
+                self._load_tab_data(tab)
     
-    def on_channels_changed(self):
+    def on_channels_changed(self, delta: ChannelsDelta):
         """Обработчик изменения каналов"""
         # Получаем обновленные каналы из вкладки
         self.channels = self.channels_tab.channels
-        self.save_data()
-        self.update_tabs_data()
+        self._channels_dirty = True
+        self._save_timer.start()
+        
+        # Вкладка каналов уже обновлена, настройки не менялись
+        if delta.kind == "reset":
+            self.generation_tab.set_channels(self.channels)
+        else:
+            self.generation_tab.apply_channels_delta(delta, self.channels)
+        
+        # Списки каналов в комбобоксах синхронизируются по разнице
+        for tab in (self.effects_tab, self.capcut_tab, self.overlays_tab):
+            if tab is not None:
+                tab.set_channels(self.channels)
+    
+    def on_channel_edited(self, channel: Channel):
+        """Обработчик изменения настроек канала во вкладках эффектов и оверлеев"""
+        # Вкладки меняют канал на месте: список тот же, нужно только записать его
+        self._channels_dirty = True
+        self._save_timer.start()
+        
+        # Остальные созданные вкладки перечитывают канал, иначе их виджеты
+        # вернут старые значения при следующем сохранении
+        source = self.sender()
+        for tab in (self.effects_tab, self.capcut_tab, self.overlays_tab):
+            if tab is not None and tab is not source:
+                tab.reload_channel(channel)
     
     def save_settings(self):
         """Сохраняет настройки"""
-        self.settings = self.settings_tab.get_settings()
-        self.save_data()
+        # Пока вкладка настроек не создана, настройки меняются только в self.settings
+        if self.settings_tab is not None:
+            self.settings = self.settings_tab.get_settings()
+        self._settings_dirty = True
+        self._save_timer.start()
     
     def on_project_folder_changed(self, folder: str):
         """Обработчик изменения папки проекта"""
+        folder = str(Path(folder).resolve())
+        if folder == self.project_folder and self.engine is not None:
+            return
+        
         self.project_folder = folder
         self.project_info.setText(f"Проект: {Path(folder).name}")
         
-        # Создаем движок для проекта
-        self.engine = MontageEngine(folder)
+        # Движок создается один раз на папку (LRU по последним папкам)
+        engine = self._engine_cache.get(folder)
+        if engine is None:
+            engine = MontageEngine(folder)
+            self._engine_cache[folder] = engine
+            if len(self._engine_cache) > _ENGINE_CACHE_SIZE:
+                self._engine_cache.popitem(last=False)
+        else:
+            self._engine_cache.move_to_end(folder)
+        self.engine = engine
     
     def scan_project(self):
         """Сканирует проект"""
@@ -366,24 +576,20 @@ class AutoMontageMainWindow(QMainWindow):
             self.engine, channels, test_mode, process_audio
         )
         
-        # Подключаем сигналы
-        self.generation_thread.signals.progress_updated.connect(
-            self.generation_tab.update_progress
+        # Подключаем сигналы (слоты выполняются в GUI потоке)
+        self.generation_thread.progress_updated.connect(
+            self.generation_tab.update_progress, Qt.QueuedConnection
         )
-        self.generation_thread.signals.log_message.connect(
-            self.generation_tab.add_log_message
+        self.generation_thread.log_message.connect(
+            self.generation_tab.add_log_message, Qt.QueuedConnection
         )
-        self.generation_thread.signals.generation_finished.connect(
-            self.on_generation_finished
+        self.generation_thread.generation_finished.connect(
+            self.on_generation_finished, Qt.QueuedConnection
         )
-        self.generation_thread.signals.error_occurred.connect(
-            self.on_generation_error
+        self.generation_thread.error_occurred.connect(
+            self.on_generation_error, Qt.QueuedConnection
         )
         
-        # Отключаем cancel
-        cancel_btn = self.generation_tab.cancel_btn
-        cancel_btn.clicked.connect(self.cancel_generation)
-        
         # Запускаем
         self.generation_tab.start_generation()
         self.generation_thread.start()
@@ -419,43 +625,27 @@ class AutoMontageMainWindow(QMainWindow):
         self.generation_tab.add_log_message(f"Критическая ошибка: {error}", "error")
     
     def update_resource_info(self):
-        """Обновляет информацию о ресурсах"""
-        from utils import SystemUtils, Converters
-        
-        # CPU
-        cpu_count = SystemUtils.get_cpu_count()
-        
-        # Память
-        mem_info = SystemUtils.get_memory_info()
-        if mem_info['total'] > 0:
-            mem_used = Converters.bytes_to_human(mem_info['used'])
-            mem_total = Converters.bytes_to_human(mem_info['total'])
-            mem_percent = mem_info['percent']
-            
-            self.resource_info.setText(
-                f"CPU: {cpu_count} | "
-                f"RAM: {mem_used}/{mem_total} ({mem_percent:.0f}%)"
-            )
+        """Запускает фоновое обновление информации о ресурсах"""
+        # Предыдущий опрос еще не завершен
+        if self._resource_sampling:
+            return
+        self._resource_sampling = True
+        QThreadPool.globalInstance().start(self._resource_sampler)
+    
+    def _on_resources_sampled(self, text: str):
+        """Показывает результат опроса ресурсов"""
+        self._resource_sampling = False
+        # Неизменный текст не перерисовывает статус бар
+        if text and text != self.resource_info.text():
+            self.resource_info.setText(text)
     
     def show_welcome_message(self):
         """Показывает приветственное сообщение"""
         if self.settings.get('show_welcome', True):
-            welcome_text = """
-            <h2>Добро пожаловать в Auto Montage Builder Pro!</h2>
-            <p>Для начала работы:</p>
-            <ol>
-            <li>Выберите папку проекта с медиа файлами</li>
-            <li>Создайте или выберите каналы для генерации</li>
-            <li>Настройте эффекты и параметры</li>
-            <li>Нажмите "Создать монтаж"</li>
-            </ol>
-            <p><b>Совет:</b> Используйте тестовый режим для быстрой проверки настроек!</p>
-            """
-            
             msg = QMessageBox(self)
             msg.setWindowTitle("Добро пожаловать!")
             msg.setTextFormat(Qt.RichText)
-            msg.setText(welcome_text)
+            msg.setText(_WELCOME_HTML)
             msg.setIcon(QMessageBox.Information)
             
             # Добавляем чекбокс
@@ -470,32 +660,7 @@ class AutoMontageMainWindow(QMainWindow):
     
     def show_help(self):
         """Показывает справку"""
-        help_text = """
-        <h2>Справка по Auto Montage Builder Pro</h2>
-        
-        <h3>Подготовка файлов:</h3>
-        <p>Файлы должны быть пронумерованы в формате:<br>
-        <code>0001_image.jpg + 0001_audio.mp3</code><br>
-        <code>0002_video.mp4 + 0002_audio.mp3</code></p>
-        
-        <h3>Горячие клавиши:</h3>
-        <ul>
-        <li><b>Ctrl+N</b> - Новый канал</li>
-        <li><b>Ctrl+S</b> - Сохранить настройки</li>
-        <li><b>Ctrl+G</b> - Начать генерацию</li>
-        <li><b>F1</b> - Справка</li>
-        </ul>
-        
-        <h3>Советы:</h3>
-        <ul>
-        <li>Используйте GPU ускорение для быстрой генерации</li>
-        <li>Экспериментируйте с Ken Burns эффектами</li>
-        <li>CapCut эффекты добавят динамики</li>
-        <li>Сохраняйте пресеты для быстрого доступа</li>
-        </ul>
-        """
-        
-        QMessageBox.information(self, "Справка", help_text)
+        QMessageBox.information(self, "Справка", _HELP_HTML)
     
     def show_about(self):
         """Показывает окно "О программе"""""
@@ -521,13 +686,26 @@ class AutoMontageMainWindow(QMainWindow):
             self.generation_thread.cancel()
             self.generation_thread.wait()
         
-        # Сохраняем данные
-        self.save_data()
+        # Забираем настройки из вкладки (заменяет self.settings, поэтому до геометрии)
+        if self.settings_tab is not None:
+            self.save_settings()
+        
+        # Сохраняем геометрию окна, только если она изменилась
+        geometry = self.saveGeometry()
+        state = self.saveState()
+        if geometry != self._geom_cache or state != self._state_cache \
+                or 'window_geometry' not in self.settings:
+            self._geom_cache, self._state_cache = geometry, state
+            self.settings['window_geometry'] = geometry.toBase64().data().decode()
+            self.settings['window_state'] = state.toBase64().data().decode()
+            self._settings_dirty = True
         
-        # Сохраняем геометрию окна
-        self.settings['window_geometry'] = self.saveGeometry().toBase64().data().decode()
-        self.settings['window_state'] = self.saveState().toBase64().data().decode()
-        self.save_settings()
+        # Сохраняем данные сразу, не дожидаясь таймера
+        self._save_timer.stop()
+        self._flush_save()
+        
+        # Освобождаем движки неактивных папок
+        self._engine_cache.clear()
         
         event.accept()
     
@@ -536,27 +714,15 @@ class AutoMontageMainWindow(QMainWindow):
         super().showEvent(event)
         
         # Восстанавливаем геометрию окна
-        if 'window_geometry' in self.settings:
-            try:
-                geometry = QByteArray.fromBase64(
-                    self.settings['window_geometry'].encode()
-                )
-                self.restoreGeometry(geometry)
-            except:
-                pass
-        
-        if 'window_state' in self.settings:
-            try:
-                state = QByteArray.fromBase64(
-                    self.settings['window_state'].encode()
-                )
-                self.restoreState(state)
-            except:
-                pass
+        if self._geom_cache is not None:
+            self.restoreGeometry(self._geom_cache)
+        
+        if self._state_cache is not None:
+            self.restoreState(self._state_cache)
 
 # ==================== ТОЧКА ВХОДА ====================
 
-def main():
+def main(ffmpeg_missing: bool = False):
     """Главная функция приложения"""
     # Настройка логирования
     setup_logging()
@@ -578,6 +744,16 @@ def main():
     window = AutoMontageMainWindow()
     window.show()
     
+    # Предупреждение из main.check_ffmpeg - в уже созданном приложении
+    if ffmpeg_missing:
+        QMessageBox.warning(
+            window,
+            "FFmpeg не найден",
+            "FFmpeg не найден в системе!\n\n"
+            "Скачайте FFmpeg с https://ffmpeg.org/download.html\n"
+            "и добавьте его в PATH или поместите в папку с программой."
+        )
+    
     # Запускаем приложение
     sys.exit(app.exec())
 
@@ -4,19 +4,53 @@
 Модели данных для Auto Montage Builder Pro
 """
 
-from dataclasses import dataclass, field, asdict
-from enum import Enum
+from dataclasses import dataclass, field, fields
+from enum import StrEnum, IntFlag
 from typing import List, Dict, Tuple, Optional, Any, Union
 from pathlib import Path
-import json
+from types import MappingProxyType
+import os
+import sys
 import time
 import logging
 
+from utils import json_dumps, json_loads, write_file_atomic
+
 logger = logging.getLogger(__name__)
 
+# ==================== СЕРИАЛИЗАЦИЯ ====================
+
+def _intern_tree(obj: Any) -> Any:
+    """Интернирует короткие строки и ключи в загруженном JSON (повторяющиеся значения)"""
+    if type(obj) is str:
+        return sys.intern(obj) if len(obj) < 32 else obj
+    if type(obj) is list:
+        return [_intern_tree(item) for item in obj]
+    if type(obj) is dict:
+        return {sys.intern(key) if type(key) is str else key: _intern_tree(value) for key, value in obj.items()}
+    return obj
+
+# Имена сериализуемых полей по классам (приватные кэши пропускаются)
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Возвращает кортеж имен сериализуемых полей dataclass"""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+    return names
+
+def _to_dict(obj: Any) -> dict:
+    """Плоская сериализация dataclass без deepcopy (списки копируются поверхностно)"""
+    data = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        data[name] = list(value) if type(value) is list else value
+    return data
+
 # ==================== ENUMS ====================
 
-class TransitionType(Enum):
+class TransitionType(StrEnum):
     FADE = "fade"
     DISSOLVE = "dissolve"
     DIP_BLACK = "dip_black"
@@ -32,7 +66,7 @@ class TransitionType(Enum):
     SQUEEZE = "squeeze"
     MORPH = "morph"
 
-class KenBurnsEffect(Enum):
+class KenBurnsEffect(StrEnum):
     ZOOM_IN = "zoomIn"
     ZOOM_OUT = "zoomOut"
     PAN_LEFT = "panLeft"
@@ -46,7 +80,7 @@ class KenBurnsEffect(Enum):
     SPIRAL = "spiral"
     SHAKE = "shake"
 
-class CapCutEffect(Enum):
+class CapCutEffect(StrEnum):
     ZOOM_BURST = "zoomBurst"
     PULSE = "pulse"
     BOUNCE = "bounce"
@@ -64,9 +98,87 @@ class CapCutEffect(Enum):
     RGB_SPLIT = "rgbSplit"
     DISTORTION = "distortion"
 
+class ChannelTag(IntFlag):
+    """Теги эффектов канала (битовая маска для карточек)"""
+    KEN_BURNS = 1
+    CAPCUT = 2
+    OVERLAY = 4
+    PARALLAX = 8
+    COLOR = 16
+
+# ==================== СПРАВОЧНИКИ ====================
+
+# Допустимые значения для валидаторов (строятся один раз при импорте)
+_VALID_KB = frozenset(KenBurnsEffect)
+_VALID_TRANS = frozenset(TransitionType)
+_VALID_CAPCUT = frozenset(CapCutEffect)
+_VALID_PRESETS = frozenset((
+    "ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"
+))
+_VALID_PROFILES = frozenset(("baseline", "main", "high"))
+_VALID_BLEND = frozenset(("normal", "screen", "overlay", "multiply", "add", "lighten", "darken"))
+_VALID_POSITION = frozenset(("center", "top-left", "top-right", "bottom-left", "bottom-right"))
+
+# Предустановленные разрешения экспорта
+_RESOLUTION_MAP: Dict[str, Tuple[int, int]] = {
+    "1920x1080": (1920, 1080),
+    "3840x2160": (3840, 2160),
+    "2560x1440": (2560, 1440),
+    "1280x720": (1280, 720),
+    "1080x1920": (1080, 1920),  # Вертикальное
+    "1080x1080": (1080, 1080),  # Квадрат
+    "720x1280": (720, 1280),    # Shorts
+}
+
+# Шаблоны каналов (общие для всех вызовов - списки хранятся кортежами)
+_TEMPLATES = MappingProxyType({
+    "youtube": {
+        "name": "YouTube канал",
+        "resolution": "1920x1080",
+        "fps": 30,
+        "bitrate": 8,
+        "ken_burns": ("zoomIn", "panRight"),
+        "transitions": ("fade", "dissolve"),
+        "color_filter": "cinematic"
+    },
+    "shorts": {
+        "name": "Shorts/Reels канал",
+        "resolution": "1080x1920",
+        "fps": 30,
+        "bitrate": 10,
+        "ken_burns": ("zoomIn", "zoomOut"),
+        "transitions": ("zoom", "slide"),
+        "capcut_effects": ("zoomBurst", "shake")
+    },
+    "instagram": {
+        "name": "Instagram канал",
+        "resolution": "1080x1080",
+        "fps": 30,
+        "bitrate": 6,
+        "ken_burns": ("diagonal",),
+        "transitions": ("fade",),
+        "color_filter": "instagram"
+    },
+    "cinematic": {
+        "name": "Cinematic канал",
+        "resolution": "3840x2160",
+        "fps": 24,
+        "bitrate": 20,
+        "ken_burns": ("panLeft", "panRight"),
+        "transitions": ("dissolve",),
+        "color_filter": "cinematic",
+        "vignette": True,
+        "grain": True
+    }
+})
+
+def _clamp(lo, hi, x):
+    """Ограничивает значение диапазоном [lo, hi]"""
+    return lo if x < lo else (hi if x > hi else x)
+
 # ==================== МОДЕЛИ ДАННЫХ ====================
 
-@dataclass
+@dataclass(slots=True)
 class VideoQuality:
     """Настройки качества видео"""
     preset: str = "medium"  # ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow
@@ -77,19 +189,25 @@ class VideoQuality:
     color_space: str = "bt709"
     color_range: str = "tv"  # tv, pc
     
+    def __post_init__(self):
+        """Валидация сразу при создании (отдельный проход в фабрике не нужен)"""
+        self.validate()
+    
     def validate(self):
         """Валидация параметров качества"""
-        valid_presets = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"]
-        if self.preset not in valid_presets:
+        if self.preset not in _VALID_PRESETS:
             self.preset = "medium"
         
-        self.crf = max(0, min(51, self.crf))
+        self.crf = _clamp(0, 51, self.crf)
         
-        valid_profiles = ["baseline", "main", "high"]
-        if self.profile not in valid_profiles:
+        if self.profile not in _VALID_PROFILES:
             self.profile = "high"
     
-@dataclass
+    def to_dict(self) -> dict:
+        """Преобразует настройки в словарь"""
+        return _to_dict(self)
+    
+@dataclass(slots=True)
 class ExportSettings:
     """Настройки экспорта видео"""
     resolution: str = "1920x1080"
@@ -106,32 +224,32 @@ class ExportSettings:
     audio_codec: str = "aac"
     container: str = "mp4"
     
+    def __post_init__(self):
+        """Валидация сразу при создании"""
+        self.validate()
+    
     def get_resolution(self) -> Tuple[int, int]:
         """Получает разрешение в виде кортежа"""
         if self.resolution == "custom":
             return (self.custom_width, self.custom_height)
-        
-        resolution_map = {
-            "1920x1080": (1920, 1080),
-            "3840x2160": (3840, 2160),
-            "2560x1440": (2560, 1440),
-            "1280x720": (1280, 720),
-            "1080x1920": (1080, 1920),  # Вертикальное
-            "1080x1080": (1080, 1080),  # Квадрат
-            "720x1280": (720, 1280),    # Shorts
-        }
-        return resolution_map.get(self.resolution, (1920, 1080))
+        return _RESOLUTION_MAP.get(self.resolution, (1920, 1080))
     
     def validate(self):
         """Валидация настроек экспорта"""
-        self.custom_width = max(320, min(7680, self.custom_width))
-        self.custom_height = max(240, min(4320, self.custom_height))
-        self.fps = max(1, min(120, self.fps))
-        self.bitrate = max(1, min(100, self.bitrate))
-        self.audio_bitrate = max(64, min(320, self.audio_bitrate))
+        self.custom_width = _clamp(320, 7680, self.custom_width)
+        self.custom_height = _clamp(240, 4320, self.custom_height)
+        self.fps = _clamp(1, 120, self.fps)
+        self.bitrate = _clamp(1, 100, self.bitrate)
+        self.audio_bitrate = _clamp(64, 320, self.audio_bitrate)
         self.quality.validate()
+    
+    def to_dict(self) -> dict:
+        """Преобразует настройки в словарь"""
+        data = _to_dict(self)
+        data["quality"] = self.quality.to_dict()
+        return data
 
-@dataclass
+@dataclass(slots=True)
 class EffectSettings:
     """Настройки эффектов"""
     # Ken Burns эффекты
@@ -203,50 +321,73 @@ class EffectSettings:
     avoid_repetition: bool = True
     capcut_timing: str = "start"  # start, middle, end, random
     
+    @property
+    def tag_bits(self) -> int:
+        """Теги эффектов (ChannelTag)"""
+        bits = 0
+        if self.ken_burns:
+            bits |= ChannelTag.KEN_BURNS
+        if self.capcut_effects:
+            bits |= ChannelTag.CAPCUT
+        if self.enable_3d_parallax:
+            bits |= ChannelTag.PARALLAX
+        if self.color_correction:
+            bits |= ChannelTag.COLOR
+        return int(bits)
+    
+    def __post_init__(self):
+        """Валидация сразу при создании"""
+        self.validate()
+    
+    def apply(self, values: Dict[str, Any]):
+        """Массово присваивает значения полей"""
+        for name, value in values.items():
+            setattr(self, name, value)
+    
     def validate(self):
         """Валидация настроек эффектов"""
         # Валидация интенсивностей
-        self.ken_burns_intensity = max(0, min(100, self.ken_burns_intensity))
-        self.rotation_angle = max(0, min(90, self.rotation_angle))
-        self.kb_smooth_factor = max(0.0, min(1.0, self.kb_smooth_factor))
+        self.ken_burns_intensity = _clamp(0, 100, self.ken_burns_intensity)
+        self.rotation_angle = _clamp(0, 90, self.rotation_angle)
+        self.kb_smooth_factor = _clamp(0.0, 1.0, self.kb_smooth_factor)
         
         # Валидация длительностей
-        self.transition_duration = max(0.1, min(5.0, self.transition_duration))
-        self.trans_overlap = max(0.0, min(1.0, self.trans_overlap))
-        self.fade_in_duration = max(0.1, min(5.0, self.fade_in_duration))
-        self.fade_out_duration = max(0.1, min(5.0, self.fade_out_duration))
+        self.transition_duration = _clamp(0.1, 5.0, self.transition_duration)
+        self.trans_overlap = _clamp(0.0, 1.0, self.trans_overlap)
+        self.fade_in_duration = _clamp(0.1, 5.0, self.fade_in_duration)
+        self.fade_out_duration = _clamp(0.1, 5.0, self.fade_out_duration)
         
         # Валидация цветокоррекции
-        self.vignette_intensity = max(0, min(100, self.vignette_intensity))
-        self.grain_intensity = max(0, min(100, self.grain_intensity))
-        self.blur_intensity = max(0, min(100, self.blur_intensity))
+        self.vignette_intensity = _clamp(0, 100, self.vignette_intensity)
+        self.grain_intensity = _clamp(0, 100, self.grain_intensity)
+        self.blur_intensity = _clamp(0, 100, self.blur_intensity)
         
         # Валидация CapCut
-        self.scale_amplitude = max(0, min(100, self.scale_amplitude))
-        self.zoom_burst_start = max(100, min(300, self.zoom_burst_start))
-        self.zoom_burst_decay = max(0, min(100, self.zoom_burst_decay))
-        self.motion_intensity = max(0, min(100, self.motion_intensity))
-        self.effect_percent = max(0, min(100, self.effect_percent))
-        self.effect_every = max(1, min(10, self.effect_every))
+        self.scale_amplitude = _clamp(0, 100, self.scale_amplitude)
+        self.zoom_burst_start = _clamp(100, 300, self.zoom_burst_start)
+        self.zoom_burst_decay = _clamp(0, 100, self.zoom_burst_decay)
+        self.motion_intensity = _clamp(0, 100, self.motion_intensity)
+        self.effect_percent = _clamp(0, 100, self.effect_percent)
+        self.effect_every = _clamp(1, 10, self.effect_every)
         
         # Валидация эффектов
         self._validate_effect_lists()
     
     def _validate_effect_lists(self):
         """Валидация списков эффектов"""
-        valid_ken_burns = [e.value for e in KenBurnsEffect]
-        valid_transitions = [t.value for t in TransitionType]
-        valid_capcut = [c.value for c in CapCutEffect]
-        
-        self.ken_burns = [e for e in self.ken_burns if e in valid_ken_burns]
-        self.transitions = [t for t in self.transitions if t in valid_transitions]
+        self.ken_burns = [e for e in self.ken_burns if e in _VALID_KB]
+        self.transitions = [t for t in self.transitions if t in _VALID_TRANS]
         if not self.transitions:
             self.transitions = ["fade"]
         
-        self.capcut_effects = [c for c in self.capcut_effects if c in valid_capcut]
-        self.motion_effects = [m for m in self.motion_effects if m in valid_capcut]
+        self.capcut_effects = [c for c in self.capcut_effects if c in _VALID_CAPCUT]
+        self.motion_effects = [m for m in self.motion_effects if m in _VALID_CAPCUT]
+    
+    def to_dict(self) -> dict:
+        """Преобразует настройки в словарь"""
+        return _to_dict(self)
 
-@dataclass
+@dataclass(slots=True)
 class OverlaySettings:
     """Настройки оверлеев"""
     enabled: bool = False
@@ -262,21 +403,27 @@ class OverlaySettings:
     animate: bool = False
     animation_type: str = "fade"  # fade, slide, zoom, rotate
     
+    def __post_init__(self):
+        """Валидация сразу при создании"""
+        self.validate()
+    
     def validate(self):
         """Валидация настроек оверлеев"""
-        valid_blend_modes = ["normal", "screen", "overlay", "multiply", "add", "lighten", "darken"]
-        if self.blend_mode not in valid_blend_modes:
+        if self.blend_mode not in _VALID_BLEND:
             self.blend_mode = "screen"
         
-        valid_positions = ["center", "top-left", "top-right", "bottom-left", "bottom-right"]
-        if self.position not in valid_positions:
+        if self.position not in _VALID_POSITION:
             self.position = "center"
         
-        self.opacity = max(0, min(100, self.opacity))
-        self.scale = max(10, min(200, self.scale))
-        self.rotation = max(-180, min(180, self.rotation))
+        self.opacity = _clamp(0, 100, self.opacity)
+        self.scale = _clamp(10, 200, self.scale)
+        self.rotation = _clamp(-180, 180, self.rotation)
+    
+    def to_dict(self) -> dict:
+        """Преобразует настройки в словарь"""
+        return _to_dict(self)
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
     """Канал для генерации"""
     id: str
@@ -287,6 +434,14 @@ class Channel:
     effects: EffectSettings = field(default_factory=EffectSettings)
     overlays: OverlaySettings = field(default_factory=OverlaySettings)
     
+    @property
+    def tag_bits(self) -> int:
+        """Теги эффектов и оверлеев канала (ChannelTag)"""
+        bits = self.effects.tag_bits
+        if self.overlays.enabled:
+            bits |= ChannelTag.OVERLAY
+        return bits
+    
     def validate(self):
         """Полная валидация канала"""
         self.export.validate()
@@ -295,7 +450,15 @@ class Channel:
     
     def to_dict(self) -> dict:
         """Преобразует канал в словарь"""
-        return asdict(self)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "template": self.template,
+            "export": self.export.to_dict(),
+            "effects": self.effects.to_dict(),
+            "overlays": self.overlays.to_dict(),
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Channel':
@@ -303,7 +466,14 @@ class Channel:
         factory = ChannelFactory()
         return factory.create_from_dict(data)
 
-@dataclass
+@dataclass(slots=True)
+class ChannelsDelta:
+    """Изменение списка каналов (для точечного обновления вкладок)"""
+    kind: str  # add, remove, update, reset
+    index: Optional[int] = None
+    channel: Optional[Channel] = None
+
+@dataclass(slots=True)
 class MediaPair:
     """Пара медиа + аудио файлов"""
     number: str
@@ -322,22 +492,55 @@ class MediaPair:
     def validate(self) -> bool:
         """Проверяет существование файлов"""
         return self.media_file.exists() and self.audio_file.exists()
+    
+    @classmethod
+    def validate_many(cls, pairs: List['MediaPair']) -> List[bool]:
+        """Проверяет существование файлов пар одним os.scandir на каталог"""
+        listings: Dict[Path, set] = {}
+        
+        def present(path: Path) -> bool:
+            names = listings.get(path.parent)
+            if names is None:
+                try:
+                    with os.scandir(path.parent) as entries:
+                        names = {entry.name for entry in entries}
+                except OSError:
+                    names = set()
+                listings[path.parent] = names
+            return path.name in names
+        
+        return [present(pair.media_file) and present(pair.audio_file) for pair in pairs]
 
 # ==================== ФАБРИКА ====================
 
+def _init_field_names(cls: type, exclude: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+    """Имена полей dataclass, принимаемых конструктором"""
+    return tuple(f.name for f in fields(cls) if f.init and f.name not in exclude)
+
+# Таблицы полей для фабрики (значения по умолчанию берутся из самих dataclass)
+_QUALITY_FIELDS = _init_field_names(VideoQuality)
+_EXPORT_FIELDS = _init_field_names(ExportSettings, exclude=("quality",))
+_EFFECT_FIELDS = _init_field_names(EffectSettings)
+_OVERLAY_FIELDS = _init_field_names(OverlaySettings)
+
+def _pick(data: dict, names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Выбирает из словаря только известные поля"""
+    return {name: data[name] for name in names if name in data}
+
 class ChannelFactory:
     """Фабрика для безопасного создания объектов Channel"""
     
     def create_from_dict(self, data: dict) -> Channel:
         """Создает Channel из словаря с валидацией"""
         try:
-            # Создаем вложенные объекты
+            # Создаем вложенные объекты (каждый валидируется при создании)
+            export_data = data.get("export", {})
             quality = self._create_video_quality(
-                data.get("export", {}).get("quality", {})
+                export_data.get("quality", {})
             )
             
             export_settings = self._create_export_settings(
-                data.get("export", {}), quality
+                export_data, quality
             )
             
             effects = self._create_effect_settings(
@@ -357,9 +560,6 @@ class ChannelFactory:
                 effects=effects,
                 overlays=overlays
             )
-            
-            # Валидируем созданный канал
-            channel.validate()
             return channel
             
         except Exception as e:
@@ -374,53 +574,11 @@ class ChannelFactory:
             name="Канал по умолчанию",
             description="Создан автоматически"
         )
-        channel.validate()
         return channel
     
     def create_from_template(self, template_name: str) -> Channel:
         """Создает канал из предустановленного шаблона"""
-        templates = {
-            "youtube": {
-                "name": "YouTube канал",
-                "resolution": "1920x1080",
-                "fps": 30,
-                "bitrate": 8,
-                "ken_burns": ["zoomIn", "panRight"],
-                "transitions": ["fade", "dissolve"],
-                "color_filter": "cinematic"
-            },
-            "shorts": {
-                "name": "Shorts/Reels канал",
-                "resolution": "1080x1920",
-                "fps": 30,
-                "bitrate": 10,
-                "ken_burns": ["zoomIn", "zoomOut"],
-                "transitions": ["zoom", "slide"],
-                "capcut_effects": ["zoomBurst", "shake"]
-            },
-            "instagram": {
-                "name": "Instagram канал",
-                "resolution": "1080x1080",
-                "fps": 30,
-                "bitrate": 6,
-                "ken_burns": ["diagonal"],
-                "transitions": ["fade"],
-                "color_filter": "instagram"
-            },
-            "cinematic": {
-                "name": "Cinematic канал",
-                "resolution": "3840x2160",
-                "fps": 24,
-                "bitrate": 20,
-                "ken_burns": ["panLeft", "panRight"],
-                "transitions": ["dissolve"],
-                "color_filter": "cinematic",
-                "vignette": True,
-                "grain": True
-            }
-        }
-        
-        template = templates.get(template_name, templates["youtube"])
+        template = _TEMPLATES.get(template_name, _TEMPLATES["youtube"])
         
         channel = Channel(
             id=f"channel_{int(time.time())}",
@@ -435,9 +593,9 @@ class ChannelFactory:
         channel.export.bitrate = template.get("bitrate", 8)
         
         if "ken_burns" in template:
-            channel.effects.ken_burns = template["ken_burns"]
+            channel.effects.ken_burns = list(template["ken_burns"])
         if "transitions" in template:
-            channel.effects.transitions = template["transitions"]
+            channel.effects.transitions = list(template["transitions"])
         if "color_filter" in template:
             channel.effects.color_filter = template["color_filter"]
             channel.effects.color_correction = True
@@ -446,138 +604,26 @@ class ChannelFactory:
         if "grain" in template:
             channel.effects.grain = template["grain"]
         if "capcut_effects" in template:
-            channel.effects.capcut_effects = template["capcut_effects"]
+            channel.effects.capcut_effects = list(template["capcut_effects"])
         
         channel.validate()
         return channel
     
     def _create_video_quality(self, data: dict) -> VideoQuality:
         """Создает VideoQuality с безопасными значениями"""
-        quality = VideoQuality(
-            preset=data.get("preset", "medium"),
-            crf=data.get("crf", 23),
-            profile=data.get("profile", "high"),
-            level=data.get("level", "4.2"),
-            pixel_format=data.get("pixel_format", "yuv420p"),
-            color_space=data.get("color_space", "bt709"),
-            color_range=data.get("color_range", "tv")
-        )
-        quality.validate()
-        return quality
+        return VideoQuality(**_pick(data, _QUALITY_FIELDS))
     
     def _create_export_settings(self, data: dict, quality: VideoQuality) -> ExportSettings:
         """Создает ExportSettings с валидацией"""
-        export = ExportSettings(
-            resolution=data.get("resolution", "1920x1080"),
-            custom_width=data.get("custom_width", 1920),
-            custom_height=data.get("custom_height", 1080),
-            fps=data.get("fps", 30),
-            bitrate=data.get("bitrate", 8),
-            codec=data.get("codec", "h264"),
-            quality=quality,
-            use_gpu=data.get("use_gpu", True),
-            gpu_type=data.get("gpu_type", "auto"),
-            two_pass=data.get("two_pass", False),
-            audio_bitrate=data.get("audio_bitrate", 192),
-            audio_codec=data.get("audio_codec", "aac"),
-            container=data.get("container", "mp4")
-        )
-        export.validate()
-        return export
+        return ExportSettings(quality=quality, **_pick(data, _EXPORT_FIELDS))
     
     def _create_effect_settings(self, data: dict) -> EffectSettings:
         """Создает EffectSettings с валидацией"""
-        effects = EffectSettings(
-            # Ken Burns
-            ken_burns=data.get("ken_burns", []),
-            ken_burns_intensity=data.get("ken_burns_intensity", 30),
-            rotation_angle=data.get("rotation_angle", 5),
-            smart_crop=data.get("smart_crop", True),
-            kb_randomize=data.get("kb_randomize", False),
-            kb_smooth_factor=data.get("kb_smooth_factor", 0.7),
-            kb_ease_type=data.get("kb_ease_type", "ease-in-out"),
-            
-            # Переходы
-            transitions=data.get("transitions", ["fade"]),
-            transition_duration=data.get("transition_duration", 1.0),
-            trans_randomize=data.get("trans_randomize", False),
-            trans_overlap=data.get("trans_overlap", 0.5),
-            
-            # Fade эффекты
-            fade_in_from_black=data.get("fade_in_from_black", False),
-            fade_in_duration=data.get("fade_in_duration", 1.0),
-            fade_in_type=data.get("fade_in_type", "ease"),
-            fade_out_to_black=data.get("fade_out_to_black", False),
-            fade_out_duration=data.get("fade_out_duration", 1.0),
-            fade_out_type=data.get("fade_out_type", "ease"),
-            add_black_frame=data.get("add_black_frame", True),
-            
-            # Цветокоррекция
-            color_correction=data.get("color_correction", False),
-            color_filter=data.get("color_filter", "none"),
-            vignette=data.get("vignette", False),
-            vignette_intensity=data.get("vignette_intensity", 40),
-            grain=data.get("grain", False),
-            grain_intensity=data.get("grain_intensity", 20),
-            blur_edges=data.get("blur_edges", False),
-            blur_intensity=data.get("blur_intensity", 30),
-            
-            # Аудио
-            audio_pitch=data.get("audio_pitch", "0"),
-            audio_effect=data.get("audio_effect", "none"),
-            audio_stereo_enhance=data.get("audio_stereo_enhance", False),
-            audio_normalize=data.get("audio_normalize", True),
-            audio_compressor=data.get("audio_compressor", False),
-            audio_limiter=data.get("audio_limiter", False),
-            
-            # Анимация
-            easing_type=data.get("easing_type", "ease"),
-            bezier_p1=data.get("bezier_p1", 25),
-            bezier_p2=data.get("bezier_p2", 75),
-            motion_blur=data.get("motion_blur", False),
-            motion_blur_amount=data.get("motion_blur_amount", 20),
-            
-            # 3D Parallax
-            enable_3d_parallax=data.get("enable_3d_parallax", False),
-            parallax_depth_layers=data.get("parallax_depth_layers", 3),
-            parallax_speed=data.get("parallax_speed", 1.0),
-            parallax_direction=data.get("parallax_direction", "horizontal"),
-            parallax_depth_estimation=data.get("parallax_depth_estimation", False),
-            
-            # CapCut эффекты
-            capcut_effects=data.get("capcut_effects", []),
-            scale_amplitude=data.get("scale_amplitude", 15),
-            zoom_burst_start=data.get("zoom_burst_start", 150),
-            zoom_burst_decay=data.get("zoom_burst_decay", 80),
-            motion_effects=data.get("motion_effects", []),
-            motion_intensity=data.get("motion_intensity", 30),
-            effect_frequency=data.get("effect_frequency", "all"),
-            effect_percent=data.get("effect_percent", 50),
-            effect_every=data.get("effect_every", 3),
-            avoid_repetition=data.get("avoid_repetition", True),
-            capcut_timing=data.get("capcut_timing", "start")
-        )
-        effects.validate()
-        return effects
+        return EffectSettings(**_pick(data, _EFFECT_FIELDS))
     
     def _create_overlay_settings(self, data: dict) -> OverlaySettings:
         """Создает OverlaySettings с валидацией"""
-        overlays = OverlaySettings(
-            enabled=data.get("enabled", False),
-            folder=data.get("folder", ""),
-            files=data.get("files", []),
-            blend_mode=data.get("blend_mode", "screen"),
-            opacity=data.get("opacity", 100),
-            randomize=data.get("randomize", False),
-            stretch=data.get("stretch", True),
-            position=data.get("position", "center"),
-            scale=data.get("scale", 100),
-            rotation=data.get("rotation", 0),
-            animate=data.get("animate", False),
-            animation_type=data.get("animation_type", "fade")
-        )
-        overlays.validate()
-        return overlays
+        return OverlaySettings(**_pick(data, _OVERLAY_FIELDS))
 
 # ==================== МЕНЕДЖЕР ДАННЫХ ====================
 
@@ -596,8 +642,7 @@ class DataManager:
         """Сохраняет каналы в файл"""
         try:
             channels_data = [channel.to_dict() for channel in channels]
-            with open(self.channels_file, 'w', encoding='utf-8') as f:
-                json.dump(channels_data, f, indent=2, ensure_ascii=False)
+            write_file_atomic(self.channels_file, json_dumps(channels_data))
             logger.info(f"Сохранено каналов: {len(channels)}")
             return True
         except Exception as e:
@@ -610,12 +655,11 @@ class DataManager:
         
         if self.channels_file.exists():
             try:
-                with open(self.channels_file, 'r', encoding='utf-8') as f:
-                    channels_data = json.load(f)
+                with open(self.channels_file, 'rb') as f:
+                    channels_data = _intern_tree(json_loads(f.read()))
                 
-                for channel_data in channels_data:
-                    channel = self.factory.create_from_dict(channel_data)
-                    channels.append(channel)
+                create = self.factory.create_from_dict
+                channels = [create(channel_data) for channel_data in channels_data]
                 
                 logger.info(f"Загружено каналов: {len(channels)}")
             except Exception as e:
@@ -633,8 +677,7 @@ class DataManager:
         """Экспортирует каналы в файл"""
         try:
             channels_data = [channel.to_dict() for channel in channels]
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(channels_data, f, indent=2, ensure_ascii=False)
+            write_file_atomic(file_path, json_dumps(channels_data))
             return True
         except Exception as e:
             logger.error(f"Ошибка экспорта каналов: {str(e)}")
@@ -645,8 +688,8 @@ class DataManager:
         channels = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                imported_data = _intern_tree(json_loads(f.read()))
             
             # Поддержка разных форматов
             if isinstance(imported_data, list):
@@ -656,9 +699,8 @@ class DataManager:
             else:
                 raise ValueError("Неверный формат файла")
             
-            for channel_data in channels_data:
-                channel = self.factory.create_from_dict(channel_data)
-                channels.append(channel)
+            create = self.factory.create_from_dict
+            channels = [create(channel_data) for channel_data in channels_data]
             
         except Exception as e:
             logger.error(f"Ошибка импорта каналов: {str(e)}")
@@ -668,8 +710,7 @@ class DataManager:
     def save_settings(self, settings: dict) -> bool:
         """Сохраняет настройки приложения"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            write_file_atomic(self.settings_file, json_dumps(settings))
             return True
         except Exception as e:
             logger.error(f"Ошибка сохранения настроек: {str(e)}")
@@ -679,8 +720,8 @@ class DataManager:
         """Загружает настройки приложения"""
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    return _intern_tree(json_loads(f.read()))
             except Exception as e:
                 logger.error(f"Ошибка загрузки настроек: {str(e)}")
         
@@ -10,20 +10,129 @@ import json
 import shutil
 import subprocess
 import logging
+import logging.handlers
+import queue
+import atexit
+import threading
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import time
+import fnmatch
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Регулярные выражения для разбора времени и разрешения (компилируются один раз)
+_TIME_RE = re.compile(r'(\d{2}):(\d{2}):(\d{2})\.(\d{2})')
+_DURATION_RE = re.compile(rb'Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})')
+_RES_RE = re.compile(r'(\d+)x(\d+)')
+
+# Аргументы ffprobe: полный ответ и только длительность/размеры
+_FULL_PROBE_ARGS = ('-show_format', '-show_streams')
+_MINIMAL_PROBE_ARGS = ('-show_entries', 'format=duration:stream=index,width,height,codec_type,duration')
+
+# ==================== JSON ====================
+
+# Реализация выбирается один раз при импорте
+if orjson is not None:
+    def json_dumps(data: Any) -> bytes:
+        """Сериализует данные в UTF-8 JSON с отступами"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    json_loads = orjson.loads
+else:
+    def json_dumps(data: Any) -> bytes:
+        """Сериализует данные в UTF-8 JSON с отступами"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def json_loads(data: bytes) -> Any:
+        """Разбирает JSON из байтов"""
+        return json.loads(data)
+
+
+# mkstemp создает файлы с правами 0600 - возвращаем обычные права по umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def write_file_atomic(path: Union[str, Path], data: bytes):
+    """Записывает файл целиком через уникальный временный файл и os.replace"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, _FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 # ==================== FFMPEG УТИЛИТЫ ====================
 
+def _parse_ffmpeg_listing(output: bytes) -> frozenset:
+    """Имена из вывода ffmpeg -encoders/-filters (второй столбец после флагов)"""
+    # Легенда флагов у -encoders отделена строкой " ------"
+    _, separator, body = output.partition(b' ------')
+    if not separator:
+        body = output
+    
+    names = set()
+    for line in body.splitlines():
+        parts = line.split(None, 2)
+        if len(parts) >= 2:
+            names.add(parts[1].decode('ascii', 'replace'))
+    return frozenset(names)
+
 class FFmpegUtils:
     """Утилиты для работы с FFmpeg"""
     
+    # Ограничение числа одновременно запущенных ffmpeg/ffprobe (создается при первом запуске)
+    _spawn_semaphore: Optional[threading.BoundedSemaphore] = None
+    _spawn_lock = threading.Lock()
+    
+    @staticmethod
+    def set_concurrency(limit: int) -> threading.BoundedSemaphore:
+        """Задает максимум одновременно работающих процессов ffmpeg/ffprobe"""
+        with FFmpegUtils._spawn_lock:
+            FFmpegUtils._spawn_semaphore = threading.BoundedSemaphore(max(1, limit))
+            return FFmpegUtils._spawn_semaphore
+    
     @staticmethod
+    def _run(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run под общим семафором (слот занят только на время процесса)"""
+        semaphore = FFmpegUtils._spawn_semaphore
+        if semaphore is None:
+            with FFmpegUtils._spawn_lock:
+                if FFmpegUtils._spawn_semaphore is None:
+                    FFmpegUtils._spawn_semaphore = threading.BoundedSemaphore(
+                        min(SystemUtils.get_cpu_count(), 8)
+                    )
+                semaphore = FFmpegUtils._spawn_semaphore
+        with semaphore:
+            return subprocess.run(cmd, **kwargs)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_ffmpeg_path() -> str:
-        """Получает путь к FFmpeg"""
+        """Получает путь к FFmpeg (поиск выполняется один раз)"""
         # Пытаемся найти в системе
         for cmd in ['ffmpeg', 'ffmpeg.exe']:
             if shutil.which(cmd):
@@ -37,8 +146,9 @@ class FFmpegUtils:
         return 'ffmpeg'
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_ffprobe_path() -> str:
-        """Получает путь к FFprobe"""
+        """Получает путь к FFprobe (поиск выполняется один раз)"""
         for cmd in ['ffprobe', 'ffprobe.exe']:
             if shutil.which(cmd):
                 return cmd
@@ -54,22 +164,53 @@ class FFmpegUtils:
         """Проверяет установлен ли FFmpeg"""
         try:
             ffmpeg = FFmpegUtils.get_ffmpeg_path()
-            result = subprocess.run([ffmpeg, '-version'], 
-                                  capture_output=True, text=True)
+            result = FFmpegUtils._run([ffmpeg, '-version'], capture_output=True)
             return result.returncode == 0
         except:
             return False
     
+    @staticmethod
+    def _binary_key(binary: str) -> Tuple[str, float]:
+        """Ключ кэша проб: полный путь к бинарнику и время его изменения"""
+        resolved = FFmpegUtils._resolve_binary(binary)
+        try:
+            return resolved, os.path.getmtime(resolved)
+        except OSError:
+            return resolved, 0.0
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _resolve_binary(binary: str) -> str:
+        """Полный путь к бинарнику через PATH (кэшируется)"""
+        return shutil.which(binary) or binary
+    
+    @staticmethod
+    def clear_probe_cache():
+        """Сбрасывает кэш путей и результатов проверки FFmpeg"""
+        FFmpegUtils.get_ffmpeg_path.cache_clear()
+        FFmpegUtils.get_ffprobe_path.cache_clear()
+        FFmpegUtils._resolve_binary.cache_clear()
+        FFmpegUtils._probe_version.cache_clear()
+        FFmpegUtils._probe_gpu_support.cache_clear()
+        FFmpegUtils._probe_filters.cache_clear()
+        FFmpegUtils._probe_media.cache_clear()
+    
     @staticmethod
     def get_ffmpeg_version() -> Optional[str]:
         """Получает версию FFmpeg"""
+        key = FFmpegUtils._binary_key(FFmpegUtils.get_ffmpeg_path())
+        return FFmpegUtils._probe_version(*key)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _probe_version(ffmpeg: str, mtime: float) -> Optional[str]:
+        """Запускает ffmpeg -version (результат кэшируется по пути и mtime)"""
         try:
-            ffmpeg = FFmpegUtils.get_ffmpeg_path()
-            result = subprocess.run([ffmpeg, '-version'], 
-                                  capture_output=True, text=True)
+            result = FFmpegUtils._run([ffmpeg, '-version'], capture_output=True)
             if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                return version_line
+                # Декодируем только первую строку
+                version_line = result.stdout.split(b'\n', 1)[0]
+                return version_line.decode('utf-8', 'replace').rstrip()
         except:
             pass
         return None
@@ -77,21 +218,28 @@ class FFmpegUtils:
     @staticmethod
     def check_gpu_support() -> Dict[str, bool]:
         """Проверяет поддержку GPU кодеков"""
+        key = FFmpegUtils._binary_key(FFmpegUtils.get_ffmpeg_path())
+        return dict(FFmpegUtils._probe_gpu_support(*key))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _probe_gpu_support(ffmpeg: str, mtime: float) -> Dict[str, bool]:
+        """Запускает ffmpeg -encoders (результат кэшируется по пути и mtime)"""
         support = {
             'nvidia': False,
             'amd': False,
             'intel': False,
-            'videotoolbox': False
+            'videotoolbox': False,
+            'vaapi': False,
+            'vulkan': False
         }
         
-        ffmpeg = FFmpegUtils.get_ffmpeg_path()
-        
         try:
-            result = subprocess.run([ffmpeg, '-encoders'], 
-                                  capture_output=True, text=True)
-            encoders = result.stdout
+            # Сравниваются имена кодеков целиком, а не подстроки вывода
+            result = FFmpegUtils._run([ffmpeg, '-encoders'], capture_output=True)
+            encoders = _parse_ffmpeg_listing(result.stdout)
             
-            if 'h264_nvenc' in encoders or 'hevc_nvenc' in encoders:
+            if not encoders.isdisjoint(('h264_nvenc', 'hevc_nvenc')):
                 support['nvidia'] = True
             if 'h264_amf' in encoders:
                 support['amd'] = True
@@ -99,6 +247,10 @@ class FFmpegUtils:
                 support['intel'] = True
             if 'h264_videotoolbox' in encoders:
                 support['videotoolbox'] = True
+            if 'h264_vaapi' in encoders:
+                support['vaapi'] = True
+            if 'h264_vulkan' in encoders:
+                support['vulkan'] = True
                 
         except Exception as e:
             logger.error(f"Ошибка проверки GPU: {str(e)}")
@@ -108,26 +260,65 @@ class FFmpegUtils:
     @staticmethod
     def get_media_info(file_path: str) -> Dict[str, Any]:
         """Получает информацию о медиа файле"""
+        return FFmpegUtils._cached_probe(file_path, _FULL_PROBE_ARGS)
+    
+    @staticmethod
+    def get_minimal_media_info(file_path: str) -> Dict[str, Any]:
+        """Получает только длительность и размеры потоков (короткий ответ ffprobe)"""
+        return FFmpegUtils._cached_probe(file_path, _MINIMAL_PROBE_ARGS)
+    
+    @staticmethod
+    def _cached_probe(file_path: str, probe_args: Tuple[str, ...]) -> Dict[str, Any]:
+        """Запускает ffprobe через кэш и разбирает JSON"""
+        try:
+            stat = os.stat(file_path)
+            raw = FFmpegUtils._probe_media(str(file_path), stat.st_mtime_ns, stat.st_size, probe_args)
+        except OSError:
+            # Файла нет на диске (или это не путь) - без кэша
+            raw = FFmpegUtils._probe_media.__wrapped__(str(file_path), 0, 0, probe_args)
+        
+        if raw:
+            try:
+                return json.loads(raw)
+            except ValueError as e:
+                logger.error(f"Ошибка разбора ответа ffprobe: {str(e)}")
+        return {}
+    
+    @staticmethod
+    def get_media_info_batch(file_paths: List[str], minimal: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Получает информацию о нескольких файлах параллельными запусками ffprobe"""
+        probe = FFmpegUtils.get_minimal_media_info if minimal else FFmpegUtils.get_media_info
+        paths = list(dict.fromkeys(str(path) for path in file_paths))
+        if len(paths) <= 1:
+            return {path: probe(path) for path in paths}
+        
+        # Потоки ждут завершения ffprobe вне GIL; результаты попадают в общий кэш
+        workers = min(SystemUtils.get_cpu_count(), 8, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(probe, paths)))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _probe_media(file_path: str, mtime_ns: int, size: int, probe_args: Tuple[str, ...]) -> bytes:
+        """Запускает ffprobe (сырой JSON кэшируется по пути, mtime и размеру файла)"""
         ffprobe = FFmpegUtils.get_ffprobe_path()
         
-        cmd = [
-            ffprobe, '-v', 'quiet', '-print_format', 'json',
-            '-show_format', '-show_streams', file_path
-        ]
+        cmd = [ffprobe, '-v', 'quiet', '-print_format', 'json', *probe_args, file_path]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+            # json.loads принимает UTF-8 байты напрямую
+            result = FFmpegUtils._run(cmd, capture_output=True)
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                return result.stdout
         except Exception as e:
             logger.error(f"Ошибка получения информации о файле: {str(e)}")
         
-        return {}
+        return b""
     
     @staticmethod
     def get_duration(file_path: str) -> float:
         """Получает длительность медиа файла"""
-        info = FFmpegUtils.get_media_info(file_path)
+        info = FFmpegUtils.get_minimal_media_info(file_path)
         
         # Пробуем разные способы получения длительности
         if info and 'format' in info and 'duration' in info['format']:
@@ -144,13 +335,14 @@ class FFmpegUtils:
                     except:
                         pass
         
-        # Альтернативный метод
+        # Альтернативный метод: без выходного файла ffmpeg только читает заголовок
+        # входа, печатает Duration и сразу завершается (без декодирования в null)
         ffmpeg = FFmpegUtils.get_ffmpeg_path()
-        cmd = [ffmpeg, '-i', file_path, '-f', 'null', '-']
+        cmd = [ffmpeg, '-hide_banner', '-i', file_path]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-            duration_match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})', result.stderr)
+            result = FFmpegUtils._run(cmd, capture_output=True, stdin=subprocess.DEVNULL)
+            duration_match = _DURATION_RE.search(result.stderr)
             if duration_match:
                 hours = int(duration_match.group(1))
                 minutes = int(duration_match.group(2))
@@ -165,7 +357,7 @@ class FFmpegUtils:
     @staticmethod
     def get_video_resolution(file_path: str) -> Tuple[int, int]:
         """Получает разрешение видео"""
-        info = FFmpegUtils.get_media_info(file_path)
+        info = FFmpegUtils.get_minimal_media_info(file_path)
         
         if info and 'streams' in info:
             for stream in info['streams']:
@@ -180,49 +372,86 @@ class FFmpegUtils:
     @staticmethod
     def check_filter_available(filter_name: str) -> bool:
         """Проверяет доступность фильтра FFmpeg"""
-        ffmpeg = FFmpegUtils.get_ffmpeg_path()
-        
+        key = FFmpegUtils._binary_key(FFmpegUtils.get_ffmpeg_path())
+        return filter_name in FFmpegUtils._probe_filters(*key)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _probe_filters(ffmpeg: str, mtime: float) -> frozenset:
+        """Запускает ffmpeg -filters (множество имен кэшируется по пути и mtime)"""
         try:
-            result = subprocess.run([ffmpeg, '-filters'], 
-                                  capture_output=True, text=True)
-            return filter_name in result.stdout
+            result = FFmpegUtils._run([ffmpeg, '-filters'], capture_output=True)
+            return _parse_ffmpeg_listing(result.stdout)
         except:
-            return False
+            return frozenset()
 
 # ==================== ФАЙЛОВЫЕ УТИЛИТЫ ====================
 
+# Транслитерация русских символов (таблица для str.translate)
+_TRANSLIT_TABLE = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '',
+    'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    'А': 'A', 'Б': 'B', 'В': 'V', 'Г': 'G', 'Д': 'D', 'Е': 'E', 'Ё': 'Yo',
+    'Ж': 'Zh', 'З': 'Z', 'И': 'I', 'Й': 'Y', 'К': 'K', 'Л': 'L', 'М': 'M',
+    'Н': 'N', 'О': 'O', 'П': 'P', 'Р': 'R', 'С': 'S', 'Т': 'T', 'У': 'U',
+    'Ф': 'F', 'Х': 'H', 'Ц': 'Ts', 'Ч': 'Ch', 'Ш': 'Sh', 'Щ': 'Sch', 'Ъ': '',
+    'Ы': 'Y', 'Ь': '', 'Э': 'E', 'Ю': 'Yu', 'Я': 'Ya'
+})
+
+def _ext(file_path: Union[str, os.PathLike]) -> str:
+    """Расширение файла в нижнем регистре (без разбора пути через PurePath)"""
+    return os.path.splitext(os.fspath(file_path))[1].lower()
+
+_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z0-9._-]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
 class FileUtils:
     """Утилиты для работы с файлами"""
     
-    SUPPORTED_IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.tiff', '.bmp', '.tif', '.webp'}
-    SUPPORTED_VIDEO_FORMATS = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv'}
-    SUPPORTED_AUDIO_FORMATS = {'.mp3', '.wav', '.aiff', '.m4a', '.flac', '.ogg'}
-    SUPPORTED_OVERLAY_FORMATS = {'.png', '.mp4', '.mov', '.gif', '.webm'}
+    SUPPORTED_IMAGE_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.bmp', '.tif', '.webp'})
+    SUPPORTED_VIDEO_FORMATS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv'})
+    SUPPORTED_AUDIO_FORMATS = frozenset({'.mp3', '.wav', '.aiff', '.m4a', '.flac', '.ogg'})
+    SUPPORTED_OVERLAY_FORMATS = frozenset({'.png', '.mp4', '.mov', '.gif', '.webm'})
+    
+    # Тип медиа по расширению (оверлеи пересекаются с остальными - проверяются отдельно)
+    _SUFFIX_KIND = (
+        dict.fromkeys(SUPPORTED_IMAGE_FORMATS, 'image')
+        | dict.fromkeys(SUPPORTED_VIDEO_FORMATS, 'video')
+        | dict.fromkeys(SUPPORTED_AUDIO_FORMATS, 'audio')
+    )
+    
+    @staticmethod
+    def classify(file_path: Union[str, os.PathLike]) -> Optional[str]:
+        """Определяет тип медиа файла: 'image', 'video', 'audio' или None"""
+        return FileUtils._SUFFIX_KIND.get(_ext(file_path))
     
     @staticmethod
-    def is_image(file_path: Path) -> bool:
+    def is_image(file_path: Union[str, os.PathLike]) -> bool:
         """Проверяет, является ли файл изображением"""
-        return file_path.suffix.lower() in FileUtils.SUPPORTED_IMAGE_FORMATS
+        return FileUtils.classify(file_path) == 'image'
     
     @staticmethod
-    def is_video(file_path: Path) -> bool:
+    def is_video(file_path: Union[str, os.PathLike]) -> bool:
         """Проверяет, является ли файл видео"""
-        return file_path.suffix.lower() in FileUtils.SUPPORTED_VIDEO_FORMATS
+        return FileUtils.classify(file_path) == 'video'
     
     @staticmethod
-    def is_audio(file_path: Path) -> bool:
+    def is_audio(file_path: Union[str, os.PathLike]) -> bool:
         """Проверяет, является ли файл аудио"""
-        return file_path.suffix.lower() in FileUtils.SUPPORTED_AUDIO_FORMATS
+        return FileUtils.classify(file_path) == 'audio'
     
     @staticmethod
-    def is_overlay(file_path: Path) -> bool:
+    def is_overlay(file_path: Union[str, os.PathLike]) -> bool:
         """Проверяет, подходит ли файл для оверлея"""
-        return file_path.suffix.lower() in FileUtils.SUPPORTED_OVERLAY_FORMATS
+        return _ext(file_path) in FileUtils.SUPPORTED_OVERLAY_FORMATS
     
     @staticmethod
-    def get_file_number(file_path: Path) -> Optional[str]:
+    def get_file_number(file_path: Union[str, os.PathLike]) -> Optional[str]:
         """Извлекает номер из имени файла (первые 4 цифры)"""
-        name = file_path.name
+        name = os.path.basename(os.fspath(file_path))
         if len(name) >= 4 and name[:4].isdigit():
             return name[:4]
         return None
@@ -231,25 +460,11 @@ class FileUtils:
     def safe_filename(filename: str) -> str:
         """Создает безопасное имя файла"""
         # Транслитерация русских символов
-        translit_dict = {
-            'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
-            'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
-            'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
-            'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '',
-            'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
-            'А': 'A', 'Б': 'B', 'В': 'V', 'Г': 'G', 'Д': 'D', 'Е': 'E', 'Ё': 'Yo',
-            'Ж': 'Zh', 'З': 'Z', 'И': 'I', 'Й': 'Y', 'К': 'K', 'Л': 'L', 'М': 'M',
-            'Н': 'N', 'О': 'O', 'П': 'P', 'Р': 'R', 'С': 'S', 'Т': 'T', 'У': 'U',
-            'Ф': 'F', 'Х': 'H', 'Ц': 'Ts', 'Ч': 'Ch', 'Ш': 'Sh', 'Щ': 'Sch', 'Ъ': '',
-            'Ы': 'Y', 'Ь': '', 'Э': 'E', 'Ю': 'Yu', 'Я': 'Ya'
-        }
-        
-        for cyrillic, latin in translit_dict.items():
-            filename = filename.replace(cyrillic, latin)
+        filename = filename.translate(_TRANSLIT_TABLE)
         
         # Удаляем небезопасные символы
-        filename = re.sub(r'[^a-zA-Z0-9._-]', '_', filename)
-        filename = re.sub(r'_{2,}', '_', filename)  # Убираем множественные подчеркивания
+        filename = _UNSAFE_CHARS_RE.sub('_', filename)
+        filename = _MULTI_UNDERSCORE_RE.sub('_', filename)  # Убираем множественные подчеркивания
         
         return filename
     
@@ -266,20 +481,21 @@ class FileUtils:
     @staticmethod
     def cleanup_old_files(directory: Path, days: int = 7, pattern: str = "*.mp4") -> int:
         """Удаляет старые файлы из директории"""
-        import time
-        
         count = 0
         current_time = time.time()
         age_seconds = days * 24 * 60 * 60
         
         try:
-            for file_path in directory.glob(pattern):
-                if file_path.is_file():
-                    file_age = current_time - file_path.stat().st_mtime
+            # DirEntry кэширует тип файла из листинга каталога - без лишних stat
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not fnmatch.fnmatch(entry.name, pattern) or not entry.is_file():
+                        continue
+                    file_age = current_time - entry.stat().st_mtime
                     if file_age > age_seconds:
-                        file_path.unlink()
+                        os.unlink(entry.path)
                         count += 1
-                        logger.info(f"Удален старый файл: {file_path}")
+                        logger.info(f"Удален старый файл: {entry.path}")
         except Exception as e:
             logger.error(f"Ошибка очистки старых файлов: {str(e)}")
         
@@ -287,17 +503,31 @@ class FileUtils:
 
 # ==================== ВАЛИДАТОРЫ ====================
 
+# Допустимые значения (строятся один раз при импорте)
+_VALID_RESOLUTIONS = frozenset((
+    "1920x1080", "3840x2160", "2560x1440", "1280x720",
+    "1080x1920", "1080x1080", "720x1280", "custom"
+))
+_VALID_PITCHES = frozenset((
+    "-3", "-2.5", "-2", "-1.5", "-1", "-0.5", "0",
+    "+0.5", "+1", "+1.5", "+2", "+2.5", "+3"
+))
+_VALID_AUDIO_EFFECTS = frozenset((
+    "none", "bass", "reverb", "echo", "chorus", "telephone",
+    "underwater", "radio", "vintage", "distortion", "robot"
+))
+_VALID_EASINGS = frozenset((
+    "linear", "ease", "ease-in", "ease-out", "ease-in-out",
+    "bounce", "elastic", "back"
+))
+
 class Validators:
     """Валидаторы для проверки данных"""
     
     @staticmethod
     def validate_resolution(resolution: str) -> bool:
         """Проверяет корректность разрешения"""
-        valid_resolutions = [
-            "1920x1080", "3840x2160", "2560x1440", "1280x720",
-            "1080x1920", "1080x1080", "720x1280", "custom"
-        ]
-        return resolution in valid_resolutions
+        return resolution in _VALID_RESOLUTIONS
     
     @staticmethod
     def validate_fps(fps: int) -> bool:
@@ -312,39 +542,40 @@ class Validators:
     @staticmethod
     def validate_audio_pitch(pitch: str) -> bool:
         """Проверяет корректность изменения тональности"""
-        valid_pitches = [
-            "-3", "-2.5", "-2", "-1.5", "-1", "-0.5", "0",
-            "+0.5", "+1", "+1.5", "+2", "+2.5", "+3"
-        ]
-        return pitch in valid_pitches
+        return pitch in _VALID_PITCHES
     
     @staticmethod
     def validate_audio_effect(effect: str) -> bool:
         """Проверяет корректность аудио эффекта"""
-        valid_effects = [
-            "none", "bass", "reverb", "echo", "chorus", "telephone",
-            "underwater", "radio", "vintage", "distortion", "robot"
-        ]
-        return effect in valid_effects
+        return effect in _VALID_AUDIO_EFFECTS
     
     @staticmethod
     def validate_easing_type(easing: str) -> bool:
         """Проверяет корректность типа интерполяции"""
-        valid_easings = [
-            "linear", "ease", "ease-in", "ease-out", "ease-in-out",
-            "bounce", "elastic", "back"
-        ]
-        return easing in valid_easings
+        return easing in _VALID_EASINGS
 
 # ==================== КОНВЕРТЕРЫ ====================
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 class Converters:
     """Конвертеры для преобразования данных"""
     
     @staticmethod
     def time_to_seconds(time_str: str) -> float:
         """Преобразует время в формате HH:MM:SS.ms в секунды"""
-        match = re.match(r'(\d{2}):(\d{2}):(\d{2})\.(\d{2})', time_str)
+        # Быстрый путь для строки ровно в формате HH:MM:SS.cc
+        # (isdecimal совпадает с \d регулярки: знаки и пробелы не пропускаются)
+        if len(time_str) == 11 and time_str[2] == ':' and time_str[5] == ':' and time_str[8] == '.':
+            hours, minutes, seconds, centiseconds = (
+                time_str[0:2], time_str[3:5], time_str[6:8], time_str[9:11]
+            )
+            if (hours.isdecimal() and minutes.isdecimal()
+                    and seconds.isdecimal() and centiseconds.isdecimal()):
+                return (int(hours) * 3600 + int(minutes) * 60
+                        + int(seconds) + int(centiseconds) / 100)
+        
+        match = _TIME_RE.match(time_str)
         if match:
             hours = int(match.group(1))
             minutes = int(match.group(2))
@@ -365,11 +596,11 @@ class Converters:
     @staticmethod
     def bytes_to_human(bytes_size: int) -> str:
         """Преобразует байты в человекочитаемый формат"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} PB"
+        if bytes_size < 1024:
+            return f"{bytes_size:.1f} B"
+        # Индекс единицы сразу из числа бит (1024 = 2**10); значение не округляется
+        index = min((int(bytes_size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_size / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
     
     @staticmethod
     def resolution_to_string(width: int, height: int) -> str:
@@ -379,37 +610,51 @@ class Converters:
     @staticmethod
     def string_to_resolution(resolution: str) -> Tuple[int, int]:
         """Преобразует строку в разрешение"""
-        match = re.match(r'(\d+)x(\d+)', resolution)
+        match = _RES_RE.match(resolution)
         if match:
             return (int(match.group(1)), int(match.group(2)))
         return (1920, 1080)
 
 # ==================== СИСТЕМНЫЕ УТИЛИТЫ ====================
 
+def _cgroup_cpu_quota() -> Optional[int]:
+    """Квота CPU из cgroup v2 (cpu.max), округленная вверх; None если не ограничена"""
+    try:
+        with open('/sys/fs/cgroup/cpu.max', 'rb') as f:
+            quota, period = f.read().split()[:2]
+        if quota == b'max':
+            return None
+        return max(1, -(-int(quota) // int(period)))
+    except (OSError, ValueError):
+        return None
+
 class SystemUtils:
     """Системные утилиты"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_cpu_count() -> int:
-        """Получает количество ядер процессора"""
+        """Получает количество доступных процессу ядер (с учетом affinity и квоты cgroup)"""
         try:
-            return os.cpu_count() or 1
-        except:
-            return 1
+            count = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            # Нет sched_getaffinity (Windows, macOS)
+            count = os.cpu_count() or 1
+        
+        quota = _cgroup_cpu_quota()
+        if quota is not None:
+            count = min(count, quota)
+        return max(1, count)
+    
+    # Время жизни кэша показаний памяти и диска (секунды)
+    _STATS_TTL = 0.5
+    _memory_cache: Tuple[float, Optional[Dict[str, int]]] = (0.0, None)
+    _disk_cache: Dict[str, Tuple[float, Dict[str, int]]] = {}
     
     @staticmethod
     def get_memory_info() -> Dict[str, int]:
-        """Получает информацию о памяти"""
-        try:
-            import psutil
-            mem = psutil.virtual_memory()
-            return {
-                'total': mem.total,
-                'available': mem.available,
-                'used': mem.used,
-                'percent': mem.percent
-            }
-        except ImportError:
+        """Получает информацию о памяти (показания кэшируются на _STATS_TTL)"""
+        if psutil is None:
             # Если psutil не установлен
             return {
                 'total': 0,
@@ -417,20 +662,24 @@ class SystemUtils:
                 'used': 0,
                 'percent': 0
             }
+        
+        now = time.monotonic()
+        stamp, info = SystemUtils._memory_cache
+        if info is None or now - stamp >= SystemUtils._STATS_TTL:
+            mem = psutil.virtual_memory()
+            info = {
+                'total': mem.total,
+                'available': mem.available,
+                'used': mem.used,
+                'percent': mem.percent
+            }
+            SystemUtils._memory_cache = (now, info)
+        return dict(info)
     
     @staticmethod
     def get_disk_usage(path: str = '.') -> Dict[str, int]:
-        """Получает информацию об использовании диска"""
-        try:
-            import psutil
-            usage = psutil.disk_usage(path)
-            return {
-                'total': usage.total,
-                'used': usage.used,
-                'free': usage.free,
-                'percent': usage.percent
-            }
-        except ImportError:
+        """Получает информацию об использовании диска (показания кэшируются на _STATS_TTL)"""
+        if psutil is None:
             # Если psutil не установлен
             return {
                 'total': 0,
@@ -438,6 +687,19 @@ class SystemUtils:
                 'free': 0,
                 'percent': 0
             }
+        
+        now = time.monotonic()
+        cached = SystemUtils._disk_cache.get(path)
+        if cached is None or now - cached[0] >= SystemUtils._STATS_TTL:
+            usage = psutil.disk_usage(path)
+            cached = (now, {
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': usage.percent
+            })
+            SystemUtils._disk_cache[path] = cached
+        return dict(cached[1])
     
     @staticmethod
     def is_windows() -> bool:
@@ -463,17 +725,18 @@ class ProgressTracker:
         self.total_steps = total_steps
         self.current_step = 0
         self.start_time = None
-        self.callbacks = []
+        self.callbacks: tuple = ()
+        self._last_notified: Optional[Tuple[float, str]] = None
     
     def add_callback(self, callback):
         """Добавляет callback для уведомления о прогрессе"""
-        self.callbacks.append(callback)
+        self.callbacks = self.callbacks + (callback,)
     
     def start(self):
         """Начинает отслеживание"""
-        import time
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.current_step = 0
+        self._last_notified = None
         self._notify(0, "Начало операции")
     
     def update(self, step: int, message: str = ""):
@@ -489,13 +752,20 @@ class ProgressTracker:
     def finish(self, message: str = "Операция завершена"):
         """Завершает отслеживание"""
         self.update(self.total_steps, message)
-        if self.start_time:
-            import time
-            elapsed = time.time() - self.start_time
+        if self.start_time is not None:
+            elapsed = time.monotonic() - self.start_time
             logger.info(f"Операция завершена за {elapsed:.1f} секунд")
     
     def _notify(self, percent: float, message: str):
         """Уведомляет подписчиков о прогрессе"""
+        # Пропускаем повтор того же сообщения с изменением меньше 0.5%,
+        # но завершение (100%) доставляется всегда
+        last = self._last_notified
+        if (percent < 100 and last is not None and last[1] == message
+                and abs(percent - last[0]) < 0.5):
+            return
+        self._last_notified = (percent, message)
+        
         for callback in self.callbacks:
             try:
                 callback(percent, message)
@@ -504,11 +774,10 @@ class ProgressTracker:
     
     def get_eta(self) -> Optional[float]:
         """Вычисляет оставшееся время"""
-        if not self.start_time or self.current_step == 0:
+        if self.start_time is None or self.current_step == 0:
             return None
         
-        import time
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         steps_per_second = self.current_step / elapsed
         remaining_steps = self.total_steps - self.current_step
         
@@ -537,11 +806,18 @@ def setup_logging(log_file: str = 'auto_montage.log', level: int = logging.INFO)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     
+    # Запись в файл и консоль идет в фоновом потоке; логгеры только кладут записи в очередь
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Настраиваем корневой логгер
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Отключаем лишние логи от библиотек
     logging.getLogger('PIL').setLevel(logging.WARNING)